@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import ENEMY_PLANNER
+from data.classes import CLASSES
+from systems.arena import Arena
+from systems.transcript import Transcript
+
+
+def _report(arena: Arena, summary: dict):
+    st = arena.stats
+    print(f"  {st.fights:>9,} fights  {summary['fights_per_s']:>8,.0f}/s  "
+          f"{summary['turns_per_s']:>9,.0f} turns/s  "
+          f"p50 {summary['p50_ms']:6.2f} ms  p99 {summary['p99_ms']:7.2f} ms  "
+          f"lap {arena.level_modifier}  streak {st.streak}")
+
+
+def main() -> int:
+    """Endless headless arena; doubles as the combat load test."""
+    parser = argparse.ArgumentParser(description="Headless arena: one class against every enemy, laps getting harder.")
+    parser.add_argument("--class", dest="class_key", default="guerrero", choices=sorted(CLASSES))
+    parser.add_argument("--fights", type=int, default=None, help="stop after this many fights (default: run until Ctrl+C)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--every", type=float, default=2.0, help="seconds between progress lines")
+    parser.add_argument("--planner", action=argparse.BooleanOptionalAction, default=ENEMY_PLANNER,
+                        help="let tier-3 enemies and bosses search (default: config.ENEMY_PLANNER)")
+    parser.add_argument("--transcript", metavar="PATH",
+                        help="record combat events and write the most recent ones to PATH on exit "
+                             "(read it with python -m sim.transcript)")
+    args = parser.parse_args()
+
+    transcript = Transcript() if args.transcript else None
+    arena = Arena(args.class_key, seed=args.seed, use_planner=args.planner, transcript=transcript)
+    print(f"  Arena: {CLASSES[args.class_key].name} vs {len(arena.templates)} enemies (Ctrl+C to stop)")
+    start = time.perf_counter()
+    try:
+        arena.run(args.fights, report=_report, report_every=args.every)
+    except KeyboardInterrupt:
+        print()
+
+    st = arena.stats
+    summary = st.summary(time.perf_counter() - start)
+    print(f"  {st.fights:,} fights, {st.wins:,} won, {st.champions} champion(s), "
+          f"best streak {st.best_streak}, best level {st.best_level}")
+    print(f"  {summary['fights_per_s']:,.0f} fights/s  {summary['turns_per_s']:,.0f} turns/s  "
+          f"p50 {summary['p50_ms']:.2f} ms  p99 {summary['p99_ms']:.2f} ms")
+    if transcript is not None:
+        os.makedirs(os.path.dirname(args.transcript) or ".", exist_ok=True)
+        transcript.save(args.transcript)
+        print(f"  {transcript.count:,} transcript records written to {args.transcript}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -45,10 +45,24 @@ def save_prefs(prefs: dict):
 SCREEN_WIDTH = 62
 
 MAX_INVENTORY_SIZE  = 20
-XP_BASE             = 100
 DUNGEON_ROOMS       = 10
 HEAL_COST_PER_HP    = 2
-FLEE_BASE_CHANCE    = 0.45
+
+# Turn order: actors queue by INITIATIVE_BASE + speed (systems/initiative.py)
+INITIATIVE_BASE     = 30
+
+# Search-based AI for tier-3 enemies and bosses (systems/enemy_ai.py)
+ENEMY_PLANNER       = False
+PLANNER_BUDGET_MS   = 15
+PLANNER_MAX_DEPTH   = 8
+# Search nodes per decision instead of a wall-clock budget, so the same
+# fight always gets the same enemy moves (replays, saves, sims). About
+# PLANNER_BUDGET_MS worth of search; None switches to the clock.
+PLANNER_NODE_BUDGET = 2000
+
+# Auto-resolve for regular room fights (systems/combat.py)
+AUTO_BATTLE         = True
+AUTO_POTION_BELOW   = 0.35
 
 MAX_LEVEL   = 20
 STAT_CAP    = 30
@@ -14,6 +14,10 @@ class Ability:
     heal_amount: int = 0
     effect: str = ""
     cooldown: int = 0
+    # Blows per use for a multi-hit effect (0: the effect's own count).
+    hits: int = 0
+    # Share of the target's defense an armor_pierce effect skips.
+    armor_ignored: float = 1.0
 
 
 @dataclass
@@ -202,13 +206,13 @@ _reg(ClassTemplate(
     abilities=[
         Ability("ab_explorador_1_name", "ab_explorador_1_desc",
                 "narr_explorador_1",
-                mp_cost=6, damage_base=5, damage_scale=0.8, stat_used="wis", effect="mark"),
+                mp_cost=6, damage_base=5, damage_scale=0.8, stat_used="wis", effect="slow"),
         Ability("ab_explorador_2_name", "ab_explorador_2_desc",
                 "narr_explorador_2",
                 mp_cost=8, damage_base=12, damage_scale=1.4, stat_used="dex", effect="multi"),
         Ability("ab_explorador_3_name", "ab_explorador_3_desc",
                 "narr_arquero_3",
-                mp_cost=7, effect="analyze"),
+                mp_cost=7, effect="mark"),
     ]
 ))
 
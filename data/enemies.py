@@ -264,16 +264,40 @@ def get_enemies_by_tier(tier: int) -> list:
     """Return all enemy templates of a given tier."""
     return [e for e in ENEMIES.values() if e.tier == tier and not e.is_boss]
 
-def get_random_enemy(tier: int) -> EnemyTemplate:
+def get_random_enemy(tier: int, rng=random) -> EnemyTemplate:
     """Return a random non-boss enemy of the given tier."""
     pool = get_enemies_by_tier(tier)
     if not pool:
         pool = get_enemies_by_tier(1)
-    return random.choice(pool)
+    return rng.choice(pool)
 
-def get_boss(key: str = None) -> EnemyTemplate:
+# Possible pack sizes per tier, drawn uniformly (repeats weight the odds).
+PACK_SIZES = {
+    1: (1, 1, 1, 2),
+    2: (1, 1, 2, 2, 3),
+    3: (1, 1, 1, 2),
+}
+
+def get_random_pack(tier: int, rng=random) -> list[EnemyTemplate]:
+    """Return one or more random non-boss enemies of the given tier."""
+    size = rng.choice(PACK_SIZES.get(tier, (1,)))
+    return [get_random_enemy(tier, rng) for _ in range(size)]
+
+def get_boss(key: str = None, rng=random) -> EnemyTemplate:
     """Return a boss by key, or a random one."""
     bosses = [e for e in ENEMIES.values() if e.is_boss]
     if key and key in ENEMIES:
         return ENEMIES[key]
-    return random.choice(bosses)
+    return rng.choice(bosses)
+
+def tier_for_floor(floor: int) -> int:
+    """Tier of the regular enemies met on a dungeon floor."""
+    return min(3, 1 + (floor - 1) // 3)
+
+def boss_key_for_floor(floor: int) -> str:
+    """Key of the boss guarding a dungeon floor."""
+    if floor >= 9:
+        return "ancient_demon"
+    if floor >= 6:
+        return "lich"
+    return "dragon"
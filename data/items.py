@@ -25,6 +25,12 @@ class Item:
     damage_min: int = 0
     damage_max: int = 0
 
+    @property
+    def stat_bonuses(self) -> tuple[int, ...]:
+        """Core stat bonuses in StatBlock order (str, dex, int, wis, cha, con)."""
+        return (self.str_bonus, self.dex_bonus, self.int_bonus,
+                self.wis_bonus, self.cha_bonus, self.con_bonus)
+
 
 WEAPONS = {
     "iron_sword": Item("iron_sword", "Iron Sword", "weapon",
@@ -0,0 +1,109 @@
+import random
+from dataclasses import dataclass
+from typing import Callable, NamedTuple
+
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    Balance constants behind the combat formulas, levelling and the dungeon
+    rooms. Swap a whole set with
+    use_rules(dataclasses.replace(DEFAULT_RULES, ...)); compile_rules turns
+    it into the closures the engine calls.
+    """
+    # Damage roll: attack + base roll + stat // stat_divisor - defense // defense_divisor
+    stat_divisor: int = 4
+    defense_divisor: int = 2
+    # Crit chance: crit_base + (crit stat - crit_pivot) * crit_per_point, at least crit_floor
+    crit_base: float = 0.05
+    crit_per_point: float = 0.005
+    crit_pivot: int = 10
+    crit_floor: float = 0.03
+    crit_multiplier: float = 1.75
+    variance_low: float = 0.90
+    variance_high: float = 1.10
+    # Flee chance: flee_base * player dex / enemy dex, clamped to [flee_min, flee_max]
+    flee_base: float = 0.45
+    flee_min: float = 0.15
+    flee_max: float = 0.80
+    # Enemy scaling per level modifier: HP, attack and XP grow by enemy_growth, defense by enemy_defense_growth
+    enemy_growth: float = 0.08
+    enemy_defense_growth: float = 0.05
+    # XP to the next level: xp_base * level ** 1.4
+    xp_base: int = 100
+    # Trap rooms hit for trap_damage_min..trap_damage_max per floor
+    trap_damage_min: int = 5
+    trap_damage_max: int = 10
+    # Rest rooms restore these fractions of max HP / MP
+    rest_heal_hp: float = 0.35
+    rest_heal_mp: float = 0.40
+
+
+class CompiledRules(NamedTuple):
+    """A Rules set compiled into closures with its constants bound in."""
+    rules: Rules
+    damage: Callable[..., tuple[int, bool]]
+    crit_chance: Callable[[int], float]
+    flee_chance: Callable[[int, int], float]
+    enemy_scaling: Callable[[int, int, int, int, int], tuple[int, int, int, int]]
+
+
+def compile_rules(rules: Rules) -> CompiledRules:
+    """Build the formula closures for one Rules set."""
+    stat_div = rules.stat_divisor
+    def_div = rules.defense_divisor
+    crit_base = rules.crit_base
+    crit_per_point = rules.crit_per_point
+    crit_pivot = rules.crit_pivot
+    crit_floor = rules.crit_floor
+    crit_mult = rules.crit_multiplier
+    var_lo = rules.variance_low
+    var_span = rules.variance_high - rules.variance_low
+    flee_base = rules.flee_base
+    flee_min = rules.flee_min
+    flee_max = rules.flee_max
+    growth = rules.enemy_growth
+    def_growth = rules.enemy_defense_growth
+
+    def damage(attacker_attack: int, attacker_stat: int, defender_defense: int,
+               damage_min: int, damage_max: int, crit_stat: int, rng=random) -> tuple[int, bool]:
+        """Roll raw damage and whether it was a critical hit. Returns (damage, is_critical)."""
+        base = rng.randint(damage_min, max(damage_min + 1, damage_max))
+        reduced = max(1, attacker_attack + base + attacker_stat // stat_div - defender_defense // def_div)
+        is_crit = rng.random() < max(crit_floor, crit_base + (crit_stat - crit_pivot) * crit_per_point)
+        if is_crit:
+            reduced = int(reduced * crit_mult)
+        # Same arithmetic as rng.uniform(variance_low, variance_high).
+        return max(1, int(reduced * (var_lo + var_span * rng.random()))), is_crit
+
+    def crit_chance(crit_stat: int) -> float:
+        return max(crit_floor, crit_base + (crit_stat - crit_pivot) * crit_per_point)
+
+    def flee_chance(player_dex: int, enemy_dex: int) -> float:
+        return max(flee_min, min(flee_max, flee_base * (player_dex / max(1, enemy_dex))))
+
+    def enemy_scaling(level_modifier: int, hp: int, attack: int, defense: int,
+                      xp_reward: int) -> tuple[int, int, int, int]:
+        """Scaled (HP, attack, defense, XP reward) for a template at a level modifier."""
+        scale = 1.0 + (level_modifier * growth)
+        return (int(hp * scale), int(attack * scale),
+                int(defense * (1 + level_modifier * def_growth)), int(xp_reward * scale))
+
+    return CompiledRules(rules, damage, crit_chance, flee_chance, enemy_scaling)
+
+
+DEFAULT_RULES = Rules()
+
+_active = compile_rules(DEFAULT_RULES)
+
+
+def active_rules() -> CompiledRules:
+    """The compiled rules new fights and enemies pick up."""
+    return _active
+
+
+def use_rules(rules: Rules) -> CompiledRules:
+    """Compile a Rules set and make it the active one (for this process)."""
+    global _active
+    _active = compile_rules(rules)
+    return _active
@@ -0,0 +1,105 @@
+import os
+import struct
+from array import array
+
+
+ODDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "win_odds.bin")
+
+MAGIC = b"AEWO"
+VERSION = 1
+FLOORS = 10
+HP_BUCKETS = 10
+NO_DATA = 255
+SCALE = 254
+
+# magic, version, classes, enemies, floors, HP buckets, source hash, length of the key list
+_HEADER = struct.Struct("<4sHBBBB16sH")
+
+
+def hp_bucket(hp_fraction: float) -> int:
+    """HP bucket for a fraction of max HP: 0 is under 10%, HP_BUCKETS - 1 is 90% and up."""
+    return min(HP_BUCKETS - 1, max(0, int(hp_fraction * HP_BUCKETS)))
+
+
+class WinOddsTable:
+    """
+    Win chance by (class key, enemy key, floor, HP bucket), one byte per cell:
+    0-254 scaled from 0.0-1.0, NO_DATA where that enemy never shows up on
+    that floor. Built offline by sim.gen_win_odds, with enemies on the flat
+    ability roll rather than the planner.
+    """
+
+    def __init__(self, class_keys: list[str], enemy_keys: list[str],
+                 cells: array | None = None, source_hash: bytes = bytes(16)):
+        self.class_keys = list(class_keys)
+        self.enemy_keys = list(enemy_keys)
+        self.source_hash = source_hash
+        size = len(self.class_keys) * len(self.enemy_keys) * FLOORS * HP_BUCKETS
+        self.cells = cells if cells is not None else array("B", [NO_DATA]) * size
+        self._class_index = {k: i for i, k in enumerate(self.class_keys)}
+        self._enemy_index = {k: i for i, k in enumerate(self.enemy_keys)}
+
+    def index(self, class_key: str, enemy_key: str, floor: int, bucket: int) -> int | None:
+        c = self._class_index.get(class_key)
+        e = self._enemy_index.get(enemy_key)
+        if c is None or e is None:
+            return None
+        floor = min(FLOORS, max(1, floor))
+        return ((c * len(self.enemy_keys) + e) * FLOORS + floor - 1) * HP_BUCKETS + bucket
+
+    def set(self, class_key: str, enemy_key: str, floor: int, bucket: int, chance: float):
+        self.cells[self.index(class_key, enemy_key, floor, bucket)] = round(chance * SCALE)
+
+    def get(self, class_key: str, enemy_key: str, floor: int, hp_fraction: float) -> float | None:
+        """Win chance for that matchup, or None if the table has nothing for it."""
+        i = self.index(class_key, enemy_key, floor, hp_bucket(hp_fraction))
+        if i is None or self.cells[i] == NO_DATA:
+            return None
+        return self.cells[i] / SCALE
+
+    def to_bytes(self) -> bytes:
+        keys = "\n".join(self.class_keys + self.enemy_keys).encode("ascii")
+        header = _HEADER.pack(MAGIC, VERSION, len(self.class_keys), len(self.enemy_keys),
+                              FLOORS, HP_BUCKETS, self.source_hash, len(keys))
+        return header + keys + self.cells.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WinOddsTable":
+        magic, version, n_classes, n_enemies, floors, buckets, source_hash, n_keys = \
+            _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or floors != FLOORS or buckets != HP_BUCKETS:
+            raise ValueError("Not a win odds table for this version of the game")
+        start = _HEADER.size
+        keys = data[start:start + n_keys].decode("ascii").split("\n")
+        cells = array("B")
+        cells.frombytes(data[start + n_keys:])
+        if len(keys) != n_classes + n_enemies or len(cells) != n_classes * n_enemies * floors * buckets:
+            raise ValueError("Truncated win odds table")
+        return cls(keys[:n_classes], keys[n_classes:], cells, source_hash)
+
+    def save(self, path: str = ODDS_FILE):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str = ODDS_FILE) -> "WinOddsTable":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+_table: WinOddsTable | None = None
+_loaded = False
+
+
+def win_chance(class_key: str, enemy_key: str, floor: int, hp_fraction: float) -> float | None:
+    """Shipped estimate of the chance to win a fight, or None if unavailable."""
+    global _table, _loaded
+    if not _loaded:
+        _loaded = True
+        try:
+            _table = WinOddsTable.load()
+        except (OSError, ValueError, struct.error):
+            _table = None
+    if _table is None:
+        return None
+    return _table.get(class_key, enemy_key, floor, hp_fraction)
@@ -2,22 +2,31 @@ a = Analysis(
     ['main.py'],
     pathex=['.'],
     binaries=[],
-    datas=[],
+    datas=[('data/win_odds.bin', 'data')],
     hiddenimports=[
         'data.classes',
         'data.enemies',
         'data.items',
+        'data.rules',
+        'data.win_odds',
         'entities.character',
         'entities.player',
         'entities.enemy',
         'systems.combat',
+        'systems.combat_engine',
+        'systems.combat_solver',
+        'systems.enemy_ai',
+        'systems.initiative',
+        'systems.effects',
         'systems.dungeon',
         'systems.inventory',
         'systems.quests',
         'systems.shop',
         'systems.skilltree',
+        'systems.transcript',
         'utils.display',
         'utils.namegen',
+        'utils.rng',
         'utils.save_load',
     ],
     hookspath=[],
@@ -1,22 +1,166 @@
-from dataclasses import dataclass, field
-from typing import Optional
+import operator
+from array import array
+from typing import Iterable, Optional, Sequence
+
+
+# Core stats in StatBlock order.
+STAT_KEYS: tuple[str, ...] = ("str", "dex", "int", "wis", "cha", "con")
+STAT_INDEX: dict[str, int] = {key: i for i, key in enumerate(STAT_KEYS)}
+STR, DEX, INT, WIS, CHA, CON = range(len(STAT_KEYS))
+
+
+STATUS_NAMES: list[str] = [
+    "poison", "burn", "curse", "stun", "mark", "shield",
+    "evade", "rage", "aura", "empower", "analyze",
+    "weaken", "regen", "immortal", "revive", "berserker",
+    "blood_pact", "guaranteed_crit", "double_cast", "counter_trap",
+    "haste", "slow",
+]
+STATUS_IDS: dict[str, int] = {name: i for i, name in enumerate(STATUS_NAMES)}
+MAX_STATUS_SLOTS = 32
+
+# Fraction of max HP lost per tick, indexed by status id (0.0 = no damage).
+_DOT_FRACTION: list[float] = [0.0] * MAX_STATUS_SLOTS
+_DOT_FRACTION[STATUS_IDS["poison"]] = 0.05
+_DOT_FRACTION[STATUS_IDS["burn"]]   = 0.06
+_DOT_FRACTION[STATUS_IDS["curse"]]  = 0.04
+
+
+def status_id(name: str) -> int:
+    """Return the slot id for a status name, registering unknown names on first use."""
+    sid = STATUS_IDS.get(name)
+    if sid is None:
+        if len(STATUS_NAMES) >= MAX_STATUS_SLOTS:
+            raise ValueError(f"Too many distinct status effects (max {MAX_STATUS_SLOTS}): {name}")
+        sid = len(STATUS_NAMES)
+        STATUS_NAMES.append(name)
+        STATUS_IDS[name] = sid
+    return sid
+
+
+def status_bit(name: str) -> int:
+    """Bitmask for a status name."""
+    return 1 << status_id(name)
+
+
+_RAGE    = status_bit("rage")
+_EMPOWER = status_bit("empower")
+_MARK    = status_bit("mark")
+_WEAKEN  = status_bit("weaken")
+_AURA    = status_bit("aura")
+_EVADE   = status_bit("evade")
+_SHIELD  = status_bit("shield")
+_SHIELD_ID = STATUS_IDS["shield"]
+
+_NO_TICKS: tuple = ()
+
+
+class StatusSet:
+    """
+    Compact status container: a bitmask of active effect ids plus
+    fixed-slot duration/value arrays indexed by id.
+    Presence checks, lookups and removal are O(1) and allocation-free.
+    """
+
+    __slots__ = ("mask", "durations", "values", "descriptions")
+
+    def __init__(self):
+        self.mask = 0
+        self.durations = [0] * MAX_STATUS_SLOTS
+        self.values = [0] * MAX_STATUS_SLOTS
+        self.descriptions = [""] * MAX_STATUS_SLOTS
+
+    def ids(self) -> Iterable[int]:
+        """Yield the ids of active effects in slot order."""
+        m = self.mask
+        while m:
+            low = m & -m
+            yield low.bit_length() - 1
+            m ^= low
+
+    def clear(self):
+        self.mask = 0
+
+
+class StatBlock:
+    """
+    The six core stats as one fixed-index array (STAT_KEYS order).
+    Lookups are index reads; bulk modifiers are a single element-wise add.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Sequence[int]):
+        self.values = array("h", values)
+
+    def __getitem__(self, stat: str) -> int:
+        return self.values[STAT_INDEX[stat]]
+
+    def add(self, deltas: Sequence[int], cap: int | None = None):
+        """
+        Add one delta per stat. With a cap, every stat that changes is
+        clamped to it; untouched stats keep their value.
+        """
+        if cap is None:
+            self.values = array("h", map(operator.add, self.values, deltas))
+        else:
+            self.values = array("h", [min(cap, v + d) if d else v
+                                      for v, d in zip(self.values, deltas)])
 
 
-@dataclass
 class StatusEffect:
-    """A temporary status effect on a character."""
-    name: str
-    duration: int
-    value: int = 0
-    description: str = ""
+    """A temporary status effect on a character, viewed through its StatusSet slot."""
+
+    __slots__ = ("_set", "_id")
+
+    def __init__(self, status_set: StatusSet, sid: int):
+        self._set = status_set
+        self._id = sid
+
+    @property
+    def name(self) -> str:
+        return STATUS_NAMES[self._id]
+
+    @property
+    def duration(self) -> int:
+        return self._set.durations[self._id]
+
+    @duration.setter
+    def duration(self, value: int):
+        self._set.durations[self._id] = value
+
+    @property
+    def value(self) -> int:
+        return self._set.values[self._id]
+
+    @value.setter
+    def value(self, value: int):
+        self._set.values[self._id] = value
+
+    @property
+    def description(self) -> str:
+        return self._set.descriptions[self._id]
+
+    def __repr__(self) -> str:
+        return f"StatusEffect({self.name!r}, duration={self.duration}, value={self.value})"
 
 
 class Character:
     """
     Base class for all combatants.
     Holds stats, HP/MP tracking, and status effect management.
+    stat_version is bumped whenever base attack/defense or the set of active
+    statuses changes; effective_attack/effective_defense are cached against it.
     """
 
+    # Combat hook lists, compiled from active statuses by systems.effects.
+    # refresh_hooks assigns fresh lists, so the empty defaults can be shared.
+    hook_mask = 0
+    on_attack = ()
+    on_hit = ()
+    on_turn_start = ()
+    on_low_hp = ()
+
     def __init__(
         self,
         name: str,
@@ -32,23 +176,101 @@ class Character:
         defense: int,
     ):
         self.name = name
+        self._init_combat_state()
 
         self.max_hp = max_hp
         self.max_mp = max_mp
-        self.strength = strength
-        self.dexterity = dexterity
-        self.intelligence = intelligence
-        self.wisdom = wisdom
-        self.charisma = charisma
-        self.constitution = constitution
+        self.stat_block = StatBlock((strength, dexterity, intelligence, wisdom, charisma, constitution))
         self.base_attack = attack_power
         self.base_defense = defense
 
         self.current_hp = max_hp
         self.current_mp = max_mp
 
-        self.status_effects: list[StatusEffect] = []
+    def _init_combat_state(self):
+        """Per-instance bookkeeping: the stat cache versions and the status set."""
+        self.stat_version = 0
+        self._atk_version = -1
+        self._def_version = -1
+        self._atk_cache = 0
+        self._def_cache = 0
+        self.statuses = StatusSet()
+
+    def reset_combat_state(self):
+        """Drop every status and compiled hook and invalidate the stat caches, keeping the status arrays."""
+        self.statuses.clear()
+        self.stat_version += 1
+        # Hook lists are only non-empty while hook_mask is set (see refresh_hooks).
+        if self.hook_mask:
+            self.hook_mask = 0
+            self.on_attack = self.on_hit = self.on_turn_start = self.on_low_hp = ()
+
+
+    @property
+    def base_attack(self) -> int:
+        return self._base_attack
 
+    @base_attack.setter
+    def base_attack(self, value: int):
+        self._base_attack = value
+        self.stat_version += 1
+
+    @property
+    def base_defense(self) -> int:
+        return self._base_defense
+
+    @base_defense.setter
+    def base_defense(self, value: int):
+        self._base_defense = value
+        self.stat_version += 1
+
+    @property
+    def strength(self) -> int:
+        return self.stat_block.values[STR]
+
+    @strength.setter
+    def strength(self, value: int):
+        self.stat_block.values[STR] = value
+
+    @property
+    def dexterity(self) -> int:
+        return self.stat_block.values[DEX]
+
+    @dexterity.setter
+    def dexterity(self, value: int):
+        self.stat_block.values[DEX] = value
+
+    @property
+    def intelligence(self) -> int:
+        return self.stat_block.values[INT]
+
+    @intelligence.setter
+    def intelligence(self, value: int):
+        self.stat_block.values[INT] = value
+
+    @property
+    def wisdom(self) -> int:
+        return self.stat_block.values[WIS]
+
+    @wisdom.setter
+    def wisdom(self, value: int):
+        self.stat_block.values[WIS] = value
+
+    @property
+    def charisma(self) -> int:
+        return self.stat_block.values[CHA]
+
+    @charisma.setter
+    def charisma(self, value: int):
+        self.stat_block.values[CHA] = value
+
+    @property
+    def constitution(self) -> int:
+        return self.stat_block.values[CON]
+
+    @constitution.setter
+    def constitution(self, value: int):
+        self.stat_block.values[CON] = value
 
     @property
     def is_alive(self) -> bool:
@@ -60,17 +282,19 @@ class Character:
 
     def take_damage(self, amount: int) -> int:
         """Apply damage after defense reduction. Returns actual damage taken."""
-        if self.has_status("evade"):
-            self.remove_status("evade")
+        st = self.statuses
+        if st.mask & _EVADE:
+            st.mask ^= _EVADE
+            self.stat_version += 1
             return 0
 
-        if self.has_status("shield"):
-            shield = self.get_status("shield")
-            absorbed = min(shield.value, amount)
+        if st.mask & _SHIELD:
+            absorbed = min(st.values[_SHIELD_ID], amount)
             amount -= absorbed
-            shield.value -= absorbed
-            if shield.value <= 0:
-                self.remove_status("shield")
+            st.values[_SHIELD_ID] -= absorbed
+            if st.values[_SHIELD_ID] <= 0:
+                st.mask ^= _SHIELD
+                self.stat_version += 1
 
         actual = max(1, amount - self.effective_defense)
         self.current_hp = max(0, self.current_hp - actual)
@@ -98,87 +322,229 @@ class Character:
 
     @property
     def effective_attack(self) -> int:
-        """Attack power, accounting for rage or other modifiers."""
-        atk = self.base_attack
-        if self.has_status("rage"):
+        """
+        Attack power, accounting for rage or other modifiers.
+        Cached until stat_version changes.
+        """
+        if self._atk_version == self.stat_version:
+            return self._atk_cache
+        atk = self._base_attack
+        mask = self.statuses.mask
+        if mask & _RAGE:
             atk = int(atk * 1.5)
-        if self.has_status("empower"):
+        if mask & _EMPOWER:
             atk = int(atk * 2.0)
-        if self.has_status("mark"):
+        if mask & _MARK:
             atk = int(atk * 1.3)
+        if mask & _WEAKEN:
+            atk = int(atk * 0.75)
+        self._atk_cache = atk
+        self._atk_version = self.stat_version
         return atk
 
     @property
     def effective_defense(self) -> int:
-        """Defense, lowered by rage, raised by aura."""
-        defense = self.base_defense
-        if self.has_status("rage"):
+        """
+        Defense, lowered by rage, raised by aura.
+        Cached until stat_version changes.
+        """
+        if self._def_version == self.stat_version:
+            return self._def_cache
+        defense = self._base_defense
+        mask = self.statuses.mask
+        if mask & _RAGE:
             defense = int(defense * 0.8)
-        if self.has_status("aura"):
+        if mask & _AURA:
             defense = int(defense * 1.3)
-        return max(0, defense)
+        self._def_cache = max(0, defense)
+        self._def_version = self.stat_version
+        return self._def_cache
 
     def stat_by_name(self, stat: str) -> int:
-        """Return a stat value by string name."""
-        mapping = {
-            "str": self.strength, "dex": self.dexterity,
-            "int": self.intelligence, "wis": self.wisdom,
-            "cha": self.charisma, "con": self.constitution,
-        }
-        return mapping.get(stat, self.strength)
+        """Return a stat value by its short name ("str", "dex", ...); unknown names read strength."""
+        return self.stat_block.values[STAT_INDEX.get(stat, STR)]
+
+    def add_stats(self, deltas: Sequence[int], cap: int | None = None):
+        """Apply one delta per core stat (STAT_KEYS order) in a single pass."""
+        self.stat_block.add(deltas, cap)
+
 
+    @property
+    def status_effects(self) -> list[StatusEffect]:
+        """Active effects as StatusEffect views, in slot order."""
+        st = self.statuses
+        return [StatusEffect(st, sid) for sid in st.ids()]
+
+    @status_effects.setter
+    def status_effects(self, effects: list[StatusEffect]):
+        self.statuses.clear()
+        self.stat_version += 1
+        for e in effects:
+            self.add_status(e.name, e.duration, e.value, e.description)
 
     def add_status(self, name: str, duration: int, value: int = 0, description: str = ""):
         """Add or refresh a status effect."""
-        existing = self.get_status(name)
-        if existing:
-            existing.duration = max(existing.duration, duration)
+        st = self.statuses
+        sid = status_id(name)
+        bit = 1 << sid
+        if st.mask & bit:
+            st.durations[sid] = max(st.durations[sid], duration)
             return
-        self.status_effects.append(StatusEffect(name, duration, value, description))
+        st.mask |= bit
+        self.stat_version += 1
+        st.durations[sid] = duration
+        st.values[sid] = value
+        st.descriptions[sid] = description
 
     def has_status(self, name: str) -> bool:
-        return any(s.name == name for s in self.status_effects)
+        sid = STATUS_IDS.get(name)
+        return sid is not None and bool(self.statuses.mask >> sid & 1)
 
     def get_status(self, name: str) -> Optional[StatusEffect]:
-        return next((s for s in self.status_effects if s.name == name), None)
+        sid = STATUS_IDS.get(name)
+        if sid is None or not self.statuses.mask >> sid & 1:
+            return None
+        return StatusEffect(self.statuses, sid)
+
+    def status_duration(self, name: str) -> int:
+        """Turns left on a status, 0 if it is not active. No StatusEffect view is built."""
+        sid = STATUS_IDS.get(name)
+        if sid is None or not self.statuses.mask >> sid & 1:
+            return 0
+        return self.statuses.durations[sid]
+
+    def status_value(self, name: str) -> int:
+        """Value of a status, 0 if it is not active. No StatusEffect view is built."""
+        sid = STATUS_IDS.get(name)
+        if sid is None or not self.statuses.mask >> sid & 1:
+            return 0
+        return self.statuses.values[sid]
+
+    def set_status_value(self, name: str, value: int):
+        """Overwrite the value of an active status; does nothing if it is not active."""
+        sid = STATUS_IDS.get(name)
+        if sid is not None and self.statuses.mask >> sid & 1:
+            self.statuses.values[sid] = value
 
     def remove_status(self, name: str):
-        self.status_effects = [s for s in self.status_effects if s.name != name]
+        sid = STATUS_IDS.get(name)
+        if sid is not None and self.statuses.mask >> sid & 1:
+            self.statuses.mask ^= 1 << sid
+            self.stat_version += 1
 
     def tick_status_effects(self) -> list[str]:
         """
         Advance all status effects by one turn.
         Returns a list of narrative messages describing what happened.
         """
-        messages = []
-        expired = []
+        return self.describe_status_ticks(self.advance_status_effects())
 
-        for effect in self.status_effects:
-            if effect.name == "poison":
-                dmg = max(1, int(self.max_hp * 0.05))
+    def advance_status_effects(self) -> list[tuple[str, int, bool]]:
+        """
+        Advance all status effects by one turn without producing any text.
+        Returns one (effect name, damage dealt, expired) tuple per effect
+        (a shared empty tuple when nothing is active).
+        """
+        st = self.statuses
+        mask = st.mask
+        if not mask:
+            return _NO_TICKS
+
+        ticks = []
+        durations = st.durations
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            sid = low.bit_length() - 1
+
+            dmg = 0
+            frac = _DOT_FRACTION[sid]
+            if frac:
+                dmg = max(1, int(self.max_hp * frac))
                 self.current_hp = max(0, self.current_hp - dmg)
+
+            durations[sid] -= 1
+            done = durations[sid] <= 0
+            if done:
+                mask ^= low
+            ticks.append((STATUS_NAMES[sid], dmg, done))
+
+        if mask != st.mask:
+            st.mask = mask
+            self.stat_version += 1
+        return ticks
+
+    def describe_status_ticks(self, ticks: list[tuple[str, int, bool]]) -> list[str]:
+        """Turn the output of advance_status_effects into narrative messages."""
+        messages = []
+        for name, dmg, expired in ticks:
+            if name == "poison":
                 messages.append(f"  Poison courses through {self.name}'s veins! -{dmg} HP")
-            elif effect.name == "burn":
-                dmg = max(1, int(self.max_hp * 0.06))
-                self.current_hp = max(0, self.current_hp - dmg)
+            elif name == "burn":
                 messages.append(f"  {self.name} writhes in magical fire! -{dmg} HP")
-            elif effect.name == "curse":
-                dmg = max(1, int(self.max_hp * 0.04))
-                self.current_hp = max(0, self.current_hp - dmg)
+            elif name == "curse":
                 messages.append(f"  The curse gnaws at {self.name}'s soul! -{dmg} HP")
+            if expired:
+                messages.append(f"  [{name.upper()} fades from {self.name}]")
+        return messages
 
-            effect.duration -= 1
-            if effect.duration <= 0:
-                expired.append(effect.name)
-                messages.append(f"  [{effect.name.upper()} fades from {self.name}]")
+    def statuses_to_list(self) -> list[list]:
+        """Active statuses as compact [name, duration, value] triples, for saving."""
+        st = self.statuses
+        return [[STATUS_NAMES[sid], st.durations[sid], st.values[sid]] for sid in st.ids()]
 
-        self.status_effects = [s for s in self.status_effects if s.name not in expired]
-        return messages
+    def load_statuses(self, data: list[list]):
+        """Replace the active statuses with ones saved by statuses_to_list."""
+        self.clear_all_status()
+        for name, duration, value in data:
+            self.add_status(name, duration, value)
 
     def clear_all_status(self):
         """Remove all status effects (used after combat ends)."""
-        self.status_effects.clear()
+        self.statuses.clear()
+        self.stat_version += 1
 
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} '{self.name}' HP:{self.current_hp}/{self.max_hp}>"
+
+
+def take_damage_batch(targets: list[Character], amount: int, hits: list[int]) -> list[int]:
+    """
+    Land hits[i] blows of `amount` raw damage on targets[i] in one pass.
+    Same rules as Character.take_damage, applied over gathered HP, defense and
+    status arrays instead of one method call per blow. Returns damage per target.
+    """
+    hp = [c.current_hp for c in targets]
+    defense = [c.effective_defense for c in targets]
+    per_hit = [max(1, amount - d) for d in defense]
+    dealt = [p * n for p, n in zip(per_hit, hits)]
+
+    guard = _EVADE | _SHIELD
+    for i, c in enumerate(targets):
+        st = c.statuses
+        if not st.mask & guard or not hits[i]:
+            continue
+        # Evade eats the first blow; a shield soaks raw damage until it breaks.
+        n = hits[i]
+        total = 0
+        if st.mask & _EVADE:
+            st.mask ^= _EVADE
+            c.stat_version += 1
+            n -= 1
+        for _ in range(n):
+            raw = amount
+            if st.mask & _SHIELD:
+                absorbed = min(st.values[_SHIELD_ID], raw)
+                raw -= absorbed
+                st.values[_SHIELD_ID] -= absorbed
+                if st.values[_SHIELD_ID] <= 0:
+                    st.mask ^= _SHIELD
+                    c.stat_version += 1
+            total += max(1, raw - defense[i])
+        dealt[i] = total
+
+    for c, h, d in zip(targets, hp, dealt):
+        c.current_hp = h - d if h > d else 0
+    return dealt
@@ -1,48 +1,174 @@
 import random
-from entities.character import Character
-from data.enemies import EnemyTemplate
+from dataclasses import dataclass
+from typing import Sequence
+
+from entities.character import Character, StatBlock
+from data.enemies import EnemyTemplate, ENEMIES
+from data.rules import active_rules
 from data.items import ALL_ITEMS, Item
 
 
+# Feeds the gold roll of enemies rebuilt from a save, which is overwritten right after.
+_RESTORE_RNG = random.Random(0)
+
+# Chance that a tier 1-2 enemy with an ability ready uses one when no planner
+# is searching. The exact solver and the lockstep sim model the same roll.
+ABILITY_ROLL = 0.35
+
+
+@dataclass(frozen=True)
+class EnemyStats:
+    """Scaled stats shared by every enemy of one template at one level modifier."""
+    template: EnemyTemplate
+    level_modifier: int
+    max_hp: int
+    attack: int
+    defense: int
+    xp_reward: int
+    block: StatBlock
+
+
+# Keyed by the growth factors of the active rules too, so swapping rules never
+# reuses stale blocks, and recompiling the same rules does not add new ones.
+_STATS: dict[tuple, EnemyStats] = {}
+
+
+def enemy_stats(template: EnemyTemplate, level_modifier: int = 0) -> EnemyStats:
+    """The cached stat block for (template key, level modifier), built on first use."""
+    compiled = active_rules()
+    rules = compiled.rules
+    key = (template.key, level_modifier, rules.enemy_growth, rules.enemy_defense_growth)
+    stats = _STATS.get(key)
+    if stats is None:
+        hp, attack, defense, xp_reward = compiled.enemy_scaling(
+            level_modifier, template.hp, template.attack, template.defense, template.xp_reward)
+        stats = _STATS[key] = EnemyStats(
+            template=template,
+            level_modifier=level_modifier,
+            max_hp=hp,
+            attack=attack,
+            defense=defense,
+            xp_reward=xp_reward,
+            block=StatBlock((template.str_stat, template.dex_stat, template.int_stat, 8, 6, 10)),
+        )
+    return stats
+
+
 class Enemy(Character):
     """
     A combat instance of an enemy, built from an EnemyTemplate.
     Handles AI turn logic and loot generation.
+    Instances only hold what changes during a fight (HP/MP, statuses,
+    cooldowns, gold roll); stats are read from a shared EnemyStats, so
+    the core stats are read-only and add_stats raises.
     """
 
-    def __init__(self, template: EnemyTemplate, level_modifier: int = 0):
-        self.template = template
-
-        scale = 1.0 + (level_modifier * 0.08)
-        hp   = int(template.hp * scale)
-        atk  = int(template.attack * scale)
-        defn = int(template.defense * (1 + level_modifier * 0.05))
-
-        super().__init__(
-            name=template.name,
-            max_hp=hp, max_mp=template.mp,
-            strength=template.str_stat,
-            dexterity=template.dex_stat,
-            intelligence=template.int_stat,
-            wisdom=8, charisma=6, constitution=10,
-            attack_power=atk,
-            defense=defn,
-        )
-
-        self.xp_reward   = int(template.xp_reward * scale)
-        self.gold_reward = random.randint(template.gold_min, template.gold_max)
-        self.abilities   = template.abilities
-        self.art_key     = template.art_key
-        self.is_boss     = template.is_boss
-        self.is_undead   = template.is_undead
-        self.attack_phrases = template.attack_phrases
+    def __init__(self, template: EnemyTemplate, level_modifier: int = 0, rng=random):
+        stats = enemy_stats(template, level_modifier)
+        self.stats = stats
+        self.name = template.name
+        self._init_combat_state()
 
+        self.current_hp = stats.max_hp
+        self.current_mp = template.mp
+        self.gold_reward = rng.randint(template.gold_min, template.gold_max)
         self.ability_cooldowns: dict[str, int] = {}
 
+    def reset(self, template: EnemyTemplate, level_modifier: int = 0, rng=random):
+        """Turn this instance into a fresh enemy of that template, reusing its containers."""
+        stats = enemy_stats(template, level_modifier)
+        self.stats = stats
+        self.name = template.name
+        self.reset_combat_state()
+
+        self.current_hp = stats.max_hp
+        self.current_mp = template.mp
+        self.gold_reward = rng.randint(template.gold_min, template.gold_max)
+        self.ability_cooldowns.clear()
+
+
+    @property
+    def template(self) -> EnemyTemplate:
+        return self.stats.template
+
+    @property
+    def level_modifier(self) -> int:
+        return self.stats.level_modifier
+
+    @property
+    def max_hp(self) -> int:
+        return self.stats.max_hp
+
+    @property
+    def max_mp(self) -> int:
+        return self.stats.template.mp
+
+    @property
+    def base_attack(self) -> int:
+        return self.stats.attack
+
+    @property
+    def base_defense(self) -> int:
+        return self.stats.defense
+
+    # Character.effective_attack/effective_defense read these directly.
+    _base_attack = base_attack
+    _base_defense = base_defense
+
+    @property
+    def xp_reward(self) -> int:
+        return self.stats.xp_reward
+
+    @property
+    def stat_block(self) -> StatBlock:
+        return self.stats.block
 
-    def choose_action(self) -> dict:
+    # The block is shared with every enemy (and future spawn) of this template
+    # and level, so drop Character's setters: assigning one raises AttributeError.
+    strength = property(Character.strength.fget)
+    dexterity = property(Character.dexterity.fget)
+    intelligence = property(Character.intelligence.fget)
+    wisdom = property(Character.wisdom.fget)
+    charisma = property(Character.charisma.fget)
+    constitution = property(Character.constitution.fget)
+
+    def add_stats(self, deltas: Sequence[int], cap: int | None = None):
+        raise AttributeError(f"{self.name}: enemy stats are shared by its template and cannot be changed")
+
+    @property
+    def speed(self) -> int:
+        return self.stats.template.speed
+
+    @property
+    def abilities(self) -> list:
+        return self.stats.template.abilities
+
+    @property
+    def attack_phrases(self) -> list:
+        return self.stats.template.attack_phrases
+
+    @property
+    def art_key(self) -> str:
+        return self.stats.template.art_key
+
+    @property
+    def is_boss(self) -> bool:
+        return self.stats.template.is_boss
+
+    @property
+    def is_undead(self) -> bool:
+        return self.stats.template.is_undead
+
+
+    @property
+    def ability_cooldown(self) -> int:
+        return 2 if self.template.tier >= 3 else 1
+
+    def choose_action(self, rng=random, planner=None, opponent=None) -> dict:
         """
-        Simple AI: decides between basic attack and ability use.
+        Decides between basic attack and ability use.
+        With a planner (and the opponent to plan against) the choice is searched,
+        otherwise abilities are picked by a flat roll.
         Returns an action dict with type and relevant data.
         """
         if self.has_status("stun"):
@@ -55,15 +181,18 @@ class Enemy(Character):
             and self.current_mp >= ab[3]
         ]
 
-        if available and (random.random() < 0.35 or self.template.tier >= 3):
-            ability = random.choice(available)
+        ability = None
+        if available and planner is not None and opponent is not None:
+            pick = planner.choose(self, opponent)
+            if pick is not None:
+                ability = self.abilities[pick]
+        elif available and (rng.random() < ABILITY_ROLL or self.template.tier >= 3):
+            ability = rng.choice(available)
+
+        if ability is not None:
             name, mult, effect, cost = ability
             self.current_mp = max(0, self.current_mp - cost)
-            if self.template.tier >= 3:
-                cooldown = 2
-            else:
-                cooldown = 1
-            self.ability_cooldowns[name] = cooldown
+            self.ability_cooldowns[name] = self.ability_cooldown
             return {
                 "type": "ability",
                 "ability_name": name,
@@ -71,7 +200,7 @@ class Enemy(Character):
                 "effect": effect,
             }
 
-        phrase = random.choice(self.attack_phrases) if self.attack_phrases else f"{self.name} attacks!"
+        phrase = rng.choice(self.attack_phrases) if self.attack_phrases else f"{self.name} attacks!"
         return {
             "type": "attack",
             "phrase": phrase,
@@ -83,7 +212,7 @@ class Enemy(Character):
             self.ability_cooldowns[key] = max(0, self.ability_cooldowns[key] - 1)
 
 
-    def generate_loot(self) -> list[Item]:
+    def generate_loot(self, rng=random) -> list[Item]:
         """
         Generate item drops from the loot table.
         Bosses always drop; normal enemies have a chance.
@@ -93,13 +222,39 @@ class Enemy(Character):
             if item_key == "gold_coin":
                 continue
             drop_chance = 0.60 if self.is_boss else 0.25
-            if random.random() < drop_chance:
+            if rng.random() < drop_chance:
                 item = ALL_ITEMS.get(item_key)
                 if item:
                     drops.append(item)
         return drops
 
 
+    def to_dict(self) -> dict:
+        """Serialize a mid-fight enemy: template key plus everything that changed since it spawned."""
+        return {
+            "key": self.template.key,
+            "level_modifier": self.level_modifier,
+            "name": self.name,
+            "current_hp": self.current_hp,
+            "current_mp": self.current_mp,
+            "gold_reward": self.gold_reward,
+            "statuses": self.statuses_to_list(),
+            "cooldowns": self.ability_cooldowns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Enemy":
+        """Rebuild an enemy saved with to_dict."""
+        enemy = cls(ENEMIES[data["key"]], data["level_modifier"], rng=_RESTORE_RNG)
+        enemy.name = data["name"]
+        enemy.current_hp = data["current_hp"]
+        enemy.current_mp = data["current_mp"]
+        enemy.gold_reward = data["gold_reward"]
+        enemy.load_statuses(data["statuses"])
+        enemy.ability_cooldowns = dict(data["cooldowns"])
+        return enemy
+
+
     @property
     def display_description(self) -> str:
         return self.template.description
@@ -108,3 +263,31 @@ class Enemy(Character):
     def tier_label(self) -> str:
         labels = {1: "WEAK", 2: "MODERATE", 3: "DANGEROUS", 4: "BOSS"}
         return labels.get(self.template.tier, "???")
+
+
+class EnemyPool:
+    """
+    Free list of Enemy instances for headless batch fights. release() the
+    enemies of a finished fight and acquire() hands them back reset, so a
+    long simulation stops allocating (and collecting) a fresh set per fight.
+    """
+
+    def __init__(self):
+        self._free: list[Enemy] = []
+
+    def acquire(self, template: EnemyTemplate, level_modifier: int = 0, rng=random) -> Enemy:
+        if self._free:
+            enemy = self._free.pop()
+            enemy.reset(template, level_modifier, rng)
+            return enemy
+        return Enemy(template, level_modifier, rng)
+
+    def release(self, enemies: Enemy | list[Enemy]):
+        """Return one enemy or a whole pack. They must not be used again until acquired."""
+        if isinstance(enemies, Enemy):
+            self._free.append(enemies)
+        else:
+            self._free.extend(enemies)
+
+    def __len__(self) -> int:
+        return len(self._free)
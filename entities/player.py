@@ -1,20 +1,22 @@
 from utils.lang import t
 
 import math
-from entities.character import Character
+from entities.character import Character, STAT_KEYS, STAT_INDEX, CON
 from data.classes import ClassTemplate, Ability, CLASSES
 from data.items import Item, get_starting_weapon, get_starting_armor
-from config import MAX_INVENTORY_SIZE, XP_BASE, MAX_LEVEL, STAT_CAP
+from utils.rng import RunRNG
+from config import MAX_INVENTORY_SIZE, MAX_LEVEL, STAT_CAP
+from data.rules import active_rules
 
 
 class Player(Character):
     """
     Represents the player character.
     Extends Character with: class system, leveling, inventory, equipment,
-    gold, cooldown tracking, and JSON serialization.
+    gold, cooldown tracking, per-run RNG streams, and JSON serialization.
     """
 
-    def __init__(self, name: str, class_template: ClassTemplate):
+    def __init__(self, name: str, class_template: ClassTemplate, run_seed: int | None = None):
         self.char_class = class_template
         ct = class_template
 
@@ -34,8 +36,10 @@ class Player(Character):
 
         self.level = 1
         self.xp = 0
-        self.xp_to_next = XP_BASE
+        self.xp_to_next = active_rules().rules.xp_base
         self.gold = 100
+        # Optional record(source, amount) sink for every gold change (sim.economy).
+        self.gold_ledger = None
 
         self.inventory: list[Item] = []
         self.equipped_weapon: Item | None = None
@@ -56,6 +60,8 @@ class Player(Character):
         self.shop_stock: list[str] = []
         self.shop_last_refresh: int = 0
 
+        self.rng = RunRNG(run_seed)
+
         weapon = get_starting_weapon(ct.starting_weapon)
         armor  = get_starting_armor(ct.starting_armor)
         self._equip(weapon)
@@ -68,13 +74,15 @@ class Player(Character):
         """Recompute attack and defense from stats + equipment."""
         ct = self.char_class
 
-        primary = self.stat_by_name(ct.primary_stat)
+        stats = self.stat_block.values
+
+        primary = stats[STAT_INDEX[ct.primary_stat]]
         weapon_bonus = self.equipped_weapon.attack_bonus if self.equipped_weapon else 0
         self.base_attack = 10 + primary + weapon_bonus
 
         armor_bonus = self.equipped_armor.defense_bonus if self.equipped_armor else 0
         ring_def = self.equipped_ring.defense_bonus if self.equipped_ring else 0
-        self.base_defense = (self.constitution // 3) + armor_bonus + ring_def
+        self.base_defense = (stats[CON] // 3) + armor_bonus + ring_def
 
 
     def _equip(self, item: Item):
@@ -121,12 +129,7 @@ class Player(Character):
         if not item or item.slot != "ring":
             return
         sign = 1 if equip else -1
-        self.strength     += sign * item.str_bonus
-        self.dexterity    += sign * item.dex_bonus
-        self.intelligence += sign * item.int_bonus
-        self.wisdom       += sign * item.wis_bonus
-        self.charisma     += sign * item.cha_bonus
-        self.constitution += sign * item.con_bonus
+        self.add_stats([sign * b for b in item.stat_bonuses])
 
     def add_to_inventory(self, item: Item) -> tuple[bool, str]:
         """Add an item to inventory. Returns (success, message)."""
@@ -175,7 +178,7 @@ class Player(Character):
             messages.append(t("combat_level_up", level=self.level))
             messages.append(t("combat_level_stats", hp=self.char_class.hp_per_level, mp=self.char_class.mp_per_level))
             messages.append(t("combat_level_flavor"))
-            self.xp_to_next = int(XP_BASE * (self.level ** 1.4))
+            self.xp_to_next = int(active_rules().rules.xp_base * (self.level ** 1.4))
 
         return messages
 
@@ -190,27 +193,18 @@ class Player(Character):
         self.current_hp = min(self.max_hp, self.current_hp + hp_gain // 2)
         self.current_mp = min(self.max_mp, self.current_mp + mp_gain // 2)
 
-        primary = ct.primary_stat
-        secondary = ct.secondary_stat
-        self._grow_stat(primary, 2)
-        self._grow_stat(secondary, 1)
-        if self.level % 3 == 0:
-            for stat in ("str", "dex", "int", "wis", "cha", "con"):
-                if stat not in (primary, secondary):
-                    self._grow_stat(stat, 1)
+        growth = [1 if self.level % 3 == 0 else 0] * len(STAT_KEYS)
+        growth[STAT_INDEX[ct.primary_stat]] = 2
+        growth[STAT_INDEX[ct.secondary_stat]] = 1
+        self.add_stats(growth, cap=STAT_CAP)
 
         self._recalculate_stats()
 
-    def _grow_stat(self, stat: str, amount: int):
-        attr_map = {
-            "str": "strength", "dex": "dexterity", "int": "intelligence",
-            "wis": "wisdom", "cha": "charisma", "con": "constitution",
-        }
-        attr = attr_map.get(stat)
-        if attr:
-            current = getattr(self, attr)
-            setattr(self, attr, min(STAT_CAP, current + amount))
 
+    @property
+    def speed(self) -> int:
+        """Players have no separate speed stat; dexterity sets their initiative."""
+        return self.dexterity
 
     def get_available_abilities(self) -> list[Ability]:
         """Return abilities not currently on cooldown."""
@@ -220,10 +214,18 @@ class Player(Character):
                 available.append(ability)
         return available
 
+    def can_use_ability(self, ability: Ability) -> tuple[bool, str]:
+        """Check whether an ability is affordable without spending anything."""
+        if self.current_mp < ability.mp_cost:
+            return False, f"Not enough MP! (need {ability.mp_cost}, have {self.current_mp})"
+        return True, ""
+
     def use_ability(self, ability: Ability) -> tuple[bool, str]:
         """Spend MP and set cooldown. Returns (ok, reason)."""
-        if not self.spend_mp(ability.mp_cost):
-            return False, f"Not enough MP! (need {ability.mp_cost}, have {self.current_mp})"
+        ok, reason = self.can_use_ability(ability)
+        if not ok:
+            return False, reason
+        self.spend_mp(ability.mp_cost)
         if ability.cooldown > 0:
             self.cooldowns[ability.name] = ability.cooldown
         return True, ""
@@ -234,13 +236,17 @@ class Player(Character):
             self.cooldowns[key] = max(0, self.cooldowns[key] - 1)
 
 
-    def earn_gold(self, amount: int):
+    def earn_gold(self, amount: int, source: str = "other"):
         self.gold += amount
+        if self.gold_ledger is not None:
+            self.gold_ledger.record(source, amount)
 
-    def spend_gold(self, amount: int) -> bool:
+    def spend_gold(self, amount: int, sink: str = "other") -> bool:
         if self.gold < amount:
             return False
         self.gold -= amount
+        if self.gold_ledger is not None:
+            self.gold_ledger.record(sink, -amount)
         return True
 
 
@@ -273,10 +279,12 @@ class Player(Character):
             "equipped_armor": self.equipped_armor.key if self.equipped_armor else None,
             "equipped_ring": self.equipped_ring.key if self.equipped_ring else None,
             "cooldowns": self.cooldowns,
+            "statuses": self.statuses_to_list(),
             "unlocked_skills": self.unlocked_skills,
             "quest_data": self.quest_manager.to_dict(),
             "shop_stock": self.shop_stock,
             "shop_last_refresh": self.shop_last_refresh,
+            "run_seed": self.rng.run_seed,
         }
 
     @classmethod
@@ -307,13 +315,14 @@ class Player(Character):
         player.xp = data["xp"]
         player.xp_to_next = data["xp_to_next"]
         player.gold = data["gold"]
+        player.gold_ledger = None
         player.current_hp = data["current_hp"]
         player.current_mp = data["current_mp"]
         player.kills = data.get("kills", 0)
         player.floors_cleared = data.get("floors_cleared", 0)
         player.dungeon_floor = data.get("dungeon_floor", 1)
         player.cooldowns = data.get("cooldowns", {})
-        player.status_effects = []
+        player.load_statuses(data.get("statuses", []))
         player.unlocked_skills = data.get("unlocked_skills", [])
 
         from systems.quests import QuestManager
@@ -321,6 +330,7 @@ class Player(Character):
 
         player.shop_stock = data.get("shop_stock", [])
         player.shop_last_refresh = data.get("shop_last_refresh", 0)
+        player.rng = RunRNG(data.get("run_seed"))
 
         from systems.skilltree import ALL_SKILLS, skill_to_ability
         for skill_key in player.unlocked_skills:
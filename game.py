@@ -5,7 +5,7 @@ from config import GAME_TITLE, GAME_VERSION, setup_terminal, clr, Color, load_pr
 from utils.lang import t, set_lang, get_lang, AVAILABLE_LANGUAGES
 from entities.player import Player
 from data.classes import CLASSES, ClassTemplate
-from systems.dungeon import run_dungeon_floor
+from systems.dungeon import run_dungeon_floor, resume_saved_combat
 from systems.inventory import show_inventory
 from systems.shop import show_shop
 from systems.skilltree import show_skill_tree, get_available_to_unlock
@@ -217,39 +217,45 @@ def _load_and_play() -> str:
     player = Player.from_dict(data)
     print_message(t("game_loaded", name=player.name, class_name=player.char_class.name, level=player.level), "good")
     press_enter()
-    return _play_game(player)
+    return _play_game(player, combat=data.get("combat"))
 
 
-def _play_game(player: Player) -> str:
+def _play_game(player: Player, combat: dict | None = None) -> str:
     """
     Main game loop: navigate dungeon floors until victory, defeat, or quit.
+    A fight saved mid-combat is finished first.
     """
     while True:
-        action = _camp_menu(player)
+        if combat is not None:
+            result = resume_saved_combat(player, combat)
+            combat = None
+        else:
+            action = _camp_menu(player)
 
-        if action == "quit":
-            save_game(player.to_dict())
-            print_message(t("saved_quit"), "system")
-            press_enter()
-            return "quit"
+            if action == "quit":
+                save_game(player.to_dict())
+                print_message(t("saved_quit"), "system")
+                press_enter()
+                return "quit"
 
-        if action == "enter_dungeon":
+            if action != "enter_dungeon":
+                continue
             result = run_dungeon_floor(player)
 
-            if result == "game_over":
-                _game_over_screen(player)
-                delete_save()
-                return "menu"
+        if result == "game_over":
+            _game_over_screen(player)
+            delete_save()
+            return "menu"
 
-            elif result == "next_floor":
-                player.heal(int(player.max_hp * 0.25))
-                player.restore_mp(int(player.max_mp * 0.25))
-                save_game(player.to_dict())
+        elif result == "next_floor":
+            player.heal(int(player.max_hp * 0.25))
+            player.restore_mp(int(player.max_mp * 0.25))
+            save_game(player.to_dict())
 
-                if player.dungeon_floor > 10:
-                    _victory_screen(player)
-                    delete_save()
-                    return "menu"
+            if player.dungeon_floor > 10:
+                _victory_screen(player)
+                delete_save()
+                return "menu"
 
 
 def _camp_menu(player: Player) -> str:
@@ -0,0 +1,73 @@
+import random
+import sys
+import time
+
+import numpy as np
+
+from systems.combat_engine import calculate_damage
+from sim.damage import calculate_damage_batch
+
+
+SAMPLES = 200_000
+
+# (attack, stat, defense, damage_min, damage_max, crit_stat)
+CASES = [
+    (32, 14, 7, 5, 12, 8),
+    (30, 16, 18, 3, 8, 8),
+    (19, 17, 12, 6, 9, 13),
+    (5, 3, 40, 1, 2, 2),
+]
+
+
+def _scalar(case, n: int, rng: random.Random) -> tuple[np.ndarray, np.ndarray]:
+    attack, stat, defense, lo, hi, crit = case
+    dmg = np.empty(n, dtype=np.int64)
+    crits = np.empty(n, dtype=bool)
+    for i in range(n):
+        dmg[i], crits[i] = calculate_damage(attack, stat, defense, lo, hi, crit, rng)
+    return dmg, crits
+
+
+def _chi_square(a: np.ndarray, b: np.ndarray) -> tuple[float, int]:
+    """Two-sample chi-square statistic over the shared damage support."""
+    lo = min(a.min(), b.min())
+    ca = np.bincount(a - lo)
+    cb = np.bincount(b - lo, minlength=len(ca))
+    ca = np.pad(ca, (0, len(cb) - len(ca)))
+    keep = (ca + cb) >= 10
+    ca, cb = ca[keep], cb[keep]
+    stat = float((((ca - cb) ** 2) / (ca + cb)).sum())
+    return stat, int(keep.sum()) - 1
+
+
+def main() -> int:
+    """Check the batch kernel against the scalar path and time both."""
+    rng = random.Random(7)
+    gen = np.random.default_rng(7)
+    failed = False
+
+    print(f"  {'case':<28} {'scalar/s':>12} {'batch/s':>14} {'chi2/dof':>10}  crit%")
+    for case in CASES:
+        t0 = time.perf_counter()
+        s_dmg, s_crit = _scalar(case, SAMPLES, rng)
+        t_scalar = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        b_dmg, b_crit = calculate_damage_batch(*[np.full(SAMPLES, v) for v in case], rng=gen)
+        t_batch = time.perf_counter() - t0
+
+        chi2, dof = _chi_square(s_dmg, b_dmg)
+        ratio = chi2 / max(1, dof)
+        # With 20-40 degrees of freedom a ratio of 2 is already around p < 0.005.
+        ok = ratio < 2.0 and abs(s_crit.mean() - b_crit.mean()) < 0.01
+        failed |= not ok
+
+        print(f"  {str(case):<28} {SAMPLES / t_scalar:>12,.0f} {SAMPLES / t_batch:>14,.0f} "
+              f"{ratio:>10.2f}  {100 * s_crit.mean():.2f}/{100 * b_crit.mean():.2f}"
+              f"{'' if ok else '  MISMATCH'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
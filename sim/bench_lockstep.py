@@ -0,0 +1,97 @@
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from data.classes import CLASSES
+from data.enemies import ENEMIES
+from data.items import POTIONS
+from entities.enemy import Enemy, EnemyPool
+from entities.player import Player
+from systems.combat_engine import CombatEngine, basic_attack_policy, auto_battle_policy
+from sim.lockstep import simulate_lockstep, VICTORY
+
+
+LOOP_FIGHTS = 5_000
+LOCKSTEP_FIGHTS = 200_000
+SEED = 5
+
+# (class, player level, enemy, level modifier, policy)
+CASES = [
+    ("mago",      2, "orc",           1, "basic"),
+    ("mago",      3, "orc",           3, "basic"),
+    ("hechicero", 3, "zombie_knight", 3, "basic"),
+    ("brujo",     4, "dark_elf",      4, "basic"),
+    ("paladin",   4, "vampire",       3, "basic"),
+    ("mago",      5, "demon",         4, "auto"),
+    ("barbaro",   6, "dragon",        6, "auto"),
+]
+
+POLICIES = {"basic": basic_attack_policy, "auto": auto_battle_policy}
+
+
+def _player(class_key: str, level: int, policy: str) -> Player:
+    p = Player("Bench", CLASSES[class_key], run_seed=SEED)
+    while p.level < level:
+        p.gain_xp(p.xp_to_next)
+    p.xp_to_next = 10 ** 9
+    p.current_hp, p.current_mp = p.max_hp, p.max_mp
+    if policy == "auto":
+        p.inventory[:] = [POTIONS["health_potion"]] * 3
+    return p
+
+
+def _loop(player: Player, enemy_key: str, level_mod: int, policy: str) -> tuple[float, float, float]:
+    """LOOP_FIGHTS engine fights one after another. Returns (win rate, mean turns, fights/s)."""
+    rng = random.Random(SEED)
+    pool = EnemyPool()
+    inventory = list(player.inventory)
+    wins = turns = 0
+    t0 = time.perf_counter()
+    for _ in range(LOOP_FIGHTS):
+        player.current_hp, player.current_mp = player.max_hp, player.max_mp
+        player.reset_combat_state()
+        player.cooldowns.clear()
+        player.inventory[:] = inventory
+        enemy = pool.acquire(ENEMIES[enemy_key], level_mod, rng)
+        result = CombatEngine(player, enemy, policy=POLICIES[policy], rng=rng, use_planner=False).run()
+        pool.release(enemy)
+        wins += result.outcome == "victory"
+        turns += result.turns
+    elapsed = time.perf_counter() - t0
+    player.current_hp, player.current_mp = player.max_hp, player.max_mp
+    player.inventory[:] = inventory
+    return wins / LOOP_FIGHTS, turns / LOOP_FIGHTS, LOOP_FIGHTS / elapsed
+
+
+def main() -> int:
+    """Lockstep NumPy fights against the per-fight engine loop: same odds, far more fights per second."""
+    failed = False
+    print(f"  {LOOP_FIGHTS:,} engine fights vs {LOCKSTEP_FIGHTS:,} lockstep fights per case, no planner")
+    print(f"  {'matchup':<42} {'win loop':>9} {'lockstep':>9} {'turns':>6} {'lockstep':>9}"
+          f" {'loop/s':>9} {'lockstep/s':>11} {'speedup':>8}  match")
+    for class_key, level, enemy_key, level_mod, policy in CASES:
+        player = _player(class_key, level, policy)
+        win, turns, loop_rate = _loop(player, enemy_key, level_mod, policy)
+
+        enemy = Enemy(ENEMIES[enemy_key], level_mod, random.Random(SEED))
+        t0 = time.perf_counter()
+        res = simulate_lockstep(player, enemy, LOCKSTEP_FIGHTS, policy, rng=np.random.default_rng(SEED))
+        lock_rate = LOCKSTEP_FIGHTS / (time.perf_counter() - t0)
+        lock_win = float(np.mean(res.outcome == VICTORY))
+        lock_turns = float(res.turns.mean())
+
+        # Different RNGs, so agreement is statistical: four standard errors of the loop's estimate.
+        tolerance = 4 * math.sqrt(max(win * (1 - win), 0.01) / LOOP_FIGHTS)
+        ok = abs(lock_win - win) <= tolerance and abs(lock_turns - turns) <= 0.05 * turns + 0.05
+        failed |= not ok
+        label = f"{class_key} L{level} vs {enemy_key}+{level_mod} ({policy})"
+        print(f"  {label:<42} {100 * win:>8.1f}% {100 * lock_win:>8.1f}% {turns:>6.2f} {lock_turns:>9.2f}"
+              f" {loop_rate:>9,.0f} {lock_rate:>11,.0f} {lock_rate / loop_rate:>7.0f}x  {'yes' if ok else 'NO'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
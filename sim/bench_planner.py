@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+
+from config import PLANNER_NODE_BUDGET
+from data.classes import CLASSES
+from data.enemies import ENEMIES
+from entities.enemy import Enemy
+from entities.player import Player
+from systems.combat_engine import CombatEngine
+from systems.enemy_ai import ExpectimaxPlanner
+
+
+FIGHTS = 20
+PLAYER_LEVEL = {3: 7, 4: 12}
+LEVEL_MODIFIER = {3: 6, 4: 8}
+
+
+def _player(class_key: str, level: int, seed: int) -> Player:
+    p = Player("Bench", CLASSES[class_key], run_seed=seed)
+    while p.level < level:
+        p.gain_xp(p.xp_to_next)
+    p.current_hp, p.current_mp = p.max_hp, p.max_mp
+    return p
+
+
+def _run(use_planner: bool, node_budget: int | None = None) -> dict:
+    stats = {"fights": 0, "defeats": 0, "hp_lost": 0.0, "decisions": 0,
+             "nodes": 0, "lookups": 0, "hits": 0, "think": [], "depth": 0}
+    seed = 0
+    for template in ENEMIES.values():
+        if template.tier < 3:
+            continue
+        for class_key in CLASSES:
+            for _ in range(FIGHTS):
+                seed += 1
+                rng = random.Random(seed)
+                player = _player(class_key, PLAYER_LEVEL[template.tier], seed)
+                enemy = Enemy(template, LEVEL_MODIFIER[template.tier], rng)
+                engine = CombatEngine(player, enemy, rng=rng, use_planner=use_planner)
+
+                planner = engine.planners.get("enemy")
+                if planner is not None and node_budget is None:
+                    planner = engine.planners["enemy"] = ExpectimaxPlanner(node_budget=None)
+                if planner is not None:
+                    choose = planner.choose
+
+                    def timed(e, p, choose=choose, planner=planner):
+                        t0 = time.perf_counter()
+                        pick = choose(e, p)
+                        stats["think"].append(time.perf_counter() - t0)
+                        stats["depth"] += planner.last_depth
+                        return pick
+                    planner.choose = timed
+
+                result = engine.run()
+                stats["fights"] += 1
+                stats["defeats"] += result.outcome == "defeat"
+                stats["hp_lost"] += 1 - player.current_hp / player.max_hp
+                if planner is not None:
+                    stats["nodes"] += planner.nodes
+                    stats["lookups"] += planner.lookups
+                    stats["hits"] += planner.hits
+    return stats
+
+
+def main() -> int:
+    """Planner cost per decision and its effect on fight outcomes versus the flat roll."""
+    # "planner" stops on PLANNER_NODE_BUDGET nodes, as in the game; "clock" on PLANNER_BUDGET_MS.
+    for label, use_planner, node_budget in (("roll", False, None), ("planner", True, PLANNER_NODE_BUDGET),
+                                            ("clock", True, None)):
+        s = _run(use_planner, node_budget)
+        line = (f"  {label:<8} {s['fights']:5d} fights  player deaths {s['defeats'] / s['fights']:6.1%}"
+                f"  hp lost {s['hp_lost'] / s['fights']:6.1%}")
+        print(line)
+        if use_planner:
+            think = sorted(s["think"])
+            total = sum(think)
+            n = len(think)
+            print(f"           {n} decisions  mean {1000 * total / n:.2f} ms"
+                  f"  p99 {1000 * think[int(n * 0.99)]:.2f} ms  max {1000 * think[-1]:.2f} ms"
+                  f"  mean depth {s['depth'] / n:.1f}")
+            print(f"           {s['nodes'] / total:,.0f} nodes/s"
+                  f"  table hit rate {s['hits'] / max(1, s['lookups']):.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from data.classes import CLASSES
+from data.enemies import get_enemies_by_tier
+from entities.enemy import Enemy, EnemyPool
+from entities.player import Player
+from systems.combat_engine import CombatEngine
+
+
+FIGHTS = 20_000
+TRACED_FIGHTS = 2_000
+SEED = 11
+
+
+def _player() -> Player:
+    p = Player("Bench", CLASSES["guerrero"], run_seed=SEED)
+    for _ in range(4):
+        p.gain_xp(p.xp_to_next)
+    # Stay at the same level for the whole batch so every fight is comparable.
+    p.xp_to_next = 10 ** 9
+    return p
+
+
+def _fights(pooled: bool, count: int, trace: bool = False):
+    """
+    Run `count` headless pack fights, with fresh enemies or pooled ones.
+    Returns (outcome signatures, seconds, mean transient bytes per fight).
+    """
+    rng = random.Random(SEED)
+    templates = get_enemies_by_tier(1) + get_enemies_by_tier(2)
+    player = _player()
+    pool = EnemyPool()
+    outcomes = []
+    peak_total = 0
+
+    t0 = time.perf_counter()
+    for _ in range(count):
+        player.current_hp, player.current_mp = player.max_hp, player.max_mp
+        player.reset_combat_state()
+        player.cooldowns.clear()
+        if trace:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        size = rng.randint(1, 3)
+        level_mod = rng.randint(0, 3)
+        picks = [rng.choice(templates) for _ in range(size)]
+        if pooled:
+            pack = [pool.acquire(t, level_mod, rng) for t in picks]
+        else:
+            pack = [Enemy(t, level_mod, rng) for t in picks]
+        result = CombatEngine(player, pack, rng=rng, use_planner=False).run()
+        outcomes.append((result.outcome, result.turns, player.current_hp))
+        if pooled:
+            pool.release(pack)
+        del pack, result
+
+        if trace:
+            peak_total += tracemalloc.get_traced_memory()[1] - before
+    elapsed = time.perf_counter() - t0
+    return outcomes, elapsed, peak_total / max(1, count)
+
+
+def _collections(pooled: bool) -> tuple[list[int], float]:
+    """GC collections per generation over FIGHTS fights, and the fight rate."""
+    counts = [0, 0, 0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            counts[info["generation"]] += 1
+
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    try:
+        _, elapsed, _ = _fights(pooled, FIGHTS)
+    finally:
+        gc.callbacks.remove(on_gc)
+    return counts, FIGHTS / elapsed
+
+
+def main() -> int:
+    """Compare fresh and pooled enemies: same fights, transient memory and GC work per fight."""
+    fresh, _, _ = _fights(False, TRACED_FIGHTS)
+    pooled, _, _ = _fights(True, TRACED_FIGHTS)
+    if fresh != pooled:
+        print("  MISMATCH: pooled enemies changed the fights")
+        return 1
+
+    print(f"  {TRACED_FIGHTS:,} traced fights, {FIGHTS:,} timed fights, packs of 1-3")
+    print(f"  {'mode':<8} {'peak KiB/fight':>15} {'fights/s':>10} {'gen0/1k':>8} {'gen1/1k':>8} {'gen2/1k':>8}")
+    for label, pooled in (("fresh", False), ("pooled", True)):
+        tracemalloc.start()
+        _, _, peak = _fights(pooled, TRACED_FIGHTS, trace=True)
+        tracemalloc.stop()
+        counts, rate = _collections(pooled)
+        per_k = [1000 * c / FIGHTS for c in counts]
+        print(f"  {label:<8} {peak / 1024:>15.1f} {rate:>10,.0f} "
+              f"{per_k[0]:>8.1f} {per_k[1]:>8.2f} {per_k[2]:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
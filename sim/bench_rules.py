@@ -0,0 +1,88 @@
+import random
+import sys
+import time
+from dataclasses import replace
+
+from data.rules import DEFAULT_RULES, compile_rules
+
+
+SAMPLES = 300_000
+
+# (attack, stat, defense, damage_min, damage_max, crit_stat)
+CASES = [
+    (32, 14, 7, 5, 12, 8),
+    (30, 16, 18, 3, 8, 8),
+    (19, 17, 12, 6, 9, 13),
+    (5, 3, 40, 1, 2, 2),
+]
+
+
+def _inline_damage(attacker_attack, attacker_stat, defender_defense,
+                   damage_min, damage_max, crit_stat, rng=random):
+    """calculate_damage as it was written before the rules table, kept for comparison."""
+    base = rng.randint(damage_min, max(damage_min + 1, damage_max))
+    stat_bonus = attacker_stat // 4
+    raw = attacker_attack + base + stat_bonus
+
+    reduced = max(1, raw - defender_defense // 2)
+
+    crit_chance = 0.05 + (crit_stat - 10) * 0.005
+    is_crit = rng.random() < max(0.03, crit_chance)
+    if is_crit:
+        reduced = int(reduced * 1.75)
+
+    variance = rng.uniform(0.90, 1.10)
+    final = max(1, int(reduced * variance))
+
+    return final, is_crit
+
+
+def _inline_flee(player_dex: int, enemy_dex: int) -> float:
+    speed_ratio = player_dex / max(1, enemy_dex)
+    return max(0.15, min(0.80, 0.45 * speed_ratio))
+
+
+def _inline_scaling(level_modifier, hp, attack, defense, xp_reward):
+    scale = 1.0 + (level_modifier * 0.08)
+    return (int(hp * scale), int(attack * scale),
+            int(defense * (1 + level_modifier * 0.05)), int(xp_reward * scale))
+
+
+def _time_damage(fn, case, seed: int) -> tuple[float, list]:
+    rng = random.Random(seed)
+    out = [None] * SAMPLES
+    t0 = time.perf_counter()
+    for i in range(SAMPLES):
+        out[i] = fn(*case, rng)
+    return time.perf_counter() - t0, out
+
+
+def main() -> int:
+    """Check the compiled default rules against the old inline formulas and time both."""
+    compiled = compile_rules(DEFAULT_RULES)
+    # Same shape, different numbers: a swapped rule set must cost the same.
+    swapped = compile_rules(replace(DEFAULT_RULES, crit_multiplier=2.0, stat_divisor=3))
+    failed = False
+
+    print(f"  {'case':<28} {'inline ns':>10} {'compiled':>10} {'swapped':>10}  match")
+    for seed, case in enumerate(CASES):
+        t_inline, ref = _time_damage(_inline_damage, case, seed)
+        t_compiled, got = _time_damage(compiled.damage, case, seed)
+        t_swapped, _ = _time_damage(swapped.damage, case, seed)
+        ok = got == ref
+        failed |= not ok
+        print(f"  {str(case):<28} {1e9 * t_inline / SAMPLES:>10.0f} {1e9 * t_compiled / SAMPLES:>10.0f}"
+              f" {1e9 * t_swapped / SAMPLES:>10.0f}  {'yes' if ok else 'MISMATCH'}")
+
+    flee_ok = all(compiled.flee_chance(p, e) == _inline_flee(p, e)
+                  for p in range(0, 40) for e in range(0, 40))
+    scale_ok = all(compiled.enemy_scaling(lv, hp, 17, 9, 55) == _inline_scaling(lv, hp, 17, 9, 55)
+                   for lv in range(0, 12) for hp in range(1, 400, 7))
+    failed |= not (flee_ok and scale_ok)
+    print(f"  flee chance  {'match' if flee_ok else 'MISMATCH'}")
+    print(f"  enemy scale  {'match' if scale_ok else 'MISMATCH'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
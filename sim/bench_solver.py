@@ -0,0 +1,69 @@
+import math
+import random
+import sys
+import time
+
+from data.classes import CLASSES
+from data.enemies import ENEMIES
+from entities.enemy import Enemy
+from entities.player import Player
+from systems.combat_engine import CombatEngine
+from systems.combat_solver import solve_matchup
+
+
+FIGHTS = 5000
+# (class, player level, enemy, floor, flee below this HP fraction)
+MATCHUPS = [
+    ("guerrero", 1, "goblin", 1, 0.0),
+    ("mago", 1, "orc", 3, 0.5),
+    ("picaro", 1, "witch", 4, 0.4),
+    ("guerrero", 7, "vampire", 6, 0.0),
+    ("guerrero", 7, "stone_golem", 6, 0.0),
+    ("paladin", 10, "dragon", 9, 0.3),
+]
+
+
+def _player(class_key: str, level: int) -> Player:
+    p = Player("Bench", CLASSES[class_key], run_seed=1)
+    while p.level < level:
+        p.gain_xp(p.xp_to_next)
+    p.current_hp, p.current_mp = p.max_hp, p.max_mp
+    # Keep the post-fight level-up heal out of the HP numbers.
+    p.xp_to_next = 10 ** 9
+    return p
+
+
+def _monte_carlo(class_key, level, enemy_key, floor, flee_below) -> tuple[float, float]:
+    def policy(player, enemy):
+        if player.current_hp < int(player.max_hp * flee_below):
+            return {"type": "flee"}
+        return {"type": "attack"}
+
+    wins = 0
+    for seed in range(FIGHTS):
+        rng = random.Random(seed)
+        enemy = Enemy(ENEMIES[enemy_key], floor - 1, rng)
+        engine = CombatEngine(_player(class_key, level), enemy, policy=policy, rng=rng,
+                              use_planner=False)
+        wins += engine.run().outcome == "victory"
+    return wins / FIGHTS, 1.96 * math.sqrt(max(wins, 1) * (FIGHTS - wins) / FIGHTS) / FIGHTS
+
+
+def main() -> int:
+    """Exact solver against Monte Carlo on the same matchups: answers and time taken."""
+    for class_key, level, enemy_key, floor, flee_below in MATCHUPS:
+        t0 = time.perf_counter()
+        odds = solve_matchup(_player(class_key, level), ENEMIES[enemy_key], floor, flee_below)
+        exact_ms = 1000 * (time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        win, ci = _monte_carlo(class_key, level, enemy_key, floor, flee_below)
+        mc_ms = 1000 * (time.perf_counter() - t0)
+        print(f"  {class_key:<9} L{level:<2} vs {enemy_key:<12} F{floor}"
+              f"  exact win {odds.victory:6.1%} lose {odds.defeat:6.1%} flee {odds.fled:6.1%}"
+              f" hp {odds.expected_hp:5.1f}  {exact_ms:7.1f} ms"
+              f"  | MC win {win:6.1%} ±{ci:.1%}  {mc_ms:7.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import sys
+import time
+from dataclasses import dataclass
+
+from entities.character import Character
+
+
+TURNS = 200_000
+EFFECTS = [("poison", 5), ("burn", 2), ("mark", 0), ("aura", 0), ("shield", 10 ** 9)]
+LONG = 10 ** 9
+
+
+@dataclass
+class _ListStatus:
+    name: str
+    duration: int
+    value: int = 0
+    description: str = ""
+
+
+class _ListCharacter(Character):
+    """The previous list-of-dataclasses status implementation, kept for comparison."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._effects: list[_ListStatus] = []
+
+    @property
+    def effective_attack(self) -> int:
+        atk = self.base_attack
+        if self.has_status("rage"):
+            atk = int(atk * 1.5)
+        if self.has_status("empower"):
+            atk = int(atk * 2.0)
+        if self.has_status("mark"):
+            atk = int(atk * 1.3)
+        return atk
+
+    @property
+    def effective_defense(self) -> int:
+        defense = self.base_defense
+        if self.has_status("rage"):
+            defense = int(defense * 0.8)
+        if self.has_status("aura"):
+            defense = int(defense * 1.3)
+        return max(0, defense)
+
+    def take_damage(self, amount: int) -> int:
+        if self.has_status("evade"):
+            self.remove_status("evade")
+            return 0
+        if self.has_status("shield"):
+            shield = self.get_status("shield")
+            absorbed = min(shield.value, amount)
+            amount -= absorbed
+            shield.value -= absorbed
+            if shield.value <= 0:
+                self.remove_status("shield")
+        actual = max(1, amount - self.effective_defense)
+        self.current_hp = max(0, self.current_hp - actual)
+        return actual
+
+    def add_status(self, name, duration, value=0, description=""):
+        existing = self.get_status(name)
+        if existing:
+            existing.duration = max(existing.duration, duration)
+            return
+        self._effects.append(_ListStatus(name, duration, value, description))
+
+    def has_status(self, name):
+        return any(s.name == name for s in self._effects)
+
+    def get_status(self, name):
+        return next((s for s in self._effects if s.name == name), None)
+
+    def remove_status(self, name):
+        self._effects = [s for s in self._effects if s.name != name]
+
+    def advance_status_effects(self):
+        ticks = []
+        expired = []
+        for effect in self._effects:
+            dmg = 0
+            if effect.name == "poison":
+                dmg = max(1, int(self.max_hp * 0.05))
+            elif effect.name == "burn":
+                dmg = max(1, int(self.max_hp * 0.06))
+            elif effect.name == "curse":
+                dmg = max(1, int(self.max_hp * 0.04))
+            if dmg:
+                self.current_hp = max(0, self.current_hp - dmg)
+            effect.duration -= 1
+            done = effect.duration <= 0
+            if done:
+                expired.append(effect.name)
+            ticks.append((effect.name, dmg, done))
+        self._effects = [s for s in self._effects if s.name not in expired]
+        return ticks
+
+
+def _make(cls) -> Character:
+    c = cls("Bench", 10 ** 12, 50, 12, 12, 12, 12, 12, 12, 30, 10)
+    for name, value in EFFECTS:
+        c.add_status(name, LONG, value)
+    return c
+
+
+def _turn_loop(c: Character, turns: int) -> float:
+    """One combat turn's worth of status traffic, as run_combat generates it."""
+    t0 = time.perf_counter()
+    for _ in range(turns):
+        c.advance_status_effects()
+        c.has_status("stun")
+        _ = c.effective_attack
+        _ = c.effective_defense
+        _ = c.effective_attack
+        _ = c.effective_defense
+        c.take_damage(20)
+        c.take_damage(20)
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    """Compare per-turn status cost of the list and bitmask containers."""
+    print(f"  {len(EFFECTS)} active effects, {TURNS:,} turns")
+    results = {}
+    for label, cls in (("list", _ListCharacter), ("bitmask", Character)):
+        elapsed = _turn_loop(_make(cls), TURNS)
+        results[label] = elapsed
+        print(f"  {label:<8} {1e9 * elapsed / TURNS:8.0f} ns/turn")
+    print(f"  speedup  {results['list'] / results['bitmask']:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
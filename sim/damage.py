@@ -0,0 +1,49 @@
+import numpy as np
+
+from data.rules import Rules, active_rules
+
+
+def calculate_damage_batch(
+    attacker_attack,
+    attacker_stat,
+    defender_defense,
+    damage_min,
+    damage_max,
+    crit_stat,
+    rng: np.random.Generator | None = None,
+    rules: Rules | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized twin of systems.combat_engine.calculate_damage.
+    Every argument may be a scalar or an array; they are broadcast together
+    and K attacks are rolled in one call with three RNG draws in total.
+    Uses the active rules unless a Rules set is given.
+    Returns (damage, is_critical) arrays.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    r = rules or active_rules().rules
+
+    attack, stat, defense, lo, hi, crit = np.broadcast_arrays(
+        np.asarray(attacker_attack, dtype=np.int64),
+        np.asarray(attacker_stat, dtype=np.int64),
+        np.asarray(defender_defense, dtype=np.int64),
+        np.asarray(damage_min, dtype=np.int64),
+        np.asarray(damage_max, dtype=np.int64),
+        np.asarray(crit_stat, dtype=np.int64),
+    )
+    shape = attack.shape
+
+    base = rng.integers(lo, np.maximum(lo + 1, hi), endpoint=True, size=shape)
+    raw = attack + base + stat // r.stat_divisor
+
+    reduced = np.maximum(1, raw - defense // r.defense_divisor)
+
+    crit_chance = np.maximum(r.crit_floor, r.crit_base + (crit - r.crit_pivot) * r.crit_per_point)
+    is_crit = rng.random(shape) < crit_chance
+    reduced = np.where(is_crit, (reduced * r.crit_multiplier).astype(np.int64), reduced)
+
+    variance = rng.uniform(r.variance_low, r.variance_high, size=shape)
+    final = np.maximum(1, (reduced * variance).astype(np.int64))
+
+    return final, is_crit
@@ -0,0 +1,197 @@
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from data.classes import CLASSES
+from data.items import ALL_ITEMS
+from data.rules import active_rules
+from systems.shop import generate_shop_stock, buy_price
+from sim.full_run import LAST_FLOOR, POLICIES, make_tasks, play_run, _init_worker
+
+
+PRICE_SAMPLES = 500
+
+# Ledger names passed to Player.earn_gold / spend_gold.
+INCOME = ("combat", "treasure", "cursed_chest", "quest", "steal", "merchant_sell", "shop_sell")
+SPENDING = ("shop_buy", "merchant_buy")
+FLOWS = INCOME + SPENDING + ("other",)
+_FLOW_INDEX = {name: i for i, name in enumerate(FLOWS)}
+
+
+def price_index(floor: int) -> float:
+    """Mean camp shop price of the weapons and armour on offer at a floor, over PRICE_SAMPLES stocks."""
+    total = count = 0
+    for i in range(PRICE_SAMPLES):
+        for key in generate_shop_stock(floor, random.Random(i)):
+            item = ALL_ITEMS[key]
+            if item.item_type in ("weapon", "armor"):
+                total += buy_price(item)
+                count += 1
+    return total / count
+
+
+class GoldLedger:
+    """Gold flows of one run, per floor and per source or sink (Player.gold_ledger)."""
+
+    def __init__(self):
+        self.floor = 0
+        self.flows = [[0] * len(FLOWS) for _ in range(LAST_FLOOR + 1)]
+        self.gold_at_camp = [0] * (LAST_FLOOR + 1)
+        self.gold_at_end = [0] * (LAST_FLOOR + 1)
+
+    def record(self, source: str, amount: int):
+        self.flows[self.floor][_FLOW_INDEX.get(source, _FLOW_INDEX["other"])] += amount
+
+    def begin_floor(self, floor: int, gold: int):
+        self.floor = floor
+        self.gold_at_camp[floor] = gold
+
+    def end_floor(self, gold: int):
+        self.gold_at_end[self.floor] = gold
+
+
+class FloorStats:
+    """
+    Running totals per floor over any number of runs: flows, gold held and
+    its square (for the spread), deaths. Chunks merge into one with add(),
+    so no per-run data has to leave a worker.
+    """
+
+    def __init__(self):
+        self.runs = [0] * (LAST_FLOOR + 1)
+        self.deaths = [0] * (LAST_FLOOR + 1)
+        self.flows = [[0] * len(FLOWS) for _ in range(LAST_FLOOR + 1)]
+        self.camp = [0] * (LAST_FLOOR + 1)
+        self.end = [0] * (LAST_FLOOR + 1)
+        self.end_sq = [0] * (LAST_FLOOR + 1)
+
+    def add_run(self, ledger: GoldLedger, last_floor: int, cleared: bool):
+        for floor in range(1, last_floor + 1):
+            self.runs[floor] += 1
+            row = self.flows[floor]
+            for i, amount in enumerate(ledger.flows[floor]):
+                row[i] += amount
+            self.camp[floor] += ledger.gold_at_camp[floor]
+            self.end[floor] += ledger.gold_at_end[floor]
+            self.end_sq[floor] += ledger.gold_at_end[floor] ** 2
+        if not cleared:
+            self.deaths[last_floor] += 1
+
+    def add(self, other: "FloorStats"):
+        for floor in range(LAST_FLOOR + 1):
+            self.runs[floor] += other.runs[floor]
+            self.deaths[floor] += other.deaths[floor]
+            self.camp[floor] += other.camp[floor]
+            self.end[floor] += other.end[floor]
+            self.end_sq[floor] += other.end_sq[floor]
+            row = self.flows[floor]
+            for i, amount in enumerate(other.flows[floor]):
+                row[i] += amount
+
+    def mean_flow(self, floor: int, names: tuple[str, ...]) -> float:
+        n = self.runs[floor]
+        return sum(self.flows[floor][_FLOW_INDEX[name]] for name in names) / n if n else 0.0
+
+    def mean_end(self, floor: int) -> tuple[float, float]:
+        """Mean and standard deviation of the gold held when the floor ends."""
+        n = self.runs[floor]
+        if not n:
+            return 0.0, 0.0
+        mean = self.end[floor] / n
+        return mean, math.sqrt(max(0.0, self.end_sq[floor] / n - mean * mean))
+
+
+def run_chunk(task: tuple) -> FloorStats:
+    """Play a batch of runs with a ledger attached: (class key, policy name, seeds)."""
+    class_key, policy_name, seeds = task
+    stats = FloorStats()
+    for seed in seeds:
+        ledger = GoldLedger()
+        result = play_run(class_key, POLICIES[policy_name], seed, ledger)
+        stats.add_run(ledger, result.floor, result.cleared)
+    return stats
+
+
+def print_progress(stats: FloorStats, done: int, total: int):
+    """One line of running aggregates: gold held at the end of floors 1, 5 and 10 so far."""
+    held = "  ".join(f"F{f} {stats.mean_end(f)[0]:>6.0f}gp" for f in (1, 5, LAST_FLOOR) if stats.runs[f])
+    print(f"  {100 * done / total:5.1f}%  {stats.runs[1]:>6,} runs  {held}")
+
+
+def report(stats: FloorStats):
+    prices = [0.0] + [price_index(f) for f in range(1, LAST_FLOOR + 1)]
+
+    print()
+    print("  Gold in and out per floor (mean per run that played the floor)")
+    print(f"  {'floor':>5} {'runs':>6} {'combat':>7} {'treas.':>7} {'chest':>6} {'quest':>6}"
+          f" {'sold':>6} {'income':>7} {'shop':>6} {'merch.':>6} {'spent':>6} {'spent%':>7}")
+    for f in range(1, LAST_FLOOR + 1):
+        if not stats.runs[f]:
+            continue
+        income = stats.mean_flow(f, INCOME)
+        spent = 0.0 - stats.mean_flow(f, SPENDING)
+        shop, merchant = 0.0 - stats.mean_flow(f, ("shop_buy",)), 0.0 - stats.mean_flow(f, ("merchant_buy",))
+        print(f"  {f:>5} {stats.runs[f]:>6,}"
+              f" {stats.mean_flow(f, ('combat',)):>7.0f} {stats.mean_flow(f, ('treasure',)):>7.0f}"
+              f" {stats.mean_flow(f, ('cursed_chest',)):>6.0f} {stats.mean_flow(f, ('quest',)):>6.0f}"
+              f" {stats.mean_flow(f, ('merchant_sell', 'shop_sell')):>6.0f} {income:>7.0f}"
+              f" {shop:>6.0f} {merchant:>6.0f}"
+              f" {spent:>6.0f} {100 * spent / income if income else 0:>6.0f}%")
+
+    print()
+    print("  Balance and purchase power (gear price = mean camp shop weapon/armour price)")
+    print(f"  {'floor':>5} {'at camp':>8} {'at end':>7} {'sd':>6} {'price':>6} {'power':>6}"
+          f" {'income/price':>13} {'price x':>8} {'income x':>9} {'died':>5}")
+    first_income = stats.mean_flow(1, INCOME) or 1.0
+    for f in range(1, LAST_FLOOR + 1):
+        n = stats.runs[f]
+        if not n:
+            continue
+        end, sd = stats.mean_end(f)
+        camp = stats.camp[f] / n
+        income = stats.mean_flow(f, INCOME)
+        print(f"  {f:>5} {camp:>8.0f} {end:>7.0f} {sd:>6.0f} {prices[f]:>6.0f} {camp / prices[f]:>6.2f}"
+              f" {income / prices[f]:>13.2f} {prices[f] / prices[1]:>8.2f} {income / first_income:>9.2f}"
+              f" {100 * stats.deaths[f] / n:>4.0f}%")
+
+
+def main() -> int:
+    """Where gold comes from and goes to, floor by floor, over many scripted runs."""
+    parser = argparse.ArgumentParser(description="Gold economy over full scripted runs.")
+    parser.add_argument("--runs", type=int, default=100, help="runs per class")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--classes", default=",".join(CLASSES), help="comma-separated class keys")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    classes = args.classes.split(",")
+    tasks = make_tasks(classes, args.policy, args.runs, args.seed)
+    total = len(classes) * args.runs
+    print(f"  {total:,} runs, policy {args.policy}, {args.workers} worker(s)")
+
+    stats = FloorStats()
+    t0 = last = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(active_rules().rules,)) as pool:
+        futures = [pool.submit(run_chunk, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            stats.add(future.result())
+            now = time.perf_counter()
+            if now - last >= 5.0 or done == len(tasks):
+                last = now
+                print_progress(stats, done, len(tasks))
+    elapsed = time.perf_counter() - t0
+
+    report(stats)
+    print()
+    print(f"  {total:,} runs in {elapsed:.1f} s ({total / elapsed:.1f} runs/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
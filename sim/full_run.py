@@ -0,0 +1,302 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+
+from config import MAX_INVENTORY_SIZE
+from data.classes import CLASSES
+from data.items import ALL_ITEMS, Item
+from data.rules import Rules, active_rules, use_rules
+from entities.enemy import Enemy
+from entities.player import Player
+from systems.dungeon import run_dungeon_floor
+from systems.shop import show_shop
+from systems.combat_engine import auto_battle_policy
+from systems.skilltree import get_available_to_unlock, show_skill_tree
+from utils.display import use_autopilot
+from utils.lang import t
+from utils.rng import derive_seed
+
+
+LAST_FLOOR = 10
+CHUNK = 25
+SHRINE_STATS = ["str", "dex", "int", "wis", "con"]
+_ITEMS_BY_NAME = {item.name: item for item in ALL_ITEMS.values()}
+
+
+@dataclass(frozen=True)
+class RunPolicy:
+    """How a scripted player handles everything outside the fights themselves."""
+    name: str
+    # Regular fights started below this HP fraction are fled from (bosses cannot be).
+    flee_below: float = 0.0
+    take_items: bool = True
+    dark_altar: bool = False
+    cursed_chest: bool = False
+    # Shop and merchant purchases, in priority order: "potion", "weapon", "armor".
+    buy: tuple[str, ...] = ("potion", "weapon", "armor")
+    potions: int = 3
+    # Skills unlocked from get_available_to_unlock: "all", "damage" or "none".
+    skills: str = "all"
+    # Sell outgrown gear and loot (gems, scrolls) at shops and merchants.
+    sell: bool = True
+
+
+POLICIES = {
+    "cautious": RunPolicy("cautious", flee_below=0.4, buy=("potion", "armor", "weapon"), potions=5),
+    "greedy":   RunPolicy("greedy", dark_altar=True, cursed_chest=True,
+                          buy=("weapon", "armor", "potion"), potions=2, skills="damage"),
+    "spartan":  RunPolicy("spartan", take_items=False, buy=(), skills="none"),
+}
+
+
+class ScriptedPlayer:
+    """
+    Autopilot (utils.display.use_autopilot) that answers the dungeon, shop
+    and skill tree menus for one run according to a RunPolicy. Prompts are
+    recognised by their translated text, so an unknown one is an error.
+    """
+
+    def __init__(self, player: Player, run_policy: RunPolicy):
+        self.player = player
+        self.run_policy = run_policy
+        self.fleeing = False
+        self.shopping = False
+
+    def choose(self, prompt: str, options: list) -> int:
+        player, rp = self.player, self.run_policy
+        if t("combat_enter_combat") in options:
+            self.fleeing = player.hp_percent < rp.flee_below
+            return 0
+        if prompt == t("dungeon_item_prompt"):
+            if options[0] == t("dungeon_chest_take"):
+                return 0 if rp.cursed_chest else 1
+            return 0 if rp.take_items else 1
+        if prompt == t("dungeon_altar_prompt"):
+            return 0 if rp.dark_altar else 1
+        if prompt == t("dungeon_shrine_prompt"):
+            ct = player.char_class
+            for stat in (ct.primary_stat, ct.secondary_stat, "con"):
+                if stat in SHRINE_STATS:
+                    return SHRINE_STATS.index(stat)
+        # Merchant room and camp shop menus: sell what is not needed, buy
+        # until nothing wanted is affordable, then leave.
+        if options[0] in (t("combat_buy"), t("shop_buy")):
+            self._equip_upgrades()
+            if self._sellable() is not None:
+                return 1
+            self.shopping = not self.shopping
+            return 0 if self.shopping else len(options) - 1
+        if prompt in (t("combat_buy_prompt"), t("shop_buy_prompt")):
+            pick = self._pick_purchase(options[:-1])
+            if pick is None:
+                return len(options) - 1
+            self.shopping = False
+            return pick
+        if prompt in (t("combat_sell_prompt"), t("shop_sell_prompt")):
+            pick = self._sellable()
+            return len(options) - 1 if pick is None else pick
+        if prompt == t("skill_unlock_prompt"):
+            wanted = self._wanted_skills()
+            return wanted[0] if wanted else len(options) - 1
+        raise ValueError(f"No scripted answer for prompt {prompt!r}: {options}")
+
+    def policy(self, player: Player, enemy: Enemy) -> dict:
+        """Combat policy: auto_battle_policy's potions, then the hardest-hitting affordable ability."""
+        action = auto_battle_policy(player, enemy)
+        if action["type"] == "potion":
+            return action
+        if self.fleeing and not enemy.is_boss:
+            return {"type": "flee"}
+        abilities = [a for a in player.get_available_abilities()
+                     if a.damage_base > 0 and player.current_mp >= a.mp_cost]
+        if abilities:
+            return {"type": "ability", "ability": max(abilities, key=lambda a: a.damage_base)}
+        return action
+
+    def camp(self):
+        """Between floors: unlock skills, visit the shop, wear the best gear."""
+        if get_available_to_unlock(self.player.char_class.key, self.player.unlocked_skills, self.player.level):
+            show_skill_tree(self.player)
+        self.shopping = False
+        show_shop(self.player)
+        self._equip_upgrades()
+
+    def _wanted_skills(self) -> list[int]:
+        player, mode = self.player, self.run_policy.skills
+        if mode == "none":
+            return []
+        available = get_available_to_unlock(player.char_class.key, player.unlocked_skills, player.level)
+        return [i for i, s in enumerate(available) if mode == "all" or s.damage_base > 0]
+
+    def _is_upgrade(self, item: Item) -> bool:
+        player = self.player
+        if item.item_type == "weapon":
+            return player.equipped_weapon is None or item.attack_bonus > player.equipped_weapon.attack_bonus
+        if item.item_type == "armor":
+            return player.equipped_armor is None or item.defense_bonus > player.equipped_armor.defense_bonus
+        return False
+
+    def _wants(self, item: Item) -> bool:
+        player = self.player
+        if item.item_type not in self.run_policy.buy or len(player.inventory) >= MAX_INVENTORY_SIZE:
+            return False
+        if item.item_type == "potion":
+            held = sum(1 for i in player.inventory if i.item_type == "potion")
+            return item.heal_hp > 0 and held < self.run_policy.potions
+        return self._is_upgrade(item)
+
+    def _pick_purchase(self, options: list) -> int | None:
+        """Index of the most wanted affordable item in a "Name  (123gp)" menu."""
+        best = None
+        for index, option in enumerate(options):
+            name, price = option.rsplit("  (", 1)
+            item = _ITEMS_BY_NAME.get(name)
+            if item is None or int(price.rstrip("gp)")) > self.player.gold or not self._wants(item):
+                continue
+            rank = self.run_policy.buy.index(item.item_type)
+            if best is None or rank < best[0]:
+                best = (rank, index)
+        return None if best is None else best[1]
+
+    def _sellable(self) -> int | None:
+        """Inventory index of the first item to sell: gear that is no upgrade, or loot."""
+        if not self.run_policy.sell:
+            return None
+        for index, item in enumerate(self.player.inventory):
+            if item.item_type in ("weapon", "armor") and not self._is_upgrade(item):
+                return index
+            if item.item_type == "misc" and item.slot is None and item.value > 0:
+                return index
+        return None
+
+    def _equip_upgrades(self):
+        for item in list(self.player.inventory):
+            if self._is_upgrade(item):
+                self.player.equip_item(item)
+
+
+@dataclass
+class RunResult:
+    class_key: str
+    policy: str
+    cleared: bool
+    floor: int
+    level: int
+    gold: int
+    kills: int
+
+
+def play_run(class_key: str, run_policy: RunPolicy, seed: int, ledger=None) -> RunResult:
+    """
+    One whole run, floors 1-10, through run_dungeon_floor with a ScriptedPlayer
+    at the keyboard. Mirrors game._play_game: camp, floor, 25% heal, repeat.
+    A ledger (sim.economy.GoldLedger) sees every gold change, floor by floor.
+    """
+    template = CLASSES[class_key]
+    # Unlocked skills are appended to the class's ability list, so every
+    # run needs its own copy of the template.
+    player = Player("Sim", replace(template, abilities=list(template.abilities)), run_seed=seed)
+    player.gold_ledger = ledger
+    pilot = ScriptedPlayer(player, run_policy)
+    use_autopilot(pilot)
+    try:
+        while player.dungeon_floor <= LAST_FLOOR:
+            if ledger is not None:
+                ledger.begin_floor(player.dungeon_floor, player.gold)
+            pilot.camp()
+            result = run_dungeon_floor(player)
+            if ledger is not None:
+                ledger.end_floor(player.gold)
+            if result != "next_floor":
+                break
+            player.heal(int(player.max_hp * 0.25))
+            player.restore_mp(int(player.max_mp * 0.25))
+    finally:
+        use_autopilot(None)
+    return RunResult(class_key, run_policy.name, player.dungeon_floor > LAST_FLOOR,
+                     min(player.dungeon_floor, LAST_FLOOR), player.level, player.gold, player.kills)
+
+
+def _init_worker(rules: Rules):
+    use_rules(rules)
+    # Runs render every screen; nobody is watching.
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+
+
+def run_chunk(task: tuple) -> list[RunResult]:
+    """Play a batch of runs: (class key, policy name, seeds)."""
+    class_key, policy_name, seeds = task
+    return [play_run(class_key, POLICIES[policy_name], seed) for seed in seeds]
+
+
+def make_tasks(classes: list[str], policy: str, runs: int, seed: int) -> list[tuple]:
+    """CHUNK runs per task; run i of a class always gets the same seed."""
+    tasks = []
+    for class_key in classes:
+        seeds = [derive_seed(seed, f"{class_key}:{policy}", i) for i in range(runs)]
+        for start in range(0, runs, CHUNK):
+            tasks.append((class_key, policy, seeds[start:start + CHUNK]))
+    return tasks
+
+
+def report(class_key: str, results: list[RunResult]):
+    deaths = [0] * (LAST_FLOOR + 1)
+    for r in results:
+        deaths[0 if r.cleared else r.floor] += 1
+    n = len(results)
+    levels = [r.level for r in results]
+    gold = [r.gold for r in results]
+    kills = [r.kills for r in results]
+    row = "".join(f"{100 * deaths[f] / n:>5.0f}" for f in range(1, LAST_FLOOR + 1))
+    print(f"  {class_key:<11}{row}{100 * deaths[0] / n:>6.0f}"
+          f"  {statistics.mean(levels):>5.1f} {statistics.median(levels):>4.0f}"
+          f"  {statistics.mean(gold):>6.0f} {statistics.median(gold):>5.0f}"
+          f"  {statistics.mean(kills):>5.1f}")
+
+
+def main() -> int:
+    """Whole-dungeon runs per class under a scripted policy: where they die and what they end with."""
+    parser = argparse.ArgumentParser(description="Simulate full ten-floor runs with a scripted player.")
+    parser.add_argument("--runs", type=int, default=200, help="runs per class")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--classes", default=",".join(CLASSES), help="comma-separated class keys")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    classes = args.classes.split(",")
+    tasks = make_tasks(classes, args.policy, args.runs, args.seed)
+    results: dict[str, list[RunResult]] = {c: [] for c in classes}
+    print(f"  {len(classes) * args.runs:,} runs, policy {args.policy}, {args.workers} worker(s)")
+
+    t0 = last = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(active_rules().rules,)) as pool:
+        futures = [pool.submit(run_chunk, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            for r in future.result():
+                results[r.class_key].append(r)
+            now = time.perf_counter()
+            if now - last >= 5.0:
+                last = now
+                print(f"  {100 * done / len(tasks):5.1f}%")
+    elapsed = time.perf_counter() - t0
+
+    print()
+    print("  Death floor % (clear = all ten floors), final level, gold and kills")
+    print(f"  {'class':<11}" + "".join(f"{f:>5}" for f in range(1, LAST_FLOOR + 1))
+          + f"{'clear':>6}  {'lvl':>5} {'med':>4}  {'gold':>6} {'med':>5}  {'kills':>5}")
+    for class_key in classes:
+        report(class_key, results[class_key])
+    print()
+    total = len(classes) * args.runs
+    print(f"  {total:,} runs in {elapsed:.1f} s ({total / elapsed:.1f} runs/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
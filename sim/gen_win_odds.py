@@ -0,0 +1,105 @@
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+
+from data.classes import CLASSES
+from data.enemies import ENEMIES, get_enemies_by_tier, tier_for_floor, boss_key_for_floor
+from data.win_odds import WinOddsTable, ODDS_FILE, FLOORS, HP_BUCKETS, NO_DATA
+from entities.enemy import Enemy
+from entities.player import Player
+from systems.combat_solver import CombatSolver, SolverModel
+from systems.enemy_ai import root_state
+
+
+# Anything that changes who wins a fight. The table is rebuilt when one of these changes.
+SOURCES = [
+    "data/classes.py",
+    "data/enemies.py",
+    "data/items.py",
+    "data/rules.py",
+    "entities/character.py",
+    "entities/enemy.py",
+    "entities/player.py",
+    "systems/combat_engine.py",
+    "systems/combat_solver.py",
+    "systems/effects.py",
+    "systems/initiative.py",
+    "config.py",
+]
+
+
+def source_hash() -> bytes:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    h = hashlib.blake2b(digest_size=16)
+    for path in SOURCES:
+        with open(os.path.join(root, path), "rb") as f:
+            h.update(f.read())
+    return h.digest()
+
+
+def level_for_floor(floor: int) -> int:
+    """Level the table assumes a player has when they reach a floor."""
+    return floor
+
+
+def floor_enemies(floor: int) -> list[tuple[str, int]]:
+    """(enemy key, level modifier) for everything _room_combat and _room_boss spawn on a floor."""
+    regular = [(e.key, floor - 1) for e in get_enemies_by_tier(tier_for_floor(floor))]
+    return regular + [(boss_key_for_floor(floor), floor)]
+
+
+def _player(class_key: str, level: int) -> Player:
+    p = Player("Odds", CLASSES[class_key], run_seed=0)
+    while p.level < level:
+        p.gain_xp(p.xp_to_next)
+    return p
+
+
+def build(digest: bytes) -> WinOddsTable:
+    table = WinOddsTable(list(CLASSES), list(ENEMIES), source_hash=digest)
+    for class_key in CLASSES:
+        for floor in range(1, FLOORS + 1):
+            player = _player(class_key, level_for_floor(floor))
+            for enemy_key, level_mod in floor_enemies(floor):
+                enemy = Enemy(ENEMIES[enemy_key], level_modifier=level_mod, rng=random.Random(0))
+                # One solver per matchup: lower HP buckets reuse the states
+                # already memoised for the higher ones.
+                solver = CombatSolver(SolverModel.from_combat(player, enemy))
+                state = root_state(enemy, player)
+                for bucket in reversed(range(HP_BUCKETS)):
+                    hp = max(1, round(player.max_hp * (bucket + 0.5) / HP_BUCKETS))
+                    odds = solver.solve((hp,) + state[1:])
+                    table.set(class_key, enemy_key, floor, bucket, odds.victory)
+        print(f"  {class_key:<10} done")
+    return table
+
+
+def main() -> int:
+    """Rebuild data/win_odds.bin if the combat rules changed since it was made (or with --force)."""
+    parser = argparse.ArgumentParser(description="Rebuild the shipped win-chance table.")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the sources are unchanged")
+    args = parser.parse_args()
+
+    digest = source_hash()
+    if not args.force:
+        try:
+            if WinOddsTable.load().source_hash == digest:
+                print(f"  {ODDS_FILE} is up to date")
+                return 0
+        except (OSError, ValueError):
+            pass
+
+    t0 = time.perf_counter()
+    table = build(digest)
+    table.save()
+    filled = sum(1 for c in table.cells if c != NO_DATA)
+    print(f"  wrote {ODDS_FILE}: {len(table.cells)} cells, {filled} filled,"
+          f" {os.path.getsize(ODDS_FILE)} bytes in {time.perf_counter() - t0:.0f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import AUTO_POTION_BELOW
+from data.rules import Rules, active_rules
+from entities.enemy import ABILITY_ROLL, Enemy
+from entities.player import Player
+from systems.enemy_ai import PlannerModel, DOT_STATUSES
+from systems.initiative import InitiativeScheduler, initiative, ROUND_TICKS
+from sim.damage import calculate_damage_batch
+
+
+MAX_TURNS = 300
+
+UNFINISHED, DEFEAT, VICTORY = -1, 0, 1
+
+
+@dataclass
+class LockstepResult:
+    """Per-fight outcome (VICTORY / DEFEAT / UNFINISHED), rounds played and player HP left."""
+    outcome: np.ndarray
+    turns: np.ndarray
+    player_hp: np.ndarray
+
+    @property
+    def win_rate(self) -> float:
+        return float(np.mean(self.outcome == VICTORY))
+
+
+def _roll(params: tuple, n: int, rng: np.random.Generator, rules: Rules) -> np.ndarray:
+    """n calculate_damage rolls with the same (attack, stat, defense, min, max, crit stat)."""
+    attack, *rest = params
+    return calculate_damage_batch(np.full(n, attack), *rest, rng=rng, rules=rules)[0]
+
+
+def round_orders(player: Player, enemy: Enemy, turns: int) -> list[tuple[bool, ...]]:
+    """
+    Who acts in each of the first `turns` rounds (True for the player), in the
+    order CombatEngine.next_actor hands them out. Nothing in a lockstep fight
+    changes speed, so the schedule is the same for every fight.
+    """
+    scheduler = InitiativeScheduler(min(initiative(player), initiative(enemy)))
+    scheduler.add("player", initiative(player), player.dexterity)
+    scheduler.add("enemy", initiative(enemy), enemy.dexterity)
+    orders = []
+    for turn in range(1, turns + 1):
+        end = turn * ROUND_TICKS
+        order = []
+        while scheduler.peek_time() < end:
+            order.append(scheduler.pop() == "player")
+        orders.append(tuple(order))
+    return orders
+
+
+def simulate_lockstep(player: Player, enemy: Enemy, fights: int, policy: str = "basic",
+                      rng: np.random.Generator | None = None, rules: Rules | None = None,
+                      max_turns: int = MAX_TURNS) -> LockstepResult:
+    """
+    Play `fights` independent copies of player vs enemy at once, one action
+    slot of one round at a time over arrays of HP, enemy MP, ability
+    cooldowns, player DoT turns and enemy evade. Fights that end are retired
+    from the arrays at the end of each round.
+
+    policy is "basic" (basic_attack_policy) or "auto" (auto_battle_policy:
+    drink the strongest healing potion below AUTO_POTION_BELOW). The enemy
+    uses Enemy.choose_action without a planner, and its abilities are
+    reduced as in PlannerModel: damage, poison / burn / curse, drain heals
+    and evade. Effects with no hold on a player who only swings (stun,
+    fear, freeze) land as plain hits. Player and enemy are only read.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    r = rules or active_rules().rules
+    model = PlannerModel.from_combat(enemy, player)
+    orders = round_orders(player, enemy, max_turns)
+    abilities = model.abilities
+    always_ability = enemy.template.tier >= 3
+
+    weapon = player.equipped_weapon
+    p_roll = (player.effective_attack, player.stat_by_name(player.char_class.primary_stat),
+              enemy.effective_defense, weapon.damage_min if weapon else 3,
+              weapon.damage_max if weapon else 8, player.dexterity)
+    e_roll = (enemy.effective_attack, enemy.strength, player.effective_defense,
+              max(1, enemy.base_attack // 3), max(2, enemy.base_attack // 2), enemy.dexterity)
+    p_def, e_def = player.effective_defense, enemy.effective_defense
+    p_max, e_max = player.max_hp, enemy.max_hp
+
+    heals = [0]
+    if policy == "auto":
+        heals = sorted((i.heal_hp for i in player.inventory if i.item_type == "potion" and i.heal_hp > 0),
+                       reverse=True) + [0]
+    elif policy != "basic":
+        raise ValueError(f"Unknown lockstep policy: {policy}")
+    heal_table = np.array(heals, dtype=np.int64)
+    potions = len(heals) - 1
+
+    cost = np.array([ab.cost for ab in abilities], dtype=np.int64)
+    dot_damage = np.array(model.dot_damage, dtype=np.int64)
+
+    # Live state, one row per fight still running.
+    ids = np.arange(fights)
+    p_hp = np.full(fights, player.current_hp, dtype=np.int64)
+    e_hp = np.full(fights, enemy.current_hp, dtype=np.int64)
+    e_mp = np.full(fights, enemy.current_mp, dtype=np.int64)
+    cooldowns = np.tile(np.array([max(0, enemy.ability_cooldowns.get(ab[0], 0)) for ab in enemy.abilities],
+                                 dtype=np.int64), (fights, 1))
+    dots = np.tile(np.array([player.status_duration(name) for name in DOT_STATUSES], dtype=np.int64),
+                   (fights, 1))
+    evade = np.full(fights, enemy.status_duration("evade"), dtype=np.int64)
+    drunk = np.zeros(fights, dtype=np.int64)
+
+    outcome = np.full(fights, UNFINISHED, dtype=np.int8)
+    turns = np.full(fights, max_turns, dtype=np.int64)
+    hp_left = np.zeros(fights, dtype=np.int64)
+
+    for turn in range(1, max_turns + 1):
+        if not len(ids):
+            break
+        # begin_turn: DoT ticks on the player, the enemy's evade runs down.
+        ticking = dots > 0
+        p_hp = np.maximum(0, p_hp - (ticking * dot_damage).sum(axis=1))
+        dots -= ticking
+        np.maximum(evade - 1, 0, out=evade)
+        result = np.where(p_hp > 0, UNFINISHED, DEFEAT).astype(np.int8)
+
+        for player_acts in orders[turn - 1]:
+            live = np.flatnonzero(result == UNFINISHED)
+            if not len(live):
+                break
+            if player_acts:
+                swing = live
+                if potions:
+                    drink = (p_hp[live] / p_max < AUTO_POTION_BELOW) & (drunk[live] < potions)
+                    sip = live[drink]
+                    p_hp[sip] = np.minimum(p_max, p_hp[sip] + heal_table[drunk[sip]])
+                    drunk[sip] += 1
+                    swing = live[~drink]
+                damage = _roll(p_roll, len(swing), rng, r)
+                dodged = evade[swing] > 0
+                evade[swing[dodged]] = 0
+                hit = swing[~dodged]
+                e_hp[hit] = np.maximum(0, e_hp[hit] - np.maximum(1, damage[~dodged] - e_def))
+                result[hit[e_hp[hit] <= 0]] = VICTORY
+            else:
+                n = len(live)
+                use = np.zeros(n, dtype=bool)
+                if abilities:
+                    ready = (cooldowns[live] <= 0) & (e_mp[live, None] >= cost)
+                    count = ready.sum(axis=1)
+                    use = count > 0
+                    if not always_ability:
+                        use &= rng.random(n) < ABILITY_ROLL
+                    # Uniform pick among the ready abilities, as rng.choice(available).
+                    rank = (rng.random(n) * count).astype(np.int64)
+                    choice = np.argmax(np.cumsum(ready, axis=1) > rank[:, None], axis=1)
+
+                swing = live[~use]
+                damage = _roll(e_roll, len(swing), rng, r)
+                p_hp[swing] = np.maximum(0, p_hp[swing] - np.maximum(1, damage - p_def))
+
+                for ab in abilities:
+                    cast = live[use & (choice == ab.index)]
+                    if not len(cast):
+                        continue
+                    e_mp[cast] -= ab.cost
+                    cooldowns[cast, ab.index] = model.cooldown
+                    p_hp[cast] = np.maximum(0, p_hp[cast] - ab.damage)
+                    if ab.dot_slot >= 0:
+                        dots[cast, ab.dot_slot] = np.maximum(dots[cast, ab.dot_slot], ab.dot_turns)
+                    if ab.heal:
+                        e_hp[cast] = np.minimum(e_max, e_hp[cast] + ab.heal)
+                    if ab.evade_turns:
+                        evade[cast] = np.maximum(evade[cast], ab.evade_turns)
+                result[live[p_hp[live] <= 0]] = DEFEAT
+
+        # end_turn: cooldowns tick, finished fights leave the arrays.
+        np.maximum(cooldowns - 1, 0, out=cooldowns)
+        done = result != UNFINISHED
+        if done.any():
+            finished = ids[done]
+            outcome[finished] = result[done]
+            turns[finished] = turn
+            hp_left[finished] = p_hp[done]
+            keep = ~done
+            ids, p_hp, e_hp, e_mp = ids[keep], p_hp[keep], e_hp[keep], e_mp[keep]
+            cooldowns, dots, evade, drunk = cooldowns[keep], dots[keep], evade[keep], drunk[keep]
+
+    hp_left[ids] = p_hp
+    return LockstepResult(outcome, turns, hp_left)
@@ -0,0 +1,181 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from data.classes import CLASSES
+from data.enemies import ENEMIES, EnemyTemplate
+from data.rules import Rules, active_rules, use_rules
+from entities.enemy import EnemyPool
+from entities.player import Player
+from systems.combat_engine import CombatEngine, auto_battle_policy
+from utils.rng import derive_seed
+from sim.gen_win_odds import level_for_floor
+
+
+FLOORS = range(1, 11)
+CHUNK = 500
+OUT_DIR = "sim_output"
+
+
+def level_modifier_for(template: EnemyTemplate, floor: int) -> int:
+    """Level modifier the dungeon gives this enemy on a floor (_room_combat / _room_boss)."""
+    return floor if template.is_boss else floor - 1
+
+
+def _player(class_key: str, level: int) -> Player:
+    p = Player("Matrix", CLASSES[class_key], run_seed=0)
+    while p.level < level:
+        p.gain_xp(p.xp_to_next)
+    # Winning must not level the player up halfway through a batch.
+    p.xp_to_next = 10 ** 9
+    return p
+
+
+def _init_worker(rules: Rules):
+    use_rules(rules)
+
+
+def run_chunk(task: tuple) -> tuple:
+    """
+    Fight one batch of a matchup: (class key, enemy key, floor, fights, seed, use_planner).
+    Returns (class key, enemy key, floor, fights, wins, total turns, total HP lost in % of max).
+    """
+    class_key, enemy_key, floor, fights, seed, use_planner = task
+    rng = random.Random(seed)
+    player = _player(class_key, level_for_floor(floor))
+    inventory = list(player.inventory)
+    template = ENEMIES[enemy_key]
+    level_mod = level_modifier_for(template, floor)
+    pool = EnemyPool()
+
+    wins = turns = 0
+    hp_lost = 0.0
+    for _ in range(fights):
+        player.current_hp, player.current_mp = player.max_hp, player.max_mp
+        player.reset_combat_state()
+        player.cooldowns.clear()
+        player.inventory[:] = inventory
+
+        enemy = pool.acquire(template, level_mod, rng)
+        result = CombatEngine(player, enemy, policy=auto_battle_policy, rng=rng,
+                              use_planner=use_planner).run()
+        pool.release(enemy)
+
+        wins += result.outcome == "victory"
+        turns += result.turns
+        hp_lost += 100 * (player.max_hp - player.current_hp) / player.max_hp
+    return class_key, enemy_key, floor, fights, wins, turns, hp_lost
+
+
+def make_tasks(classes: list[str], enemies: list[str], floors: list[int], fights: int,
+               seed: int, use_planner: bool) -> list[tuple]:
+    """Split every (class, enemy, floor) cell into CHUNK-sized batches, each with its own seed."""
+    tasks = []
+    for class_key in classes:
+        for enemy_key in enemies:
+            for floor in floors:
+                for i, start in enumerate(range(0, fights, CHUNK)):
+                    # Seeds depend on the cell and batch only, so results do not depend on scheduling.
+                    chunk_seed = derive_seed(seed, f"{class_key}:{enemy_key}:{i}", floor)
+                    tasks.append((class_key, enemy_key, floor, min(CHUNK, fights - start),
+                                  chunk_seed, use_planner))
+    return tasks
+
+
+def run_matrix(tasks: list[tuple], workers: int, progress=None) -> dict[tuple, list]:
+    """Fan the batches out over a process pool; returns {(class, enemy, floor): [fights, wins, turns, hp_lost]}."""
+    cells: dict[tuple, list] = {}
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(active_rules().rules,)) as pool:
+        futures = [pool.submit(run_chunk, task) for task in tasks]
+        for future in as_completed(futures):
+            class_key, enemy_key, floor, fights, wins, turns, hp_lost = future.result()
+            cell = cells.setdefault((class_key, enemy_key, floor), [0, 0, 0, 0.0])
+            cell[0] += fights
+            cell[1] += wins
+            cell[2] += turns
+            cell[3] += hp_lost
+            done += 1
+            if progress is not None:
+                progress(done, len(tasks))
+    return cells
+
+
+def write_csv(path: str, cells: dict[tuple, list]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        out = csv.writer(f)
+        out.writerow(["class", "enemy", "floor", "level_mod", "fights",
+                      "win_rate", "avg_turns", "avg_hp_lost_pct"])
+        for (class_key, enemy_key, floor), (fights, wins, turns, hp_lost) in sorted(cells.items()):
+            out.writerow([class_key, enemy_key, floor, level_modifier_for(ENEMIES[enemy_key], floor),
+                          fights, f"{wins / fights:.4f}", f"{turns / fights:.2f}",
+                          f"{hp_lost / fights:.2f}"])
+
+
+def print_matrix(cells: dict[tuple, list], classes: list[str], enemies: list[str], metric: int, title: str):
+    """One enemy per row, one class per column, averaged over the floors that were run."""
+    print()
+    print(f"  {title}")
+    print(f"  {'':<14}" + "".join(f"{c[:7]:>8}" for c in classes))
+    for enemy_key in enemies:
+        row = []
+        for class_key in classes:
+            fights = value = 0
+            for (c, e, _), cell in cells.items():
+                if c == class_key and e == enemy_key:
+                    fights += cell[0]
+                    value += cell[metric]
+            row.append(value / fights if fights else 0.0)
+        scale = 100 if metric == 1 else 1
+        print(f"  {enemy_key[:14]:<14}" + "".join(f"{scale * v:>8.1f}" for v in row))
+
+
+def main() -> int:
+    """Monte Carlo win rate, turns and HP lost for every class against every enemy and floor."""
+    parser = argparse.ArgumentParser(description="Class vs enemy matchup matrix over a process pool.")
+    parser.add_argument("--fights", type=int, default=1000, help="fights per (class, enemy, floor) cell")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--classes", default=",".join(CLASSES), help="comma-separated class keys")
+    parser.add_argument("--floors", default=",".join(str(f) for f in FLOORS), help="comma-separated floors")
+    parser.add_argument("--planner", action="store_true",
+                        help="let tier-3 enemies and bosses search (slow: PLANNER_NODE_BUDGET nodes per enemy turn)")
+    parser.add_argument("--out", default=os.path.join(OUT_DIR, "matrix.csv"), help="CSV with every cell")
+    args = parser.parse_args()
+
+    classes = args.classes.split(",")
+    floors = [int(f) for f in args.floors.split(",")]
+    enemies = list(ENEMIES)
+    tasks = make_tasks(classes, enemies, floors, args.fights, args.seed, args.planner)
+    total = len(classes) * len(enemies) * len(floors) * args.fights
+    print(f"  {total:,} fights in {len(tasks):,} batches on {args.workers} worker(s)")
+
+    last = [0.0]
+
+    def progress(done: int, count: int):
+        now = time.perf_counter()
+        if now - last[0] >= 2.0 or done == count:
+            last[0] = now
+            print(f"  {100 * done / count:5.1f}%  ({done:,}/{count:,} batches)")
+
+    t0 = time.perf_counter()
+    cells = run_matrix(tasks, args.workers, progress)
+    elapsed = time.perf_counter() - t0
+
+    write_csv(args.out, cells)
+    print_matrix(cells, classes, enemies, 1, "Win rate %")
+    print_matrix(cells, classes, enemies, 2, "Average turns")
+    print_matrix(cells, classes, enemies, 3, "Average HP lost, % of max")
+    print()
+    print(f"  {total:,} fights in {elapsed:.1f} s ({total / elapsed:,.0f} fights/s), wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
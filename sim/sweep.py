@@ -0,0 +1,300 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, fields, replace
+
+from config import ENEMY_PLANNER, PLANNER_MAX_DEPTH, PLANNER_NODE_BUDGET
+from data.classes import CLASSES
+from data.rules import DEFAULT_RULES, Rules, use_rules
+from utils.rng import derive_seed
+from sim.full_run import LAST_FLOOR, POLICIES, play_run, _init_worker
+
+
+# Everything a run can execute: the game packages whole, plus the driver.
+# A change to any file here invalidates the cache.
+RUN_PACKAGES = ("data", "entities", "systems", "utils")
+RUN_FILES = ("config.py", "sim/full_run.py")
+
+CACHE_DIR = "sweep_cache"
+CHUNK = 10
+GRID_BATCH = 64
+
+# Candidate values per knob (Rules field names).
+KNOBS = {
+    "flee_base":            (0.35, 0.45, 0.55),
+    "xp_base":              (80, 100, 120),
+    "enemy_growth":         (0.06, 0.08, 0.10),
+    "enemy_defense_growth": (0.03, 0.05, 0.07),
+    "trap_damage_min":      (3, 5, 7),
+    "trap_damage_max":      (8, 10, 12),
+    "rest_heal_hp":         (0.25, 0.35, 0.45),
+    "rest_heal_mp":         (0.30, 0.40, 0.50),
+}
+
+# Wanted share of the runs reaching each floor that also clear it.
+TARGETS = [0.95, 0.93, 0.91, 0.89, 0.87, 0.85, 0.83, 0.81, 0.79, 0.77]
+
+
+def run_sources(root: str) -> list[str]:
+    """Every .py file of RUN_PACKAGES (recursively) and RUN_FILES, relative to root, sorted."""
+    paths = list(RUN_FILES)
+    for package in RUN_PACKAGES:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, package)):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            paths += [os.path.relpath(os.path.join(dirpath, name), root)
+                      for name in filenames if name.endswith(".py")]
+    return sorted(paths)
+
+
+def code_hash() -> str:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    h = hashlib.blake2b(digest_size=16)
+    for path in run_sources(root):
+        h.update(path.encode())
+        with open(os.path.join(root, path), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    One JSON file per evaluated parameter vector, named by the blake2b hash
+    of the rules, the evaluation settings and the game code. Files are
+    written whole (temp file + rename), so an interrupted sweep leaves only
+    finished evaluations behind.
+    """
+
+    def __init__(self, directory: str, settings: dict):
+        self.directory = directory
+        self.settings = dict(settings, code=code_hash())
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, rules: Rules) -> str:
+        blob = json.dumps({"rules": asdict(rules), "settings": self.settings}, sort_keys=True)
+        return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+    def _path(self, rules: Rules) -> str:
+        return os.path.join(self.directory, self.key(rules) + ".json")
+
+    def get(self, rules: Rules) -> dict | None:
+        try:
+            with open(self._path(rules), "r", encoding="utf-8") as f:
+                return json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, rules: Rules, result: dict):
+        path = self._path(rules)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"rules": asdict(rules), "settings": self.settings, "result": result}, f, indent=1)
+        os.replace(tmp, path)
+
+
+def run_chunk(task: tuple) -> tuple:
+    """Play a batch of runs under one Rules set: (rules, class key, policy name, seeds)."""
+    rules, class_key, policy_name, seeds = task
+    use_rules(rules)
+    try:
+        floors = [r.floor + r.cleared for r in
+                  (play_run(class_key, POLICIES[policy_name], seed) for seed in seeds)]
+    finally:
+        use_rules(DEFAULT_RULES)
+    return rules, floors
+
+
+def clear_rates(floors: list[int]) -> list[float]:
+    """
+    Per floor, the share of the runs that reached it and cleared it. A
+    run's value is its death floor, or LAST_FLOOR + 1 if it cleared them all.
+    """
+    rates = []
+    for floor in range(1, LAST_FLOOR + 1):
+        reached = sum(1 for f in floors if f >= floor)
+        rates.append(sum(1 for f in floors if f > floor) / reached if reached else 0.0)
+    return rates
+
+
+def loss(rates: list[float], targets: list[float]) -> float:
+    return sum((r - t) ** 2 for r, t in zip(rates, targets))
+
+
+class Sweep:
+    """Evaluates Rules sets over a process pool, through the on-disk cache."""
+
+    def __init__(self, pool: ProcessPoolExecutor, cache: ResultCache, classes: list[str],
+                 policy: str, runs: int, seed: int, targets: list[float]):
+        self.pool = pool
+        self.cache = cache
+        self.classes = classes
+        self.policy = policy
+        self.runs = runs
+        self.seed = seed
+        self.targets = targets
+        self.evaluated = 0
+        self.hits = 0
+
+    def _tasks(self, rules: Rules) -> list[tuple]:
+        # Same seeds for every Rules set: differences come from the knobs, not the dice.
+        tasks = []
+        for class_key in self.classes:
+            seeds = [derive_seed(self.seed, f"{class_key}:{self.policy}", i) for i in range(self.runs)]
+            for start in range(0, self.runs, CHUNK):
+                tasks.append((rules, class_key, self.policy, seeds[start:start + CHUNK]))
+        return tasks
+
+    def evaluate(self, candidates: list[Rules]) -> list[dict]:
+        """Results for every candidate, running only the ones the cache lacks."""
+        results = {}
+        missing = []
+        for rules in dict.fromkeys(candidates):
+            cached = self.cache.get(rules)
+            if cached is None:
+                missing.append(rules)
+            else:
+                results[rules] = cached
+                self.hits += 1
+
+        tasks = {rules: self._tasks(rules) for rules in missing}
+        pending = {rules: len(chunks) for rules, chunks in tasks.items()}
+        floors: dict[Rules, list[int]] = {rules: [] for rules in missing}
+        futures = [self.pool.submit(run_chunk, task) for chunks in tasks.values() for task in chunks]
+        for future in as_completed(futures):
+            rules, chunk = future.result()
+            floors[rules].extend(chunk)
+            pending[rules] -= 1
+            if pending[rules]:
+                continue
+            result = {"clear_rates": clear_rates(floors[rules]), "runs": len(floors[rules])}
+            # Saved the moment it is complete, so a later crash cannot lose it.
+            self.cache.put(rules, result)
+            results[rules] = result
+            self.evaluated += 1
+        return [dict(results[rules], loss=loss(results[rules]["clear_rates"], self.targets))
+                for rules in candidates]
+
+
+def knob_rules(values: dict) -> Rules:
+    return replace(DEFAULT_RULES, **values)
+
+
+def grid_search(sweep: Sweep, knobs: dict) -> tuple[Rules, dict]:
+    """Every combination of the knob values, GRID_BATCH vectors at a time."""
+    names = list(knobs)
+    combos = itertools.product(*knobs.values())
+    best = None
+    done = 0
+    while batch := [knob_rules(dict(zip(names, combo))) for combo in itertools.islice(combos, GRID_BATCH)]:
+        for rules, result in zip(batch, sweep.evaluate(batch)):
+            if best is None or result["loss"] < best[1]["loss"]:
+                best = (rules, result)
+        done += len(batch)
+        print(f"  {done:,} vectors  best loss {best[1]['loss']:.4f}")
+    return best
+
+
+def coordinate_search(sweep: Sweep, knobs: dict, rounds: int) -> tuple[Rules, dict]:
+    """
+    Start from the defaults and move one knob at a time to its best value,
+    holding the rest, until a full pass changes nothing. Far fewer runs than
+    the grid; revisited vectors come out of the cache.
+    """
+    best = DEFAULT_RULES
+    best_result = sweep.evaluate([best])[0]
+    for round_no in range(1, rounds + 1):
+        improved = False
+        for name, values in knobs.items():
+            candidates = [replace(best, **{name: v}) for v in values]
+            results = sweep.evaluate(candidates)
+            i = min(range(len(candidates)), key=lambda j: results[j]["loss"])
+            if results[i]["loss"] < best_result["loss"]:
+                best, best_result, improved = candidates[i], results[i], True
+            print(f"  round {round_no}  {name:<21} -> {getattr(best, name):<6}  loss {best_result['loss']:.4f}")
+        if not improved:
+            break
+    return best, best_result
+
+
+def parse_knobs(specs: list[str] | None) -> dict:
+    """--knob name=v1,v2,... overrides; a bare name keeps the default candidates."""
+    if not specs:
+        return dict(KNOBS)
+    types = {f.name: f.type for f in fields(Rules)}
+    knobs = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in types:
+            raise SystemExit(f"Unknown rules field: {name}")
+        cast = int if types[name] is int else float
+        knobs[name] = tuple(cast(v) for v in values.split(",")) if values else KNOBS[name]
+    return knobs
+
+
+def main() -> int:
+    """Search balance knobs for per-floor clear rates closest to the targets, caching every evaluation."""
+    parser = argparse.ArgumentParser(description="Sweep Rules knobs against per-floor clear-rate targets.")
+    parser.add_argument("--knob", action="append", metavar="NAME=V1,V2",
+                        help="rules field and candidate values (repeatable; default: every knob in KNOBS)")
+    parser.add_argument("--targets", default=",".join(str(t) for t in TARGETS),
+                        help="clear rate per floor, 1-10 (one value applies to every floor)")
+    parser.add_argument("--grid", action="store_true", help="try every combination instead of one knob at a time")
+    parser.add_argument("--rounds", type=int, default=3, help="coordinate search passes")
+    parser.add_argument("--runs", type=int, default=20, help="full runs per class per evaluation")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--classes", default=",".join(CLASSES), help="comma-separated class keys")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--cache", default=CACHE_DIR, help="directory for cached evaluations")
+    args = parser.parse_args()
+
+    knobs = parse_knobs(args.knob)
+    targets = [float(t) for t in args.targets.split(",")]
+    if len(targets) == 1:
+        targets *= LAST_FLOOR
+    elif len(targets) != LAST_FLOOR:
+        parser.error(f"--targets needs 1 or {LAST_FLOOR} values, got {len(targets)}")
+    classes = args.classes.split(",")
+    # A cached result must replay exactly: a clock-bounded planner depends on machine load.
+    if ENEMY_PLANNER and PLANNER_NODE_BUDGET is None:
+        raise SystemExit("sim.sweep needs a node-bounded planner: set PLANNER_NODE_BUDGET or ENEMY_PLANNER = False")
+    # Targets only enter the loss, so changing them reuses every cached run.
+    cache = ResultCache(args.cache, {"classes": classes, "policy": args.policy,
+                                     "runs": args.runs, "seed": args.seed,
+                                     "planner": ENEMY_PLANNER and (PLANNER_NODE_BUDGET, PLANNER_MAX_DEPTH)})
+    size = 1
+    for values in knobs.values():
+        size *= len(values)
+    print(f"  {len(knobs)} knobs, {size:,} combinations, {len(classes) * args.runs} runs per evaluation,"
+          f" {args.workers} worker(s), cache {args.cache}")
+
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(DEFAULT_RULES,)) as pool:
+        sweep = Sweep(pool, cache, classes, args.policy, args.runs, args.seed, targets)
+        if args.grid:
+            best, result = grid_search(sweep, knobs)
+        else:
+            best, result = coordinate_search(sweep, knobs, args.rounds)
+    elapsed = time.perf_counter() - t0
+
+    print()
+    print(f"  {'floor':<8}" + "".join(f"{f:>6}" for f in range(1, LAST_FLOOR + 1)))
+    print(f"  {'target':<8}" + "".join(f"{100 * t:>6.0f}" for t in targets))
+    print(f"  {'best':<8}" + "".join(f"{100 * r:>6.0f}" for r in result["clear_rates"]))
+    print()
+    for name in knobs:
+        default = getattr(DEFAULT_RULES, name)
+        value = getattr(best, name)
+        print(f"  {name:<21} {value}" + ("" if value == default else f"  (default {default})"))
+    print()
+    print(f"  loss {result['loss']:.4f}; {sweep.evaluated} evaluated, {sweep.hits} from cache, {elapsed:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import argparse
+import sys
+from collections import Counter
+
+from systems.transcript import TranscriptRecord, load_transcript
+
+
+def format_record(r: TranscriptRecord) -> str:
+    line = (f"  fight {r.fight:>6}  turn {r.turn:>3}  {r.actor_name:<7} {r.action_name:<14}"
+            f" {r.damage:>5}{' crit' if r.critical and r.damage else ''}")
+    if r.applied:
+        line += "  +" + ",".join(r.applied_names)
+    if r.expired:
+        line += "  -" + ",".join(r.expired_names)
+    return line
+
+
+def summarise(records: list[TranscriptRecord]):
+    fights = {r.fight for r in records}
+    print(f"  {len(records):,} records, fights {min(fights)}-{max(fights)} ({len(fights):,} fights)")
+    print()
+    print(f"  {'action':<16} {'count':>8} {'damage':>10} {'crits':>7}")
+    counts, damage, crits = Counter(), Counter(), Counter()
+    for r in records:
+        counts[r.action_name] += 1
+        damage[r.action_name] += r.damage
+        crits[r.action_name] += r.critical
+    for name, n in counts.most_common():
+        print(f"  {name:<16} {n:>8,} {damage[name]:>10,} {crits[name]:>7,}")
+    applied = Counter(name for r in records for name in r.applied_names)
+    if applied:
+        print()
+        print("  statuses applied: " + "  ".join(f"{name} {n:,}" for name, n in applied.most_common()))
+
+
+def main() -> int:
+    """Print or summarise a combat transcript written by arena.py --transcript."""
+    parser = argparse.ArgumentParser(description="Read a binary combat transcript.")
+    parser.add_argument("path")
+    parser.add_argument("--fight", type=int, default=None, help="only the records of this fight number")
+    parser.add_argument("--last", type=int, default=40, help="records to print, newest last (0: all)")
+    parser.add_argument("--summary", action="store_true", help="counts per action instead of the records")
+    args = parser.parse_args()
+
+    try:
+        records = load_transcript(args.path)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"{args.path}: {e}")
+    if args.fight is not None:
+        records = [r for r in records if r.fight == args.fight]
+    if not records:
+        print("  no records")
+        return 0
+
+    if args.summary:
+        summarise(records)
+    else:
+        for r in records[-args.last:] if args.last else records:
+            print(format_record(r))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+
+from data.classes import CLASSES
+from data.enemies import ENEMIES
+from entities.enemy import EnemyPool
+from entities.player import Player
+from systems.combat_engine import CombatEngine, auto_battle_policy
+from systems.transcript import Transcript
+from utils.rng import new_run_seed
+from config import ENEMY_PLANNER
+
+
+# Per-fight latencies kept for percentiles; older ones are dropped so an
+# endless session runs in constant memory.
+LATENCY_WINDOW = 100_000
+
+def percentile(ordered, q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence (0.0 if empty)."""
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class ArenaStats:
+    """Running totals for one arena session; latencies are per-fight seconds, newest last."""
+    fights: int = 0
+    wins: int = 0
+    champions: int = 1
+    turns: int = 0
+    streak: int = 0
+    best_streak: int = 0
+    best_level: int = 1
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def summary(self, elapsed: float, since: int = 0, turns_since: int = 0) -> dict:
+        """
+        Rates and percentiles over the fights from index `since` on, which
+        took `elapsed` wall seconds; `turns_since` is the turn count at that
+        index. Percentiles cover at most the last LATENCY_WINDOW fights.
+        """
+        fights = self.fights - since
+        recent = min(fights, len(self.latencies))
+        window = sorted(islice(self.latencies, len(self.latencies) - recent, None))
+        return {
+            "fights_per_s": fights / elapsed if elapsed else 0.0,
+            "turns_per_s": (self.turns - turns_since) / elapsed if elapsed else 0.0,
+            "p50_ms": 1000 * percentile(window, 0.50),
+            "p99_ms": 1000 * percentile(window, 0.99),
+        }
+
+
+class Arena:
+    """
+    Endless headless arena. A champion of one class fights every ENEMIES
+    template in turn, and each full lap raises the level modifier by one.
+    The champion is healed between fights and keeps XP, levels and loot;
+    when it falls a fresh champion of the same class starts from lap 0.
+    With a transcript attached, every fight's events are recorded into it.
+    """
+
+    def __init__(self, class_key: str, seed: int | None = None, use_planner: bool = ENEMY_PLANNER,
+                 transcript: Transcript | None = None):
+        self.char_class = CLASSES[class_key]
+        self.rng = random.Random(new_run_seed() if seed is None else seed)
+        self.use_planner = use_planner
+        self.transcript = transcript
+        self.templates = list(ENEMIES.values())
+        self.pool = EnemyPool()
+        self.stats = ArenaStats()
+        self.round = 0
+        self.champion = self._new_champion()
+
+    def _new_champion(self) -> Player:
+        self.round = 0
+        return Player("Champion", self.char_class, run_seed=self.rng.getrandbits(63))
+
+    @property
+    def level_modifier(self) -> int:
+        return self.round // len(self.templates)
+
+    def fight(self) -> str:
+        """Run the next fight of the rotation. Returns its outcome."""
+        player = self.champion
+        player.current_hp, player.current_mp = player.max_hp, player.max_mp
+        player.reset_combat_state()
+        player.cooldowns.clear()
+        template = self.templates[self.round % len(self.templates)]
+
+        t0 = time.perf_counter()
+        enemy = self.pool.acquire(template, self.level_modifier, player.rng.loot)
+        result = CombatEngine(player, enemy, policy=auto_battle_policy,
+                              rng=player.rng.combat, loot_rng=player.rng.loot,
+                              transcript=self.transcript, use_planner=self.use_planner).run()
+        self.pool.release(enemy)
+        elapsed = time.perf_counter() - t0
+
+        st = self.stats
+        st.fights += 1
+        st.turns += result.turns
+        st.latencies.append(elapsed)
+        if result.outcome == "defeat":
+            st.streak = 0
+            st.champions += 1
+            self.champion = self._new_champion()
+        else:
+            st.wins += 1
+            st.streak += 1
+            st.best_streak = max(st.best_streak, st.streak)
+            st.best_level = max(st.best_level, player.level)
+            self.round += 1
+        return result.outcome
+
+    def run(self, fights: int | None = None, report=None, report_every: float = 2.0) -> ArenaStats:
+        """
+        Fight until `fights` have been run (forever if None). Every
+        `report_every` seconds report(arena, summary of the fights since
+        the previous report) is called.
+        """
+        st = self.stats
+        last = time.perf_counter()
+        last_index, last_turns = st.fights, st.turns
+        while fights is None or st.fights < fights:
+            self.fight()
+            now = time.perf_counter()
+            if report is not None and now - last >= report_every:
+                report(self, st.summary(now - last, last_index, last_turns))
+                last, last_index, last_turns = now, st.fights, st.turns
+        return self.stats
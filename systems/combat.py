@@ -1,134 +1,223 @@
-import random
-import time
-
 from entities.player import Player
 from entities.enemy import Enemy
 from data.classes import Ability
+from data.items import Item
+from data.win_odds import win_chance
+from systems.combat_engine import (
+    CombatEngine, CombatEvent, CombatResult, CombatSession, auto_battle_policy,
+    TICK, AWAIT_ACTION, RESOLVE_ENEMY,
+)
+from systems.effects import EFFECTS
 from utils.display import (
     box_top, box_bottom, box_row, box_separator,
     hp_bar, print_message, prompt_choice, press_enter,
-    print_ascii_enemy, typewriter, clr, Color, SCREEN_WIDTH
+    print_ascii_enemy, typewriter, pause, clr, Color, SCREEN_WIDTH,
+    active_autopilot,
 )
-from config import FLEE_BASE_CHANCE
 from utils.lang import t
 
 
-def run_combat(player: Player, enemy: Enemy) -> str:
+def run_combat(player: Player, enemy: Enemy | list[Enemy], checkpoint=None) -> str:
     """
-    Execute a full combat encounter.
+    Execute a full combat encounter against one enemy or a pack.
+    The rules are resolved by a CombatSession; this function only renders
+    its events and collects the player's decisions.
+    checkpoint(session), if given, is called every time the player is asked
+    for an action, so the fight can be saved and resumed from there.
     Returns: "victory" | "defeat" | "fled"
     """
+    engine = CombatEngine(player, enemy, rng=player.rng.combat, loot_rng=player.rng.loot)
+
     print()
-    _draw_encounter_intro(enemy)
+    _draw_encounter_intro(player, engine.enemies, searching=bool(engine.planners))
     press_enter(t("combat_start"))
 
-    turn = 1
-    player_evading = False
-
-    while player.is_alive and enemy.is_alive:
-        print()
-        _draw_combat_status(player, enemy, turn)
+    return _play_session(player, CombatSession(engine), checkpoint)
 
-        for msg in player.tick_status_effects():
-            print_message(msg, "bad")
-        for msg in enemy.tick_status_effects():
-            print_message(msg, "good")
 
-        if not player.is_alive:
-            break
-        if not enemy.is_alive:
-            break
-
-        result = _player_turn(player, enemy, turn)
-
-        if result == "fled":
-            print_message(t("combat_flee_success"), "warning")
-            press_enter()
-            return "fled"
+def resume_combat(player: Player, session: CombatSession, checkpoint=None) -> str:
+    """
+    Pick up a fight restored with CombatSession.from_dict, skipping the intro.
+    Returns: "victory" | "defeat" | "fled"
+    """
+    engine = session.engine
+    print()
+    print_message(t("combat_resumed", enemy=", ".join(e.name for e in engine.enemies)), "system")
+    if session.phase == AWAIT_ACTION:
+        _draw_combat_status(player, engine.enemies, engine.turn)
+    return _play_session(player, session, checkpoint)
 
-        if not enemy.is_alive:
-            break
 
-        print()
-        _enemy_turn(enemy, player)
+def _play_session(player: Player, session: CombatSession, checkpoint=None) -> str:
+    """
+    Render a CombatSession until it is over and show the outcome.
+    Under an autopilot its policy picks the player's actions and no checkpoints are taken.
+    """
+    engine = session.engine
+    sides = engine.sides
+    pilot = active_autopilot()
+
+    while session.result is None:
+        phase = session.phase
+        if phase == TICK:
+            print()
+            _draw_combat_status(player, engine.enemies, engine.turn)
+            _render_events(sides, session.step())
+        elif phase == AWAIT_ACTION:
+            if pilot is not None:
+                session.submit(pilot.policy(player, engine.enemy))
+                continue
+            if checkpoint is not None:
+                checkpoint(session)
+            session.submit(_player_turn(player, engine))
+        elif phase == RESOLVE_ENEMY:
+            print()
+            name = sides[session.actor].name
+            events = session.step()
+            print(clr(f"  ~~~ {name.upper()}'S TURN ~~~", Color.RED))
+            print()
+            _render_events(sides, events)
+        else:
+            _render_events(sides, session.step())
 
-        player.tick_cooldowns()
-        enemy.tick_cooldowns()
-        turn += 1
+    result = session.result
 
-        if not player.is_alive:
-            break
+    if result.outcome == "fled":
+        print_message(t("combat_flee_success"), "warning")
+        press_enter()
+        return "fled"
 
     print()
-    if player.is_alive:
-        return _victory(player, enemy)
+    if result.outcome == "victory":
+        return _victory(player, engine.enemies, result)
     else:
-        return _defeat(player, enemy)
+        return _defeat(player, engine.enemy)
 
 
-def _player_turn(player: Player, enemy: Enemy, turn: int) -> str:
-    """Handle a complete player turn. Returns 'action' | 'fled'."""
-
-    options = [
-        f"{t('combat_action_attack')}  [ ATK: {player.effective_attack} ]",
-        t("combat_action_ability"),
-        t("combat_action_potion"),
-        t("combat_quick_status"),
-        t("combat_action_flee"),
-    ]
-
-    choice = prompt_choice(options, t("combat_your_action"))
+def auto_resolve_combat(player: Player, enemy: Enemy | list[Enemy]) -> str:
+    """
+    Resolve a fight with auto_battle_policy and no per-turn rendering,
+    then show a single summary screen.
+    Returns: "victory" | "defeat"
+    """
+    hp_before = player.current_hp
+    engine = CombatEngine(player, enemy, policy=auto_battle_policy,
+                          rng=player.rng.combat, loot_rng=player.rng.loot)
+    result = engine.run()
+
+    if result.outcome == "defeat":
+        return _defeat(player, engine.enemy)
+    return _auto_summary(player, engine.enemies, result, hp_before)
+
+
+def _auto_summary(player: Player, enemies: list[Enemy], result: CombatResult, hp_before: int) -> str:
+    """One screen with everything an auto-resolved fight cost and earned."""
+    damage = 0
+    potions = 0
+    for ev in result.events:
+        if ev.kind == "potion" and ev.critical:
+            potions += 1
+        elif ev.kind == "tick" and ev.actor == "player":
+            damage += sum(dmg for _, dmg, _ in ev.data)
+        elif ev.target == "player" and ev.actor != "player" and ev.kind in ("attack", "ability", "effect"):
+            damage += ev.amount
 
-    if choice == 0:
-        _player_basic_attack(player, enemy)
+    print()
+    print(box_top())
+    print(box_row(clr(t("combat_auto_title"), Color.GREEN), align="center"))
+    print(box_separator())
+    for enemy in enemies:
+        print(box_row(f"  {enemy.name} — {t('combat_fallen')}"))
+    print(box_row(f"  {t('combat_auto_turns', turns=result.turns)}"))
+    print(box_row(f"  {t('combat_auto_damage', damage=damage, potions=potions)}"))
+    print(box_row(f"  HP : {hp_bar(player.current_hp, player.max_hp, 18)}  ({hp_before} -> {player.current_hp})"))
+    print(box_separator())
+    xp = sum(e.xp_reward for e in enemies)
+    print(box_row(f"  {t('combat_auto_rewards', xp=xp, gold=clr(str(result.gold), Color.YELLOW))}"))
+    if not result.loot:
+        print(box_row(f"  {t('combat_auto_no_loot')}"))
+    print(box_bottom())
 
-    elif choice == 1:
-        used = _player_use_ability(player, enemy)
-        if not used:
-            return _player_turn(player, enemy, turn)
+    # The first XP message is the gain itself, already in the box.
+    for msg in result.xp_messages[1:]:
+        print_message(msg, "good" if "***" in msg else "normal")
+    for item, msg in result.loot:
+        print_message(f"  {t('combat_item_found', item=clr(item.name, Color.CYAN), msg=msg)}", "good")
 
-    elif choice == 2:
-        used = _player_use_potion(player)
-        if not used:
-            return _player_turn(player, enemy, turn)
+    press_enter()
+    return "victory"
 
-    elif choice == 3:
-        _player_quick_inventory(player)
-        return _player_turn(player, enemy, turn)
 
-    elif choice == 4:
-        if _attempt_flee(player, enemy):
-            return "fled"
-        print_message(t("combat_flee_fail"), "bad")
+def _player_turn(player: Player, engine: CombatEngine) -> dict:
+    """
+    Ask the player for this turn's action. Cancelled menus and the quick
+    status screen go back to the action menu. Returns an engine action dict.
+    """
+    while True:
+        options = [
+            f"{t('combat_action_attack')}  [ ATK: {player.effective_attack} ]",
+            t("combat_action_ability"),
+            t("combat_action_potion"),
+            t("combat_quick_status"),
+            t("combat_action_flee"),
+        ]
+
+        choice = prompt_choice(options, t("combat_your_action"))
+
+        if choice == 0:
+            target = _choose_target(engine)
+            if target is not None:
+                return {"type": "attack", "target": target}
+
+        elif choice == 1:
+            ability = _choose_ability(player)
+            if ability is None:
+                continue
+            spec = EFFECTS.get(ability.effect)
+            if ability.damage_base > 0 and not (spec and spec.area):
+                target = _choose_target(engine)
+                if target is not None:
+                    return {"type": "ability", "ability": ability, "target": target}
+                continue
+            return {"type": "ability", "ability": ability}
+
+        elif choice == 2:
+            potion = _choose_potion(player)
+            if potion is not None:
+                return {"type": "potion", "item": potion}
+
+        elif choice == 3:
+            _player_quick_inventory(player)
 
-    return "action"
+        else:
+            return {"type": "flee"}
 
 
-def _player_basic_attack(player: Player, enemy: Enemy):
-    """Execute a basic attack."""
-    damage, critical = _calculate_damage(
-        attacker_attack=player.effective_attack,
-        attacker_stat=player.stat_by_name(player.char_class.primary_stat),
-        defender_defense=enemy.effective_defense,
-        damage_min=player.equipped_weapon.damage_min if player.equipped_weapon else 3,
-        damage_max=player.equipped_weapon.damage_max if player.equipped_weapon else 8,
-        crit_stat=player.dexterity,
-    )
+def _choose_target(engine: CombatEngine) -> str | None:
+    """Pick which enemy to hit. Skips the menu when only one is standing; None if cancelled."""
+    living = engine.living_enemies()
+    if len(living) == 1:
+        return living[0]
 
-    if critical:
-        typewriter(f"  {t('combat_critical')}", 0.015)
-    actual = enemy.take_damage(damage)
-    _flash_damage(enemy.name, actual, critical)
+    options = []
+    for side in living:
+        e = engine.sides[side]
+        options.append(f"{e.name}  [ HP: {e.current_hp}/{e.max_hp} ]")
+    options.append(t("combat_cancel"))
+    choice = prompt_choice(options, t("combat_choose_target"))
+    if choice == len(options) - 1:
+        return None
+    return living[choice]
 
 
-def _player_use_ability(player: Player, enemy: Enemy) -> bool:
-    """Show ability menu, execute chosen ability. Returns True if ability was used."""
+def _choose_ability(player: Player) -> Ability | None:
+    """Show ability menu. Returns the chosen affordable ability, or None if cancelled."""
     available = player.get_available_abilities()
 
     if not available:
         print_message(t("combat_no_abilities"), "warning")
         press_enter()
-        return False
+        return None
 
     print()
     ability_options = []
@@ -141,57 +230,33 @@ def _player_use_ability(player: Player, enemy: Enemy) -> bool:
 
     choice = prompt_choice(ability_options, t("combat_ability_prompt"))
     if choice == len(ability_options) - 1:
-        return False
+        return None
 
     ability = available[choice]
-    ok, reason = player.use_ability(ability)
+    ok, reason = player.can_use_ability(ability)
     if not ok:
         print_message(reason, "warning")
         press_enter()
-        return False
-
-    _execute_player_ability(player, enemy, ability)
-    return True
-
-
-def _execute_player_ability(player: Player, enemy: Enemy, ability: Ability):
-    """Resolve ability effects on the enemy."""
-    narrative = t(ability.narrative).format(name=player.name)
-    print()
-    typewriter(f"  {narrative}", 0.014)
-    print()
-
-    if ability.heal_amount > 0:
-        restored = player.heal(ability.heal_amount)
-        print_message(t("combat_heal_recover", n=restored), "good")
-
-    if ability.damage_base > 0:
-        stat_val = player.stat_by_name(ability.stat_used)
-        raw_dmg = int(ability.damage_base + stat_val * ability.damage_scale)
-        actual  = enemy.take_damage(raw_dmg)
-        _flash_damage(enemy.name, actual, False)
+        return None
 
-    _apply_combat_effect(ability.effect, player, enemy)
+    return ability
 
 
-def _player_use_potion(player: Player) -> bool:
-    """Quick-use a potion from inventory."""
+def _choose_potion(player: Player) -> Item | None:
+    """Show potion menu. Returns the chosen potion, or None if cancelled."""
     potions = [i for i in player.inventory if i.item_type == "potion"]
     if not potions:
         print_message(t("combat_no_potions"), "warning")
         press_enter()
-        return False
+        return None
 
     options = [f"{p.name}  (HP+{p.heal_hp}  MP+{p.heal_mp})" for p in potions]
     options.append(t("combat_cancel"))
     choice = prompt_choice(options, t("combat_use_potion"))
 
     if choice == len(options) - 1:
-        return False
-
-    ok, msg = player.use_potion(potions[choice])
-    print_message(msg, "good" if ok else "bad")
-    return ok
+        return None
+    return potions[choice]
 
 
 def _player_quick_inventory(player: Player):
@@ -213,80 +278,80 @@ def _player_quick_inventory(player: Player):
     press_enter()
 
 
-def _enemy_turn(enemy: Enemy, player: Player):
-    """Execute the enemy's AI turn."""
-    action = enemy.choose_action()
+def _render_events(sides: dict, events: list[CombatEvent]):
+    """Print the narrative for a batch of engine events."""
+    for ev in events:
+        _render_event(sides, ev)
 
-    print(clr(f"  ~~~ {enemy.name.upper()}'S TURN ~~~", Color.RED))
-    print()
 
-    if action["type"] == "stunned":
-        print_message(f"El {enemy.name} está aturdido y pierde el turno. ¡Aproveché!", "good")
-        return
-
-    if action["type"] == "attack":
-        print_message(action["phrase"], "bad", delay=0.03)
-        damage, critical = _calculate_damage(
-            attacker_attack=enemy.effective_attack,
-            attacker_stat=enemy.strength,
-            defender_defense=player.effective_defense,
-            damage_min=max(1, enemy.base_attack // 3),
-            damage_max=max(2, enemy.base_attack // 2),
-            crit_stat=enemy.dexterity,
-        )
-        if critical:
+def _render_event(sides: dict, ev: CombatEvent):
+    """Print the narrative for a single engine event. sides maps side ids to combatants."""
+    player = sides["player"]
+    actor = sides[ev.actor]
+    target = sides.get(ev.target)
+    kind = ev.kind
+
+    if kind == "tick":
+        style = "bad" if ev.actor == "player" else "good"
+        for msg in actor.describe_status_ticks(ev.data):
+            print_message(msg, style)
+
+    elif kind == "attack" and ev.actor == "player":
+        if ev.critical:
+            typewriter(f"  {t('combat_critical')}", 0.015)
+        _flash_damage(target.name, ev.amount, ev.critical)
+
+    elif kind == "attack":
+        print_message(ev.name, "bad", delay=0.03)
+        if ev.critical:
             print_message("¡Golpe crítico devastador! Te duele hasta el alma.", "bad")
-        actual = player.take_damage(damage)
-        if actual == 0:
+        if ev.amount == 0:
             print_message("¡Tu evasión funcionó! El ataque pasó a centímetros. Suertudo.", "good")
         else:
-            print_message(f"-{clr(str(actual), Color.RED)} HP", "bad")
+            print_message(f"-{clr(str(ev.amount), Color.RED)} HP", "bad")
 
-    elif action["type"] == "ability":
-        ability_name = action["ability_name"]
-        multiplier   = action["multiplier"]
-        effect       = action["effect"]
-
-        print_message(f"{enemy.name} uses {ability_name.upper()}!", "bad", delay=0.02)
-        time.sleep(0.3)
-
-        raw_dmg = int(enemy.effective_attack * multiplier)
-        actual  = player.take_damage(raw_dmg)
-        if actual == 0:
+    elif kind == "ability" and ev.actor == "player":
+        ability = ev.data
+        narrative = t(ability.narrative).format(name=player.name)
+        print()
+        typewriter(f"  {narrative}", 0.014)
+        print()
+        if ability.heal_amount > 0:
+            print_message(t("combat_heal_recover", n=ev.healed), "good")
+        if ability.damage_base > 0:
+            _flash_damage(target.name, ev.amount, False)
+
+    elif kind == "hit":
+        _flash_damage(target.name, ev.amount, False)
+
+    elif kind == "ability":
+        print_message(f"{actor.name} uses {ev.name.upper()}!", "bad", delay=0.02)
+        pause(0.3)
+        if ev.amount == 0:
             print_message(t("combat_evade_ability"), "good")
         else:
-            print_message(f"-{clr(str(actual), Color.RED)} HP", "bad")
+            print_message(f"-{clr(str(ev.amount), Color.RED)} HP", "bad")
 
-        _apply_combat_effect(effect, enemy, player)
+    elif kind == "ability_failed":
+        print_message(ev.name, "warning")
 
+    elif kind == "effect":
+        if ev.target == ev.actor:
+            print_message(f"{actor.name}: {ev.name}", "good")
+        else:
+            print_message(f"{target.name}: {ev.name}", "bad")
 
-def _calculate_damage(
-    attacker_attack: int,
-    attacker_stat: int,
-    defender_defense: int,
-    damage_min: int,
-    damage_max: int,
-    crit_stat: int,
-) -> tuple[int, bool]:
-    """
-    Calculate raw damage and whether it was a critical hit.
-    Returns (damage, is_critical).
-    """
-    base = random.randint(damage_min, max(damage_min + 1, damage_max))
-    stat_bonus = attacker_stat // 4
-    raw = attacker_attack + base + stat_bonus
-
-    reduced = max(1, raw - defender_defense // 2)
+    elif kind == "drain":
+        print_message(f"{actor.name}: -{ev.healed} HP", "bad")
 
-    crit_chance = 0.05 + (crit_stat - 10) * 0.005
-    is_crit = random.random() < max(0.03, crit_chance)
-    if is_crit:
-        reduced = int(reduced * 1.75)
+    elif kind == "potion":
+        print_message(ev.name, "good" if ev.critical else "bad")
 
-    variance = random.uniform(0.90, 1.10)
-    final = max(1, int(reduced * variance))
+    elif kind == "flee" and not ev.amount:
+        print_message(t("combat_flee_fail"), "bad")
 
-    return final, is_crit
+    elif kind == "stunned":
+        print_message(f"El {actor.name} está aturdido y pierde el turno. ¡Aproveché!", "good")
 
 
 def _flash_damage(target_name: str, damage: int, critical: bool):
@@ -298,88 +363,25 @@ def _flash_damage(target_name: str, damage: int, critical: bool):
         print_message(f"{target_name} — {dmg_str} HP", "normal")
 
 
-def _apply_combat_effect(effect: str, source, target):
-    """Apply a named status effect from an ability."""
-    effect_map = {
-        "poison":  ("poison",  3, int(target.max_hp * 0.05), "Poisoned!"),
-        "burn":    ("burn",    2, int(target.max_hp * 0.06), "Burning!"),
-        "stun":    ("stun",    1, 0,                          "Stunned!"),
-        "freeze":  ("stun",    2, 0,                          "Frozen solid!"),
-        "curse":   ("curse",   3, int(target.max_hp * 0.04), "Cursed!"),
-        "fear":    ("stun",    1, 0,                          "Paralyzed with fear!"),
-        "drain":   ("curse",   1, 0,                          "Life drained!"),
-        "bleed":   ("poison",  2, int(target.max_hp * 0.04), "Bleeding!"),
-        "holy":    ("", 0, 0, ""),
-        "aoe":     ("", 0, 0, ""),
-        "multi":   ("", 0, 0, ""),
-        "chaos":   ("", 0, 0, ""),
-        "mark":    ("mark",    2, 0, "Marked for death!"),
-        "shield":  ("shield",  3, 30, "Shielded!"),
-        "evade":   ("evade",   1, 0, "Evasion ready!"),
-        "rage":    ("rage",    3, 0, "Enraged!"),
-        "aura":    ("aura",    3, 0, "Holy Aura!"),
-        "empower": ("empower", 1, 0, "Empowered!"),
-        "analyze": ("analyze", 2, 0, "Weaknesses found!"),
-        "summon":  ("", 0, 0, ""),
-    }
-
-    if not effect or effect not in effect_map:
-        return
-
-    status_name, duration, value, label = effect_map[effect]
-
-    self_effects = {"shield", "evade", "rage", "aura", "empower", "analyze"}
-    actual_target = source if status_name in self_effects else target
-
-    if status_name and duration > 0:
-        actual_target.add_status(status_name, duration, value)
-        if actual_target == target:
-            print_message(f"{target.name}: {label}", "bad")
-        else:
-            print_message(f"{source.name}: {label}", "good")
-
-    if effect == "drain" and target != source:
-        drain_hp = max(1, int(target.max_hp * 0.08))
-        source.heal(drain_hp)
-        print_message(f"{source.name}: -{drain_hp} HP", "bad")
-
-
-def _attempt_flee(player: Player, enemy: Enemy) -> bool:
-    """Calculate and resolve a flee attempt."""
-    speed_ratio = player.dexterity / max(1, enemy.dexterity)
-    chance = FLEE_BASE_CHANCE * speed_ratio
-    chance = max(0.15, min(0.80, chance))
-    return random.random() < chance
-
-
-def _victory(player: Player, enemy: Enemy) -> str:
-    """Handle post-combat victory: XP, gold, loot."""
+def _victory(player: Player, enemies: list[Enemy], result: CombatResult) -> str:
+    """Show post-combat victory: XP, gold, loot (already applied by the engine)."""
     print()
     print(clr("  " + "=" * 56, Color.GREEN))
-    typewriter(f"  {t('combat_victory', enemy=enemy.name)}", 0.02)
+    names = ", ".join(e.name for e in enemies)
+    typewriter(f"  {t('combat_victory', enemy=names)}", 0.02)
     print(clr("  " + "=" * 56, Color.GREEN))
     print()
 
-    player.kills += 1
-
-    xp_messages = player.gain_xp(enemy.xp_reward)
-    for msg in xp_messages:
+    for msg in result.xp_messages:
         print_message(msg, "good" if "***" in msg else "normal")
         if "***" in msg:
-            time.sleep(0.4)
+            pause(0.4)
 
-    print_message(f"  {t('combat_gold_found', amount=clr(str(enemy.gold_reward), Color.YELLOW))}", "good")
-    player.earn_gold(enemy.gold_reward)
+    print_message(f"  {t('combat_gold_found', amount=clr(str(result.gold), Color.YELLOW))}", "good")
 
-    loot = enemy.generate_loot()
-    for item in loot:
-        ok, msg = player.add_to_inventory(item)
+    for item, msg in result.loot:
         print_message(f"  {t('combat_item_found', item=clr(item.name, Color.CYAN), msg=msg)}", "good")
 
-    player.remove_status("rage")
-    player.remove_status("empower")
-    player.remove_status("evade")
-
     press_enter()
     return "victory"
 
@@ -402,21 +404,38 @@ def _defeat(player: Player, enemy: Enemy) -> str:
     return "defeat"
 
 
-def _draw_encounter_intro(enemy: Enemy):
-    """Draw the enemy encounter introduction."""
-    print_ascii_enemy(enemy.art_key)
+def _draw_encounter_intro(player: Player, enemies: list[Enemy], searching: bool = False):
+    """
+    Draw the encounter introduction: the lead enemy's art, then the whole pack,
+    plus the shipped win-chance estimate for one-on-one fights. The estimate
+    assumes the flat ability roll, so it is left out when the enemy plans
+    its moves (searching).
+    """
+    lead = enemies[0]
+    print_ascii_enemy(lead.art_key)
     print(box_top())
     tier_color = {1: Color.WHITE, 2: Color.YELLOW, 3: Color.RED, 4: Color.MAGENTA}
-    tier_str = clr(f"[ {enemy.tier_label} ]", tier_color.get(enemy.template.tier, Color.WHITE))
-    print(box_row(f"{clr(enemy.name.upper(), Color.RED)}  {tier_str}", align="left"))
+    tier_str = clr(f"[ {lead.tier_label} ]", tier_color.get(lead.template.tier, Color.WHITE))
+    print(box_row(f"{clr(lead.name.upper(), Color.RED)}  {tier_str}", align="left"))
     print(box_separator())
-    print(box_row(enemy.display_description))
+    print(box_row(lead.display_description))
     print(box_separator())
-    print(box_row(f"  HP: {hp_bar(enemy.current_hp, enemy.max_hp, 20)}"))
+    if len(enemies) > 1:
+        print(box_row(clr(t("combat_pack", n=len(enemies)), Color.YELLOW)))
+    for enemy in enemies:
+        label = f"{enemy.name}: " if len(enemies) > 1 else "HP: "
+        print(box_row(f"  {label}{hp_bar(enemy.current_hp, enemy.max_hp, 20)}"))
+    if len(enemies) == 1 and not searching:
+        chance = win_chance(player.char_class.key, lead.template.key,
+                            player.dungeon_floor, player.hp_percent)
+        if chance is not None:
+            color = Color.GREEN if chance >= 0.8 else Color.YELLOW if chance >= 0.5 else Color.RED
+            pct = clr(f"{round(chance * 100)}%", color)
+            print(box_row(f"  {t('combat_win_chance', pct=pct)}"))
     print(box_bottom())
 
 
-def _draw_combat_status(player: Player, enemy: Enemy, turn: int):
+def _draw_combat_status(player: Player, enemies: list[Enemy], turn: int):
     """Draw both combatant status bars."""
     print(box_top())
     print(box_row(clr(f"  {t('combat_turn')} {turn}", Color.GREY), align="left"))
@@ -433,12 +452,16 @@ def _draw_combat_status(player: Player, enemy: Enemy, turn: int):
 
     print(box_separator())
 
-    e_name = clr(enemy.name.upper(), Color.RED)
-    print(box_row(f"  {e_name}"))
-    print(box_row(f"  HP : {hp_bar(enemy.current_hp, enemy.max_hp, 18)}"))
-
-    if enemy.status_effects:
-        effects = "  ".join(clr(s.name.upper(), Color.GREEN) for s in enemy.status_effects)
-        print(box_row(f"  {effects}"))
+    for enemy in enemies:
+        if not enemy.is_alive:
+            print(box_row(clr(f"  {enemy.name.upper()}  — {t('combat_fallen')}", Color.GREY)))
+            continue
+        e_name = clr(enemy.name.upper(), Color.RED)
+        print(box_row(f"  {e_name}"))
+        print(box_row(f"  HP : {hp_bar(enemy.current_hp, enemy.max_hp, 18)}"))
+
+        if enemy.status_effects:
+            effects = "  ".join(clr(s.name.upper(), Color.GREEN) for s in enemy.status_effects)
+            print(box_row(f"  {effects}"))
 
     print(box_bottom())
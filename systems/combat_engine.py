@@ -0,0 +1,556 @@
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from entities.player import Player
+from entities.enemy import Enemy
+from data.classes import Ability
+from config import ENEMY_PLANNER, AUTO_POTION_BELOW
+from data.rules import CompiledRules, active_rules
+from systems.transcript import Transcript
+from utils.rng import dump_state, load_state
+from systems.enemy_ai import ExpectimaxPlanner
+from systems.initiative import (
+    InitiativeScheduler, initiative, ROUND_TICKS, HASTE_RATE, SLOW_RATE,
+)
+from entities.character import status_bit, take_damage_batch
+from systems.effects import (
+    EFFECTS, HOOK_MASK, LOW_HP_THRESHOLD, COMBAT_BUFFS, EffectSpec, refresh_hooks, apply_effect,
+)
+
+
+@dataclass
+class CombatEvent:
+    """A single thing that happened during a fight, recorded for the renderer."""
+    turn: int
+    actor: str
+    kind: str
+    target: str = ""
+    name: str = ""
+    amount: int = 0
+    critical: bool = False
+    healed: int = 0
+    data: object = None
+
+
+@dataclass
+class CombatResult:
+    """Final outcome of a resolved fight plus everything that happened in it."""
+    outcome: str
+    turns: int
+    events: list[CombatEvent] = field(default_factory=list)
+    xp_messages: list[str] = field(default_factory=list)
+    gold: int = 0
+    loot: list = field(default_factory=list)
+
+
+Policy = Callable[[Player, Enemy], dict]
+
+_HASTE = status_bit("haste")
+_SLOW = status_bit("slow")
+
+
+def basic_attack_policy(player: Player, enemy: Enemy) -> dict:
+    """Always swing the equipped weapon."""
+    return {"type": "attack"}
+
+
+def auto_battle_policy(player: Player, enemy: Enemy) -> dict:
+    """Swing every turn; drink the strongest healing potion once HP drops below AUTO_POTION_BELOW."""
+    if player.hp_percent < AUTO_POTION_BELOW:
+        potions = [i for i in player.inventory if i.item_type == "potion" and i.heal_hp > 0]
+        if potions:
+            return {"type": "potion", "item": max(potions, key=lambda i: i.heal_hp)}
+    return {"type": "attack"}
+
+
+def enemy_side(index: int) -> str:
+    """Side id of the index-th enemy of a pack: "enemy", "enemy1", "enemy2", ..."""
+    return "enemy" if index == 0 else f"enemy{index}"
+
+
+TICK = "tick"
+AWAIT_ACTION = "await_action"
+RESOLVE_PLAYER = "resolve_player"
+RESOLVE_ENEMY = "resolve_enemy"
+OVER = "over"
+
+
+class CombatEngine:
+    """
+    Resolves a fight between a Player and one Enemy or a pack of them,
+    with no terminal I/O.
+
+    Can be stepped one phase at a time, usually through a CombatSession
+    (begin_turn -> player_action / enemy_action(side) for each side
+    next_actor() returns -> end_turn), or resolved in one call with
+    run() and a decision policy.
+    Combatants are addressed by side id: "player", then "enemy", "enemy1", ...
+    for the pack. The player's attacks go to the target side, which moves to
+    the next living enemy when it falls.
+    Every step returns the events it produced; outcome is set to
+    "victory" | "defeat" | "fled" once the fight is over.
+    """
+
+    def __init__(self, player: Player, enemy: Enemy | list[Enemy],
+                 policy: Optional[Policy] = None, rng=None,
+                 transcript: Optional[Transcript] = None, loot_rng=None,
+                 use_planner: bool = ENEMY_PLANNER, rules: Optional[CompiledRules] = None):
+        self.player = player
+        self.enemies: list[Enemy] = list(enemy) if isinstance(enemy, (list, tuple)) else [enemy]
+        self.sides: dict[str, Player | Enemy] = {"player": player}
+        for i, e in enumerate(self.enemies):
+            self.sides[enemy_side(i)] = e
+        self.target = "enemy"
+
+        self.policy = policy or basic_attack_policy
+        self.rules = rules or active_rules()
+        self.rng = rng or random
+        self.loot_rng = loot_rng or self.rng
+        self.planners: dict[str, ExpectimaxPlanner] = {}
+        if use_planner:
+            for i, e in enumerate(self.enemies):
+                if e.template.tier >= 3:
+                    self.planners[enemy_side(i)] = ExpectimaxPlanner()
+        self.transcript = transcript
+        if transcript is not None:
+            transcript.begin_fight()
+
+        self.turn = 1
+        self.outcome: str | None = None
+        self.events: list[CombatEvent] = []
+
+        self.scheduler = InitiativeScheduler(min(initiative(c) for c in self.sides.values()))
+        for side, c in self.sides.items():
+            self.scheduler.add(side, initiative(c), c.dexterity)
+        self._speed_bits = dict.fromkeys(self.sides, 0)
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot of a fight in progress, for saving. The player is saved
+        separately (Player.to_dict), so only the enemies, the clock, the
+        target and the RNG positions are kept here.
+        """
+        data = {
+            "turn": self.turn,
+            "target": self.target,
+            "enemies": [e.to_dict() for e in self.enemies],
+            "scheduler": self.scheduler.to_dict(),
+            "rng": dump_state(self.rng),
+        }
+        if self.loot_rng is not self.rng:
+            data["loot_rng"] = dump_state(self.loot_rng)
+        return data
+
+    @classmethod
+    def from_dict(cls, player: Player, data: dict, rng=None, loot_rng=None,
+                  use_planner: bool = ENEMY_PLANNER) -> "CombatEngine":
+        """Rebuild a fight saved with to_dict. rng / loot_rng are restored in place."""
+        engine = cls(player, [Enemy.from_dict(e) for e in data["enemies"]],
+                     rng=rng, loot_rng=loot_rng, use_planner=use_planner)
+        engine.turn = data["turn"]
+        engine.target = data["target"]
+        engine.scheduler = InitiativeScheduler.from_dict(data["scheduler"])
+        for side, c in engine.sides.items():
+            engine._speed_bits[side] = c.statuses.mask & (_HASTE | _SLOW)
+        load_state(engine.rng, data["rng"])
+        if "loot_rng" in data:
+            load_state(engine.loot_rng, data["loot_rng"])
+        return engine
+
+    @property
+    def enemy(self) -> Enemy:
+        """The enemy the player is currently targeting."""
+        return self.sides[self.target]
+
+    def living_enemies(self) -> list[str]:
+        """Side ids of the enemies still standing, in pack order."""
+        return [side for side, c in self.sides.items() if side != "player" and c.is_alive]
+
+
+    def run(self) -> CombatResult:
+        """Resolve the whole fight using the policy for every player decision."""
+        while self.outcome is None:
+            self.begin_turn()
+            side = self.next_actor()
+            while side is not None:
+                if side == "player":
+                    self.player_action(self.policy(self.player, self.enemy))
+                else:
+                    self.enemy_action(side)
+                side = self.next_actor()
+            if self.outcome:
+                break
+            self.end_turn()
+        return self.finish()
+
+    def next_actor(self) -> str | None:
+        """
+        The side due to act next this round, or None once the round (or the fight) is over.
+        Faster sides come first and may come up twice in one round.
+        """
+        end = self.turn * ROUND_TICKS
+        scheduler = self.scheduler
+        while self.outcome is None and scheduler.peek_time() < end:
+            side = scheduler.pop()
+            if self.sides[side].is_alive:
+                return side
+            scheduler.remove(side)
+        return None
+
+    def begin_turn(self) -> list[CombatEvent]:
+        """Run turn-start hooks and tick status effects for everyone still standing."""
+        start = len(self.events)
+        for side, c in self.sides.items():
+            if not c.is_alive:
+                continue
+            if c.statuses.mask & HOOK_MASK:
+                refresh_hooks(c)
+                for hook in c.on_turn_start:
+                    hook(self, side)
+            ticks = c.advance_status_effects()
+            if ticks:
+                self.emit(side, "tick", data=ticks)
+                self.check_low_hp(side)
+        self._sync_speed()
+        self._check_outcome()
+        return self.events[start:]
+
+    def player_action(self, action: dict) -> list[CombatEvent]:
+        """
+        Resolve one player action dict:
+        {"type": "attack"} | {"type": "ability", "ability": Ability}
+        {"type": "potion", "item": Item} | {"type": "flee"}
+        Attacks and abilities may carry "target": side id to switch targets.
+        """
+        start = len(self.events)
+        kind = action["type"]
+        target = action.get("target")
+        if target in self.sides and target != "player" and self.sides[target].is_alive:
+            self.target = target
+
+        if kind == "attack":
+            self._player_attack()
+        elif kind == "ability":
+            self._player_ability(action["ability"])
+        elif kind == "potion":
+            ok, msg = self.player.use_potion(action["item"])
+            self.emit("player", "potion", name=msg, critical=ok)
+        elif kind == "flee":
+            fastest = max((self.sides[s] for s in self.living_enemies()), key=lambda e: e.dexterity)
+            fled = self.rng.random() < self.rules.flee_chance(self.player.dexterity, fastest.dexterity)
+            self.emit("player", "flee", target=self.target, amount=int(fled))
+            if fled:
+                self.outcome = "fled"
+                return self.events[start:]
+
+        self._sync_speed()
+        self._check_outcome()
+        return self.events[start:]
+
+    def enemy_action(self, side: str = "enemy") -> list[CombatEvent]:
+        """Let the AI of the enemy on that side pick and resolve its action."""
+        start = len(self.events)
+        player, enemy = self.player, self.sides[side]
+        action = enemy.choose_action(self.rng, self.planners.get(side), player)
+
+        if action["type"] == "stunned":
+            self.emit(side, "stunned")
+
+        elif action["type"] == "attack":
+            damage, critical = self.rules.damage(
+                enemy.effective_attack,
+                enemy.strength,
+                player.effective_defense,
+                max(1, enemy.base_attack // 3),
+                max(2, enemy.base_attack // 2),
+                enemy.dexterity,
+                self.rng,
+            )
+            dealt, critical = self._strike(side, damage, critical, "attack")
+            self.emit(side, "attack", target="player", name=action["phrase"],
+                      amount=dealt[0][1], critical=critical)
+            self._after_hit(side, dealt)
+
+        elif action["type"] == "ability":
+            effect = action["effect"]
+            spec = EFFECTS.get(effect)
+            raw_dmg = int(enemy.effective_attack * action["multiplier"])
+            if spec and spec.pre_hit:
+                raw_dmg = spec.pre_hit(self, side, raw_dmg, None)
+            dealt, _ = self._strike(side, raw_dmg, False, "ability", spec)
+            self.emit(side, "ability", target="player",
+                      name=action["ability_name"], amount=dealt[0][1])
+            self._after_hit(side, dealt)
+            apply_effect(self, side, effect)
+
+        self._sync_speed()
+        self._check_outcome()
+        return self.events[start:]
+
+    def end_turn(self):
+        """Advance cooldowns and the turn counter."""
+        self.player.tick_cooldowns()
+        for enemy in self.enemies:
+            enemy.tick_cooldowns()
+        self.turn += 1
+
+    def finish(self) -> CombatResult:
+        """Apply post-combat rewards and return the result."""
+        player = self.player
+        result = CombatResult(self.outcome, self.turn, self.events)
+
+        if self.outcome == "victory":
+            player.kills += len(self.enemies)
+            result.xp_messages = player.gain_xp(sum(e.xp_reward for e in self.enemies))
+            result.gold = sum(e.gold_reward for e in self.enemies)
+            player.earn_gold(result.gold, "combat")
+            for enemy in self.enemies:
+                for item in enemy.generate_loot(self.loot_rng):
+                    ok, msg = player.add_to_inventory(item)
+                    result.loot.append((item, msg))
+
+        if self.outcome != "defeat":
+            for name in COMBAT_BUFFS:
+                player.remove_status(name)
+
+        return result
+
+    def combatant(self, side: str):
+        return self.sides[side]
+
+    def opponent(self, side: str):
+        return self.sides[self.target] if side == "player" else self.player
+
+    def other(self, side: str) -> str:
+        return self.target if side == "player" else "player"
+
+    def emit(self, actor: str, kind: str, **fields):
+        """Record an event for the renderer (and the transcript, if one is attached)."""
+        ev = CombatEvent(self.turn, actor, kind, **fields)
+        self.events.append(ev)
+        if self.transcript is not None:
+            self.transcript.record_event(ev)
+
+    def check_low_hp(self, side: str):
+        """Fire on_low_hp hooks if the combatant on that side dropped below the threshold."""
+        c = self.combatant(side)
+        if c.current_hp < LOW_HP_THRESHOLD and c.statuses.mask & HOOK_MASK:
+            refresh_hooks(c)
+            for hook in c.on_low_hp:
+                hook(self, side)
+
+
+    def _sync_speed(self):
+        """Push haste/slow changes to the scheduler. One mask test per side when nothing changed."""
+        speed_bits = self._speed_bits
+        for side, c in self.sides.items():
+            bits = c.statuses.mask & (_HASTE | _SLOW)
+            if bits != speed_bits[side]:
+                speed_bits[side] = bits
+                rate = (HASTE_RATE if bits & _HASTE else 1.0) * (SLOW_RATE if bits & _SLOW else 1.0)
+                self.scheduler.set_rate(side, rate)
+
+    def _check_outcome(self):
+        if not self.player.is_alive:
+            self.outcome = "defeat"
+        elif not self.enemy.is_alive:
+            living = self.living_enemies()
+            if living:
+                self.target = living[0]
+            else:
+                self.outcome = "victory"
+
+    def _player_attack(self):
+        player, enemy = self.player, self.enemy
+        weapon = player.equipped_weapon
+        damage, critical = self.rules.damage(
+            player.effective_attack,
+            player.stat_by_name(player.char_class.primary_stat),
+            enemy.effective_defense,
+            weapon.damage_min if weapon else 3,
+            weapon.damage_max if weapon else 8,
+            player.dexterity,
+            self.rng,
+        )
+        dealt, critical = self._strike("player", damage, critical, "attack")
+        self.emit("player", "attack", target=dealt[0][0], amount=dealt[0][1], critical=critical)
+        self._after_hit("player", dealt)
+
+    def _player_ability(self, ability: Ability):
+        player = self.player
+        ok, reason = player.use_ability(ability)
+        if not ok:
+            self.emit("player", "ability_failed", name=reason)
+            return
+
+        healed = player.heal(ability.heal_amount) if ability.heal_amount > 0 else 0
+        spec = EFFECTS.get(ability.effect)
+        dealt = [(self.target, 0)]
+        hit = ability.damage_base > 0 or (spec is not None and spec.deals_damage)
+        if hit:
+            stat_val = player.stat_by_name(ability.stat_used)
+            raw_dmg = int(ability.damage_base + stat_val * ability.damage_scale)
+            if spec and spec.pre_hit:
+                raw_dmg = spec.pre_hit(self, "player", raw_dmg, ability)
+            dealt, _ = self._strike("player", raw_dmg, False, "ability", spec, ability.hits)
+
+        self.emit("player", "ability", target=dealt[0][0], name=ability.name,
+                  amount=dealt[0][1], healed=healed, data=ability)
+        for side, amount in dealt[1:]:
+            self.emit("player", "hit", target=side, amount=amount)
+        if hit:
+            self._after_hit("player", dealt)
+        apply_effect(self, "player", ability.effect)
+
+    def _strike(self, side: str, damage: int, critical: bool, kind: str,
+                spec: Optional[EffectSpec] = None, hits: int = 0) -> tuple[list[tuple[str, int]], bool]:
+        """
+        Run the attacker's on_attack hooks, then land the hit(s): hits blows,
+        or the spec's count when hits is 0.
+        Returns ([(defender side, damage dealt), ...] with the main target first, critical).
+        Area and multi-hit blows from the player are spread over the pack and
+        resolved in one take_damage_batch call.
+        """
+        attacker = self.sides[side]
+        if attacker.statuses.mask & HOOK_MASK:
+            refresh_hooks(attacker)
+            for hook in attacker.on_attack:
+                damage, critical = hook(self, side, damage, critical, kind)
+
+        if not hits:
+            hits = spec.hits if spec else 1
+        area = spec is not None and spec.area
+        if side != "player" or (hits == 1 and not area):
+            target = self.other(side)
+            defender = self.sides[target]
+            if hits == 1:
+                return [(target, defender.take_damage(damage))], critical
+            return [(target, take_damage_batch([defender], damage, [hits])[0])], critical
+
+        order = [self.target] + [s for s in self.living_enemies() if s != self.target]
+        n = len(order)
+        if area:
+            counts = [hits] * n
+        else:
+            counts = [hits // n + (1 if i < hits % n else 0) for i in range(n)]
+        dealt = take_damage_batch([self.sides[s] for s in order], damage, counts)
+        return [(s, d) for s, d, c in zip(order, dealt, counts) if c], critical
+
+    def _after_hit(self, side: str, dealt: list[tuple[str, int]]):
+        """Run each defender's on_hit and on_low_hp hooks after an attack from side."""
+        for other, actual in dealt:
+            defender = self.sides[other]
+            if defender.statuses.mask & HOOK_MASK:
+                refresh_hooks(defender)
+                for hook in defender.on_hit:
+                    hook(self, other, side, actual)
+            self.check_low_hp(other)
+
+
+class CombatSession:
+    """
+    One fight as an explicit state machine over a CombatEngine, advanced
+    one phase at a time with no recursion and no blocking loop:
+
+        tick -> await_action -> resolve_player -> resolve_enemy ... -> tick
+                (any phase) -> over
+
+    await_action waits for submit(action); every other phase runs on step(),
+    which returns the events it produced. actor is the side whose action
+    is pending. Once over, the rewards are applied and result is set.
+    """
+
+    def __init__(self, engine: CombatEngine):
+        self.engine = engine
+        self.phase = TICK
+        self.actor: str | None = None
+        self.action: dict | None = None
+        self.result: CombatResult | None = None
+
+    @property
+    def needs_input(self) -> bool:
+        return self.phase == AWAIT_ACTION
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot between steps. A submitted but unresolved action is not
+        kept: the fight resumes asking the player again.
+        """
+        phase = AWAIT_ACTION if self.phase == RESOLVE_PLAYER else self.phase
+        return {"phase": phase, "actor": self.actor, "engine": self.engine.to_dict()}
+
+    @classmethod
+    def from_dict(cls, player: Player, data: dict, rng=None, loot_rng=None,
+                  use_planner: bool = ENEMY_PLANNER) -> "CombatSession":
+        if data["phase"] == OVER:
+            raise ValueError("Cannot resume a finished fight")
+        session = cls(CombatEngine.from_dict(player, data["engine"], rng=rng, loot_rng=loot_rng,
+                                             use_planner=use_planner))
+        session.phase = data["phase"]
+        session.actor = data["actor"]
+        return session
+
+    def submit(self, action: dict):
+        """Hand in the player's action dict (see CombatEngine.player_action)."""
+        if self.phase != AWAIT_ACTION:
+            raise RuntimeError(f"Not waiting for a player action (phase: {self.phase})")
+        self.action = action
+        self.phase = RESOLVE_PLAYER
+
+    def step(self) -> list[CombatEvent]:
+        """Run the current phase and move on to the next one."""
+        engine = self.engine
+        if self.phase == TICK:
+            events = engine.begin_turn()
+        elif self.phase == RESOLVE_PLAYER:
+            action, self.action = self.action, None
+            events = engine.player_action(action)
+        elif self.phase == RESOLVE_ENEMY:
+            events = engine.enemy_action(self.actor)
+        else:
+            raise RuntimeError(f"Nothing to step in phase {self.phase}")
+        self._advance()
+        return events
+
+    def _advance(self):
+        engine = self.engine
+        side = engine.next_actor()
+        if side is not None:
+            self.actor = side
+            self.phase = AWAIT_ACTION if side == "player" else RESOLVE_ENEMY
+            return
+        self.actor = None
+        if engine.outcome is None:
+            engine.end_turn()
+            self.phase = TICK
+        else:
+            self.result = engine.finish()
+            self.phase = OVER
+
+
+def calculate_damage(
+    attacker_attack: int,
+    attacker_stat: int,
+    defender_defense: int,
+    damage_min: int,
+    damage_max: int,
+    crit_stat: int,
+    rng=random,
+) -> tuple[int, bool]:
+    """
+    Calculate raw damage and whether it was a critical hit, under the active rules.
+    Returns (damage, is_critical).
+    """
+    return active_rules().damage(attacker_attack, attacker_stat, defender_defense,
+                                 damage_min, damage_max, crit_stat, rng)
+
+
+def flee_chance(player: Player, enemy: Enemy) -> float:
+    """Probability that one flee attempt from this enemy succeeds."""
+    return active_rules().flee_chance(player.dexterity, enemy.dexterity)
+
+
+def attempt_flee(player: Player, enemy: Enemy, rng=random) -> bool:
+    """Calculate and resolve a flee attempt."""
+    return rng.random() < flee_chance(player, enemy)
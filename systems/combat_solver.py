@@ -0,0 +1,304 @@
+import gc
+import random
+import sys
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from data.enemies import EnemyTemplate
+from data.rules import Rules, active_rules
+from entities.enemy import ABILITY_ROLL, Enemy
+from entities.player import Player
+from systems.combat_engine import flee_chance
+from systems.enemy_ai import PlannerModel, root_state
+from systems.initiative import InitiativeScheduler, initiative, ROUND_TICKS
+
+
+_DEFEAT = (0.0, 1.0, 0.0, 0.0)
+
+
+class CombatOdds(NamedTuple):
+    """Exact outcome of a fight under a fixed player policy."""
+    victory: float
+    defeat: float
+    fled: float
+    expected_hp: float
+
+
+def _variance(reduced: int, low: float, high: float) -> list[tuple[int, float]]:
+    """Distribution of int(reduced * uniform(low, high))."""
+    lo, hi = reduced * low, reduced * high
+    out = []
+    for k in range(int(lo), int(hi) + 1):
+        width = min(hi, k + 1) - max(lo, k)
+        if width > 0:
+            out.append((k, width / (hi - lo)))
+    return out
+
+
+def damage_distribution(attack: int, stat: int, defense: int, damage_min: int, damage_max: int,
+                        crit_stat: int, target_defense: int,
+                        rules: Rules | None = None) -> tuple[tuple[int, float], ...]:
+    """
+    Exact distribution of the damage a calculate_damage roll lands after take_damage.
+    Uses the active rules unless a Rules set is given.
+    Returns ((damage, probability), ...) in increasing damage order.
+    """
+    r = rules or active_rules().rules
+    hi = max(damage_min + 1, damage_max)
+    p_base = 1 / (hi - damage_min + 1)
+    pc = max(r.crit_floor, r.crit_base + (crit_stat - r.crit_pivot) * r.crit_per_point)
+    dist: dict[int, float] = {}
+    for base in range(damage_min, hi + 1):
+        reduced = max(1, attack + base + stat // r.stat_divisor - defense // r.defense_divisor)
+        for rolled, p in ((reduced, 1 - pc), (int(reduced * r.crit_multiplier), pc)):
+            for final, q in _variance(rolled, r.variance_low, r.variance_high):
+                dealt = max(1, max(1, final) - target_defense)
+                dist[dealt] = dist.get(dealt, 0.0) + p_base * p * q
+    return tuple(sorted(dist.items()))
+
+
+@dataclass(frozen=True)
+class SolverModel:
+    """
+    Everything constant over one player-vs-enemy fight.
+    The player follows a fixed policy: swing the weapon every turn, and try
+    to flee instead whenever HP is below flee_hp. The enemy picks abilities
+    by the same roll as Enemy.choose_action without a planner.
+    """
+    base: PlannerModel
+    p_hit: tuple[tuple[int, float], ...]
+    e_hit: tuple[tuple[int, float], ...]
+    always_ability: bool
+    flee: float
+    flee_hp: int
+    reference: int
+    p_speed: tuple[int, int]
+    e_speed: tuple[int, int]
+
+    @classmethod
+    def from_combat(cls, player: Player, enemy: Enemy, flee_below: float = 0.0) -> "SolverModel":
+        weapon = player.equipped_weapon
+        p_hit = damage_distribution(
+            player.effective_attack, player.stat_by_name(player.char_class.primary_stat),
+            enemy.effective_defense,
+            weapon.damage_min if weapon else 3, weapon.damage_max if weapon else 8,
+            player.dexterity, enemy.effective_defense,
+        )
+        e_hit = damage_distribution(
+            enemy.effective_attack, enemy.strength, player.effective_defense,
+            max(1, enemy.base_attack // 3), max(2, enemy.base_attack // 2),
+            enemy.dexterity, player.effective_defense,
+        )
+        p_init, e_init = initiative(player), initiative(enemy)
+        return cls(
+            PlannerModel.from_combat(enemy, player), p_hit, e_hit,
+            enemy.template.tier >= 3, flee_chance(player, enemy),
+            int(player.max_hp * flee_below), min(p_init, e_init),
+            (p_init, player.dexterity), (e_init, enemy.dexterity),
+        )
+
+
+class CombatSolver:
+    """
+    Exact victory / defeat / flee odds for one Player against one Enemy.
+
+    The fight is a Markov chain over (player hp, enemy hp, enemy mp,
+    ability cooldowns, player DoT turns, enemy evade, turn-order phase);
+    every state's value is computed once and memoised, each chance node
+    weighting its children by the real damage and AI-choice probabilities.
+    The phase is where both sides sit in the initiative schedule at the
+    start of a round, so faster enemies get their extra turns exactly as
+    the engine gives them.
+    """
+
+    def __init__(self, model: SolverModel):
+        self.model = model
+        self.table: dict[int, tuple] = {}
+        self._contexts: dict[tuple, int] = {}
+        self._rounds: dict[tuple, tuple] = {}
+
+    def solve(self, state: tuple) -> CombatOdds:
+        """Odds from a root_state() tuple at the start of a fresh fight."""
+        p_hp, e_hp, mp, cooldowns, dots, evade = state
+        # Values recurse once per action, so deep fights need more than the default stack.
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 20_000))
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            win, loss, fled, hp = self._begin_turn(p_hp, e_hp, mp, cooldowns, dots, evade, (0, 0))
+        finally:
+            sys.setrecursionlimit(limit)
+            if gc_enabled:
+                gc.enable()
+        return CombatOdds(win, loss, fled, hp)
+
+    @property
+    def states(self) -> int:
+        return len(self.table)
+
+    def _context(self, ctx: tuple) -> int:
+        """
+        Small id for everything in a state but the two HP values, so table
+        keys are plain ints: id << 40 | player hp << 20 | enemy hp.
+        """
+        cid = self._contexts.get(ctx)
+        if cid is None:
+            cid = self._contexts[ctx] = len(self._contexts) << 40
+        return cid
+
+    def _schedule(self, phase: tuple[int, int]) -> tuple[tuple[str, ...], tuple[int, int]]:
+        """Who acts this round, in order, and the phase the next round starts in."""
+        cached = self._rounds.get(phase)
+        if cached is not None:
+            return cached
+        m = self.model
+        scheduler = InitiativeScheduler(m.reference)
+        scheduler.add("player", *m.p_speed, at=phase[0])
+        scheduler.add("enemy", *m.e_speed, at=phase[1])
+        order = []
+        while scheduler.peek_time() < ROUND_TICKS:
+            order.append(scheduler.pop())
+        cached = (tuple(order), (scheduler.next_time("player") - ROUND_TICKS,
+                                 scheduler.next_time("enemy") - ROUND_TICKS))
+        self._rounds[phase] = cached
+        return cached
+
+    def _begin_turn(self, p_hp, e_hp, mp, cooldowns, dots, evade, phase) -> tuple:
+        """Status ticks at the start of a round, then the round's first action."""
+        if any(dots):
+            dot_damage = self.model.base.dot_damage
+            for slot, turns in enumerate(dots):
+                if turns:
+                    p_hp -= dot_damage[slot]
+            if p_hp <= 0:
+                return _DEFEAT
+            dots = tuple(turns - 1 if turns else 0 for turns in dots)
+        if evade:
+            evade -= 1
+        ctx = (mp, cooldowns, dots, evade, phase, 0)
+        return self._node(p_hp, e_hp, ctx, self._context(ctx))
+
+    def _node(self, p_hp: int, e_hp: int, ctx: tuple, cid: int) -> tuple:
+        """Value of a state: (P(victory), P(defeat), P(fled), E[player hp at the end])."""
+        key = cid | p_hp << 20 | e_hp
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+
+        mp, cooldowns, dots, evade, phase, step = ctx
+        order, next_phase = self._schedule(phase)
+        if step == len(order):
+            cooldowns = tuple(cd - 1 if cd > 0 else 0 for cd in cooldowns)
+            value = self._begin_turn(p_hp, e_hp, mp, cooldowns, dots, evade, next_phase)
+        else:
+            after = (mp, cooldowns, dots, evade, phase, step + 1)
+            if order[step] == "player":
+                value = self._player(p_hp, e_hp, after)
+            else:
+                value = self._enemy(p_hp, e_hp, after)
+        self.table[key] = value
+        return value
+
+    def _player(self, p_hp: int, e_hp: int, ctx: tuple) -> tuple:
+        m = self.model
+        if p_hp < m.flee_hp:
+            stay = self._node(p_hp, e_hp, ctx, self._context(ctx))
+            f = m.flee
+            return (stay[0] * (1 - f), stay[1] * (1 - f), f + stay[2] * (1 - f),
+                    f * p_hp + stay[3] * (1 - f))
+        mp, cooldowns, dots, evade, phase, step = ctx
+        if evade:
+            ctx = (mp, cooldowns, dots, 0, phase, step)
+            return self._node(p_hp, e_hp, ctx, self._context(ctx))
+
+        cid = self._context(ctx)
+        base = cid | p_hp << 20
+        table, node = self.table, self._node
+        win = loss = fled = hp = 0.0
+        for damage, p in m.p_hit:
+            left = e_hp - damage
+            if left <= 0:
+                win += p
+                hp += p * p_hp
+                continue
+            value = table.get(base | left)
+            if value is None:
+                value = node(p_hp, left, ctx, cid)
+            w, l, f, h = value
+            win += p * w
+            loss += p * l
+            fled += p * f
+            hp += p * h
+        return win, loss, fled, hp
+
+    def _enemy(self, p_hp: int, e_hp: int, ctx: tuple) -> tuple:
+        m = self.model
+        mp, cooldowns, dots, evade, phase, step = ctx
+        abilities = [ab for ab in m.base.abilities
+                     if cooldowns[ab.index] <= 0 and mp >= ab.cost]
+        share = 0.0
+        if abilities:
+            share = (1.0 if m.always_ability else ABILITY_ROLL) / len(abilities)
+        attack = 1.0 - share * len(abilities)
+
+        win = loss = fled = hp = 0.0
+        if attack > 1e-12:
+            cid = self._context(ctx)
+            table, node = self.table, self._node
+            for damage, p in m.e_hit:
+                left = p_hp - damage
+                if left <= 0:
+                    loss += attack * p
+                    continue
+                value = table.get(cid | left << 20 | e_hp)
+                if value is None:
+                    value = node(left, e_hp, ctx, cid)
+                w, l, f, h = value
+                p *= attack
+                win += p * w
+                loss += p * l
+                fled += p * f
+                hp += p * h
+
+        for ab in abilities:
+            left = p_hp - ab.damage
+            if left <= 0:
+                loss += share
+                continue
+            cds = cooldowns[:ab.index] + (m.base.cooldown,) + cooldowns[ab.index + 1:]
+            ds = dots
+            if ab.dot_slot >= 0:
+                ds = (dots[:ab.dot_slot] + (max(dots[ab.dot_slot], ab.dot_turns),)
+                      + dots[ab.dot_slot + 1:])
+            after = (max(0, mp - ab.cost), cds, ds, max(evade, ab.evade_turns), phase, step)
+            w, l, f, h = self._node(left, min(m.base.e_max, e_hp + ab.heal), after, self._context(after))
+            win += share * w
+            loss += share * l
+            fled += share * f
+            hp += share * h
+        return win, loss, fled, hp
+
+
+_CACHE: dict[tuple, CombatOdds] = {}
+
+
+def solve(player: Player, enemy: Enemy, flee_below: float = 0.0) -> CombatOdds:
+    """
+    Exact odds for the player, as they stand now, against this enemy.
+    flee_below is the HP fraction under which the player tries to flee.
+    Results are cached per matchup and starting state.
+    """
+    model = SolverModel.from_combat(player, enemy, flee_below)
+    state = root_state(enemy, player)
+    key = (model, state)
+    odds = _CACHE.get(key)
+    if odds is None:
+        odds = _CACHE[key] = CombatSolver(model).solve(state)
+    return odds
+
+
+def solve_matchup(player: Player, template: EnemyTemplate, floor: int,
+                  flee_below: float = 0.0) -> CombatOdds:
+    """Odds against a fresh enemy built from template the way floor `floor` spawns it."""
+    return solve(player, Enemy(template, level_modifier=floor - 1, rng=random.Random(0)), flee_below)
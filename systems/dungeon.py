@@ -3,10 +3,13 @@ from dataclasses import dataclass, field
 from typing import Callable
 
 from entities.player import Player
+from entities.character import STAT_KEYS, STAT_INDEX
 from entities.enemy import Enemy
-from data.enemies import get_random_enemy, get_boss, ENEMIES
+from data.enemies import get_random_pack, get_boss, tier_for_floor, boss_key_for_floor, ENEMIES
 from data.items import ALL_ITEMS, POTIONS, MISC_ITEMS
-from systems.combat import run_combat
+from data.rules import active_rules
+from systems.combat import run_combat, auto_resolve_combat, resume_combat
+from systems.combat_engine import CombatSession
 from systems.inventory import show_inventory
 from utils.display import (
     box_top, box_bottom, box_row, box_separator,
@@ -15,7 +18,7 @@ from utils.display import (
 )
 from utils.save_load import save_game
 from utils.namegen import generate_dungeon_name, generate_floor_name, generate_room_name
-from config import DUNGEON_ROOMS
+from config import DUNGEON_ROOMS, AUTO_BATTLE
 from utils.lang import t, item_desc
 
 
@@ -44,8 +47,11 @@ class Room:
     grid_y: int = 0
 
 
-def generate_floor(floor_number: int) -> list[Room]:
-    """Generate a randomized list of rooms for a dungeon floor."""
+def generate_floor(floor_number: int, rng=random, names=random) -> list[Room]:
+    """
+    Generate a randomized list of rooms for a dungeon floor.
+    rng drives the layout, names the room names and descriptions.
+    """
     rooms = []
     for i in range(1, DUNGEON_ROOMS + 1):
         is_last = (i == DUNGEON_ROOMS)
@@ -57,23 +63,22 @@ def generate_floor(floor_number: int) -> list[Room]:
             elif i == 6:
                 rtype = "treasure"
             else:
-                rtype = random.choice(ROOM_TYPES[:-1])
+                rtype = rng.choice(ROOM_TYPES[:-1])
 
         rooms.append(Room(
             number=i,
             room_type=rtype,
             is_last=is_last,
-            description=_generate_room_description(rtype),
-            name=generate_room_name(rtype),
+            description=_generate_room_description(rtype, names),
+            name=generate_room_name(rtype, names),
             grid_x=(i - 1) % 5,
             grid_y=(i - 1) // 5,
         ))
     return rooms
 
 
-def _generate_room_description(room_type: str) -> str:
+def _generate_room_description(room_type: str, rng=random) -> str:
     """Generate atmospheric room descriptions using current language."""
-    import random
     pools = {
         "combat":   ["room_desc_combat_1","room_desc_combat_2","room_desc_combat_3","room_desc_combat_4","room_desc_combat_5"],
         "treasure": ["room_desc_treasure_1","room_desc_treasure_2","room_desc_treasure_3","room_desc_treasure_4"],
@@ -84,7 +89,7 @@ def _generate_room_description(room_type: str) -> str:
         "boss":     ["room_desc_boss"],
     }
     pool = pools.get(room_type, pools["combat"])
-    return random.choice(pool)
+    return rng.choice(pool)
 
 
 def run_dungeon_floor(player: Player) -> str:
@@ -93,7 +98,8 @@ def run_dungeon_floor(player: Player) -> str:
     Returns: "next_floor" | "game_over" | "quit"
     """
     floor = player.dungeon_floor
-    rooms = generate_floor(floor)
+    player.rng.begin_floor(floor)
+    rooms = generate_floor(floor, player.rng.floor, player.rng.names)
 
     _draw_floor_intro(floor, player)
     _draw_dungeon_map(rooms, current_room=0)
@@ -110,25 +116,59 @@ def run_dungeon_floor(player: Player) -> str:
         if result == "quit":
             return "quit"
         if result == "floor_complete":
-            player.dungeon_floor += 1
-            player.floors_cleared += 1
-            msgs = player.quest_manager.check_and_reward(
-                player,
-                player_kills=player.kills,
-                player_floors=player.floors_cleared,
-                player_level=player.level,
-            )
-            for m in msgs:
-                print_message(m, "good" if ("MISIÓN" in m or "QUEST" in m) else "normal")
-            if msgs:
-                press_enter()
-            return "next_floor"
+            return _complete_floor(player)
 
         save_game(player.to_dict())
 
     return "next_floor"
 
 
+def _complete_floor(player: Player) -> str:
+    """Move the player down a floor and hand out floor quest rewards."""
+    player.dungeon_floor += 1
+    player.floors_cleared += 1
+    msgs = player.quest_manager.check_and_reward(
+        player,
+        player_kills=player.kills,
+        player_floors=player.floors_cleared,
+        player_level=player.level,
+    )
+    for m in msgs:
+        print_message(m, "good" if ("MISIÓN" in m or "QUEST" in m) else "normal")
+    if msgs:
+        press_enter()
+    return "next_floor"
+
+
+def resume_saved_combat(player: Player, snapshot: dict) -> str:
+    """
+    Finish a fight that was saved mid-combat, then carry on as its room would.
+    Returns: "continue" | "game_over" | "next_floor"
+    """
+    room = snapshot["room"]
+    session = CombatSession.from_dict(player, snapshot, rng=player.rng.combat, loot_rng=player.rng.loot)
+    result = resume_combat(player, session, checkpoint=_combat_checkpoint(player, room))
+
+    if room == "boss":
+        outcome = _boss_aftermath(player, player.dungeon_floor, session.engine.enemy, result)
+    else:
+        outcome = _combat_aftermath(player, session.engine.enemies, result)
+
+    if outcome == "game_over":
+        return "game_over"
+    if outcome == "floor_complete":
+        return _complete_floor(player)
+    save_game(player.to_dict())
+    return "continue"
+
+
+def _combat_checkpoint(player: Player, room: str):
+    """run_combat checkpoint that saves the fight in progress together with the player."""
+    def save(session: CombatSession):
+        save_game({**player.to_dict(), "combat": {"room": room, **session.to_dict()}})
+    return save
+
+
 def _enter_room(player: Player, room: Room, floor: int) -> str:
     """Handle a single room encounter. Returns outcome string."""
     _draw_room_header(room, floor)
@@ -151,25 +191,38 @@ def _enter_room(player: Player, room: Room, floor: int) -> str:
 
 
 def _room_combat(player: Player, floor: int) -> str:
-    """Spawn and fight a random enemy appropriate to the floor."""
-    tier = min(3, 1 + (floor - 1) // 3)
-    template = get_random_enemy(tier)
+    """Spawn and fight a random enemy, or a pack of them, appropriate to the floor."""
+    tier = tier_for_floor(floor)
     level_mod = floor - 1
-    enemy = Enemy(template, level_modifier=level_mod)
+    pack = [Enemy(template, level_modifier=level_mod, rng=player.rng.loot)
+            for template in get_random_pack(tier, player.rng.floor)]
+    _label_pack(pack)
 
     options = [t("combat_enter_combat"), t("combat_check_inv")]
+    if AUTO_BATTLE:
+        options.append(t("combat_auto"))
     choice = prompt_choice(options, t("camp_prompt"))
 
     if choice == 1:
         show_inventory(player)
 
-    result = run_combat(player, enemy)
+    if choice == 2:
+        result = auto_resolve_combat(player, pack)
+    else:
+        result = run_combat(player, pack, checkpoint=_combat_checkpoint(player, "combat"))
+
+    return _combat_aftermath(player, pack, result)
+
 
+def _combat_aftermath(player: Player, pack: list[Enemy], result: str) -> str:
+    """Quest bookkeeping once a room fight is over."""
     if result == "defeat":
         return "game_over"
 
     if result == "victory":
-        msgs = player.quest_manager.on_enemy_killed(enemy)
+        msgs = []
+        for enemy in pack:
+            msgs += player.quest_manager.on_enemy_killed(enemy)
         msgs += player.quest_manager.check_and_reward(
             player,
             player_kills=player.kills,
@@ -187,6 +240,17 @@ def _room_combat(player: Player, floor: int) -> str:
     return "continue"
 
 
+def _label_pack(pack: list[Enemy]):
+    """Tell apart same-named enemies in a pack: "Orc Warrior A", "Orc Warrior B"."""
+    names = [e.name for e in pack]
+    seen: dict[str, int] = {}
+    for enemy in pack:
+        if names.count(enemy.name) > 1:
+            n = seen.get(enemy.name, 0)
+            seen[enemy.name] = n + 1
+            enemy.name = f"{enemy.name} {chr(ord('A') + n)}"
+
+
 def _room_treasure(player: Player, floor: int) -> str:
     """Generate and offer treasure."""
     print_message(t("dungeon_treasure_found"), "good")
@@ -199,13 +263,13 @@ def _room_treasure(player: Player, floor: int) -> str:
     else:
         item_pool = [i for i in ALL_ITEMS.values() if i.rarity == "common"]
 
-    gold_found = random.randint(20 * floor, 60 * floor)
+    gold_found = player.rng.events.randint(20 * floor, 60 * floor)
     print_message(t("dungeon_gold_found", amount=clr(str(gold_found), Color.YELLOW)), "good")
-    player.earn_gold(gold_found)
+    player.earn_gold(gold_found, "treasure")
     player.quest_manager.on_gold_earned(gold_found)
 
-    num_items = random.randint(1, 3)
-    found_items = random.sample(item_pool, min(num_items, len(item_pool)))
+    num_items = player.rng.events.randint(1, 3)
+    found_items = player.rng.events.sample(item_pool, min(num_items, len(item_pool)))
 
     for item in found_items:
         rarity_colors = {"common": Color.WHITE, "uncommon": Color.GREEN,
@@ -228,8 +292,9 @@ def _room_rest(player: Player, floor: int) -> str:
     print_message(t("dungeon_rest_found"), "good")
     print()
 
-    heal_amount = int(player.max_hp * 0.35)
-    mp_amount   = int(player.max_mp * 0.40)
+    rules = active_rules().rules
+    heal_amount = int(player.max_hp * rules.rest_heal_hp)
+    mp_amount   = int(player.max_mp * rules.rest_heal_mp)
 
     restored_hp = player.heal(heal_amount)
     restored_mp = player.restore_mp(mp_amount)
@@ -264,7 +329,7 @@ def _room_merchant(player: Player, floor: int) -> str:
     else:
         stock_pool = [i for i in ALL_ITEMS.values() if i.rarity == "common" and i.value > 0]
 
-    stock = random.sample(stock_pool, min(stock_count, len(stock_pool)))
+    stock = player.rng.shop.sample(stock_pool, min(stock_count, len(stock_pool)))
 
     while True:
         _draw_merchant_menu(player, stock)
@@ -315,7 +380,7 @@ def _merchant_buy(player: Player, stock: list):
         return
     item = stock[choice]
     price = int(item.value * 1.4)
-    if player.spend_gold(price):
+    if player.spend_gold(price, "merchant_buy"):
         ok, msg = player.add_to_inventory(item)
         print_message(msg if ok else t("dungeon_bag_full"), "good" if ok else "warning")
     else:
@@ -336,7 +401,7 @@ def _merchant_sell(player: Player):
     item = player.inventory[choice]
     sell_price = int(item.value * 0.6)
     player.remove_from_inventory(item)
-    player.earn_gold(sell_price)
+    player.earn_gold(sell_price, "merchant_sell")
     print_message(t("dungeon_sold", item=item.name, price=sell_price), "good")
     press_enter()
 
@@ -346,7 +411,7 @@ def _room_trap(player: Player, floor: int) -> str:
     print_message(t("dungeon_trap_sense"), "warning")
     print()
 
-    dex_roll = random.randint(1, 20) + (player.dexterity - 10) // 2
+    dex_roll = player.rng.events.randint(1, 20) + (player.dexterity - 10) // 2
     threshold = 12 + floor
 
     if dex_roll >= threshold:
@@ -354,7 +419,8 @@ def _room_trap(player: Player, floor: int) -> str:
         print_message(t("dungeon_trap_avoided_msg"), "good")
         player.quest_manager.on_trap_avoided()
     else:
-        damage = random.randint(5 * floor, 10 * floor)
+        rules = active_rules().rules
+        damage = player.rng.events.randint(rules.trap_damage_min * floor, rules.trap_damage_max * floor)
         actual = player.take_damage(damage)
         typewriter(f"  {t('dungeon_trap_hit', damage=actual)}", 0.015)
         print_message(t("dungeon_trap_damage", damage=clr(str(actual), Color.RED)), "bad")
@@ -376,19 +442,20 @@ def _room_mystery(player: Player, floor: int) -> str:
         _mystery_wandering_soul,
         _mystery_enchanted_shrine,
     ]
-    event = random.choice(events)
+    event = player.rng.events.choice(events)
     return event(player, floor)
 
 
 def _mystery_dark_altar(player: Player, floor: int) -> str:
+    rng = player.rng.events
     typewriter(f"  {t('dungeon_altar_event')}", 0.015)
     options = [t("dungeon_altar_offer"), t("dungeon_altar_skip")]
     choice = prompt_choice(options, t("dungeon_altar_prompt"))
     if choice == 0:
         player.current_hp = max(1, player.current_hp - 20)
-        if random.random() < 0.65:
-            bonus = random.randint(10, 30)
-            atk_bonus = random.randint(2, 5)
+        if rng.random() < 0.65:
+            bonus = rng.randint(10, 30)
+            atk_bonus = rng.randint(2, 5)
             player.max_hp += bonus
             player.base_attack += atk_bonus
             print_message(t("dungeon_altar_power", hp=bonus, atk=atk_bonus), "good")
@@ -414,14 +481,15 @@ def _mystery_magic_fountain(player: Player, floor: int) -> str:
 
 
 def _mystery_cursed_chest(player: Player, floor: int) -> str:
+    rng = player.rng.events
     typewriter(f"  {t('dungeon_chest_event')}", 0.015)
     options = [t("dungeon_chest_take"), t("dungeon_chest_leave")]
     choice = prompt_choice(options, t("dungeon_item_prompt"))
     if choice == 0:
-        gold = random.randint(60 * floor, 160 * floor)
-        player.earn_gold(gold)
-        if random.random() < 0.5:
-            damage = random.randint(15, 35)
+        gold = rng.randint(60 * floor, 160 * floor)
+        player.earn_gold(gold, "cursed_chest")
+        if rng.random() < 0.5:
+            damage = rng.randint(15, 35)
             actual = player.take_damage(damage)
             print_message(t("dungeon_chest_cursed", damage=actual), "bad")
         else:
@@ -433,11 +501,12 @@ def _mystery_cursed_chest(player: Player, floor: int) -> str:
 
 
 def _mystery_wandering_soul(player: Player, floor: int) -> str:
+    rng = player.rng.events
     typewriter(f"  {t('dungeon_ghost_event')}", 0.015)
     print_message(t("dungeon_ghost_gift"), "normal")
     possible = [i for i in ALL_ITEMS.values() if i.rarity in ("uncommon", "rare")]
     if possible:
-        gift = random.choice(possible)
+        gift = rng.choice(possible)
         ok, msg = player.add_to_inventory(gift)
         print_message(t("dungeon_ghost_item", item=clr(gift.name, Color.CYAN)), "good")
     press_enter()
@@ -448,11 +517,12 @@ def _mystery_enchanted_shrine(player: Player, floor: int) -> str:
     typewriter(f"  {t('dungeon_shrine_event')}", 0.015)
     stat_options = [t("dungeon_shrine_str"), t("dungeon_shrine_dex"), t("dungeon_shrine_int"), t("dungeon_shrine_wis"), t("dungeon_shrine_con")]
     choice = prompt_choice(stat_options, t("dungeon_shrine_prompt"))
-    bonuses = {0: ("strength", 2), 1: ("dexterity", 2), 2: ("intelligence", 2),
-               3: ("wisdom", 2), 4: ("constitution", 2)}
-    attr, val = bonuses[choice]
-    current = getattr(player, attr)
-    setattr(player, attr, current + val)
+    bonuses = {0: ("strength", "str", 2), 1: ("dexterity", "dex", 2), 2: ("intelligence", "int", 2),
+               3: ("wisdom", "wis", 2), 4: ("constitution", "con", 2)}
+    attr, stat, val = bonuses[choice]
+    deltas = [0] * len(STAT_KEYS)
+    deltas[STAT_INDEX[stat]] = val
+    player.add_stats(deltas)
     player._recalculate_stats()
     print_message(t("dungeon_shrine_granted", val=val, stat=attr.upper()), "good")
     press_enter()
@@ -465,24 +535,23 @@ def _room_boss(player: Player, floor: int) -> str:
     typewriter(f"  {t('dungeon_boss_stirs')}", 0.014)
     print()
 
-    if floor >= 9:
-        boss_template = get_boss("ancient_demon")
-    elif floor >= 6:
-        boss_template = get_boss("lich")
-    else:
-        boss_template = get_boss("dragon")
+    boss_template = get_boss(boss_key_for_floor(floor))
 
     level_mod = floor
-    boss = Enemy(boss_template, level_modifier=level_mod)
+    boss = Enemy(boss_template, level_modifier=level_mod, rng=player.rng.loot)
 
     press_enter(t("dungeon_boss_press", boss=boss.name))
-    result = run_combat(player, boss)
+    result = run_combat(player, boss, checkpoint=_combat_checkpoint(player, "boss"))
+    return _boss_aftermath(player, floor, boss, result)
+
 
+def _boss_aftermath(player: Player, floor: int, boss: Enemy, result: str) -> str:
+    """A fled boss fight starts over; a won one opens the stairs."""
     if result == "defeat":
         return "game_over"
     elif result == "fled":
         print_message(t("dungeon_boss_sealed"), "bad")
-        result = run_combat(player, boss)
+        result = run_combat(player, boss, checkpoint=_combat_checkpoint(player, "boss"))
         if result == "defeat":
             return "game_over"
 
@@ -503,7 +572,7 @@ def _draw_floor_intro(floor: int, player: Player):
     desc = t(floor_descriptions.get(floor, "floor_1"))
 
     print(box_top())
-    floor_name = generate_floor_name(floor)
+    floor_name = generate_floor_name(floor, player.rng.names)
     floor_word = 'FLOOR' if 'FLOOR' in t('dungeon_map_title') else 'PISO'
     print(box_row(clr(f"{floor_word} {floor} — {floor_name}", Color.MAGENTA), align="center"))
     print(box_separator())
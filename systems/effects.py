@@ -0,0 +1,286 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from entities.character import Character, STATUS_IDS, status_bit
+
+
+LOW_HP_THRESHOLD = 20
+
+HOOK_NAMES = ("on_attack", "on_hit", "on_turn_start", "on_low_hp")
+
+
+@dataclass(frozen=True)
+class EffectSpec:
+    """
+    How a named ability effect resolves in combat.
+    status/duration/value describe the status it applies (if any);
+    hits/area say how many blows land and whether each enemy in a pack takes them
+    (an Ability's own hits count wins over the spec's);
+    pre_hit adjusts the ability's own damage before it lands;
+    after runs once the hit and status are resolved.
+    """
+    status: str = ""
+    duration: int = 0
+    value: int = 0
+    value_pct: float = 0.0
+    label: str = ""
+    on_self: bool = False
+    hits: int = 1
+    area: bool = False
+    deals_damage: bool = False
+    pre_hit: Optional[Callable] = None
+    after: Optional[Callable] = None
+
+
+def _execute_pre_hit(engine, side, raw, ability):
+    target = engine.opponent(side)
+    return raw * 2 if target.hp_percent < 0.30 else raw
+
+
+def _lethal_pre_hit(engine, side, raw, ability):
+    return raw * 3 if engine.opponent(side).has_status("poison") else raw
+
+
+def _armor_pierce_pre_hit(engine, side, raw, ability):
+    ignored = ability.armor_ignored if ability is not None else 1.0
+    return raw + int(engine.opponent(side).effective_defense * ignored)
+
+
+def _ambush_pre_hit(engine, side, raw, ability):
+    return raw * 2
+
+
+def _holy_pre_hit(engine, side, raw, ability):
+    target = engine.opponent(side)
+    if target.is_undead or getattr(target, "art_key", "") == "demon":
+        return int(raw * 1.5)
+    return raw
+
+
+def _mana_burst_pre_hit(engine, side, raw, ability):
+    source = engine.combatant(side)
+    spent = source.current_mp
+    source.current_mp = 0
+    return raw + spent * 2
+
+
+def _drain_after(engine, side):
+    source, target = engine.combatant(side), engine.opponent(side)
+    drained = max(1, int(target.max_hp * 0.08))
+    source.heal(drained)
+    engine.emit(side, "drain", target=engine.other(side), healed=drained)
+
+
+def _steal_after(engine, side):
+    source = engine.combatant(side)
+    if not hasattr(source, "earn_gold"):
+        return
+    gold = engine.rng.randint(20, 80)
+    source.earn_gold(gold, "steal")
+    engine.emit(side, "effect", target=side, name=f"Stole {gold} gold!", amount=gold)
+
+
+def _cleanse_after(engine, side):
+    source = engine.combatant(side)
+    for name in NEGATIVE_STATUSES:
+        source.remove_status(name)
+    engine.emit(side, "effect", target=side, name="Cleansed!")
+
+
+def _blood_pact_after(engine, side):
+    source = engine.combatant(side)
+    cost = min(30, source.current_hp - 1)
+    source.current_hp -= cost
+    engine.emit(side, "effect", target=side, name=f"Blood paid: -{cost} HP", amount=cost)
+
+
+def _apocalypse_after(engine, side):
+    target = engine.opponent(side)
+    dmg = int(target.max_hp * 0.40)
+    target.current_hp = max(0, target.current_hp - dmg)
+    engine.emit(side, "effect", target=engine.other(side),
+                name=f"Doom falls! -{dmg} HP", amount=dmg)
+    engine.check_low_hp(engine.other(side))
+
+
+def _counter_trap_after(engine, side):
+    source = engine.combatant(side)
+    source.set_status_value("counter_trap", int(source.effective_attack * 1.5))
+
+
+def _berserker_attack(engine, side, damage, critical, kind):
+    if engine.combatant(side).hp_percent < 0.5:
+        damage = int(damage * 1.8)
+    return damage, critical
+
+
+def _blood_pact_attack(engine, side, damage, critical, kind):
+    engine.combatant(side).remove_status("blood_pact")
+    return damage * 2, critical
+
+
+def _guaranteed_crit_attack(engine, side, damage, critical, kind):
+    """Every basic attack crits until the status runs out, or for its value in attacks if set."""
+    if kind != "attack":
+        return damage, critical
+    source = engine.combatant(side)
+    charges = source.status_value("guaranteed_crit")
+    if charges == 1:
+        source.remove_status("guaranteed_crit")
+    elif charges > 1:
+        source.set_status_value("guaranteed_crit", charges - 1)
+    if not critical:
+        damage = int(damage * 1.75)
+    return damage, True
+
+
+def _double_cast_attack(engine, side, damage, critical, kind):
+    if kind != "ability":
+        return damage, critical
+    engine.combatant(side).remove_status("double_cast")
+    return damage * 2, critical
+
+
+def _counter_trap_hit(engine, side, attacker_side, actual):
+    owner, attacker = engine.combatant(side), engine.combatant(attacker_side)
+    dmg = owner.status_value("counter_trap")
+    owner.remove_status("counter_trap")
+    attacker.current_hp = max(0, attacker.current_hp - dmg)
+    engine.emit(side, "effect", target=attacker_side, name=f"Trap sprung! -{dmg} HP", amount=dmg)
+    engine.check_low_hp(attacker_side)
+
+
+def _regen_turn(engine, side):
+    c = engine.combatant(side)
+    hp = c.heal(20)
+    mp = c.restore_mp(20)
+    engine.emit(side, "effect", target=side, name=f"Regeneration +{hp} HP +{mp} MP", amount=hp)
+
+
+def _immortal_low_hp(engine, side):
+    c = engine.combatant(side)
+    if c.current_hp < 1:
+        c.current_hp = 1
+        engine.emit(side, "effect", target=side, name="Refuses to die!")
+
+
+def _revive_low_hp(engine, side):
+    c = engine.combatant(side)
+    c.remove_status("revive")
+    restored = c.heal(50)
+    engine.emit(side, "effect", target=side, name=f"Steel will! +{restored} HP", amount=restored)
+
+
+EFFECTS: dict[str, EffectSpec] = {
+    "poison":  EffectSpec("poison",  3, value_pct=0.05, label="Poisoned!"),
+    "burn":    EffectSpec("burn",    2, value_pct=0.06, label="Burning!"),
+    "stun":    EffectSpec("stun",    1, label="Stunned!"),
+    "freeze":  EffectSpec("stun",    2, label="Frozen solid!"),
+    "curse":   EffectSpec("curse",   3, value_pct=0.04, label="Cursed!"),
+    "fear":    EffectSpec("stun",    1, label="Paralyzed with fear!"),
+    "drain":   EffectSpec("curse",   1, label="Life drained!", after=_drain_after),
+    "bleed":   EffectSpec("poison",  2, value_pct=0.04, label="Bleeding!"),
+    "mark":    EffectSpec("mark",    2, label="Marked for death!"),
+    "shield":  EffectSpec("shield",  3, value=30, label="Shielded!", on_self=True),
+    "evade":   EffectSpec("evade",   1, label="Evasion ready!", on_self=True),
+    "rage":    EffectSpec("rage",    3, label="Enraged!", on_self=True),
+    "aura":    EffectSpec("aura",    3, label="Holy Aura!", on_self=True),
+    "empower": EffectSpec("empower", 1, label="Empowered!", on_self=True),
+    "analyze": EffectSpec("analyze", 2, label="Weaknesses found!", on_self=True),
+    "weaken":  EffectSpec("weaken",  3, label="Weakened!"),
+    "slow":    EffectSpec("slow",    3, label="Slowed!"),
+
+    "holy":         EffectSpec(pre_hit=_holy_pre_hit),
+    "multi":        EffectSpec(hits=3),
+    "aoe":          EffectSpec(area=True),
+    "execute":      EffectSpec(pre_hit=_execute_pre_hit),
+    "lethal":       EffectSpec(pre_hit=_lethal_pre_hit),
+    "armor_pierce": EffectSpec(pre_hit=_armor_pierce_pre_hit),
+    "mana_burst":   EffectSpec(deals_damage=True, pre_hit=_mana_burst_pre_hit),
+    "ambush":       EffectSpec("evade", 1, label="Vanishes into the shadows!", on_self=True,
+                               pre_hit=_ambush_pre_hit),
+    "steal":        EffectSpec(after=_steal_after),
+    "cleanse":      EffectSpec(after=_cleanse_after),
+    "apocalypse":   EffectSpec(after=_apocalypse_after),
+
+    "regen":           EffectSpec("regen",           3,  label="Regenerating!",    on_self=True),
+    "immortal":        EffectSpec("immortal",        3,  label="Cannot die!",      on_self=True),
+    "revive":          EffectSpec("revive",          99, label="Steel will ready!", on_self=True),
+    "berserker":       EffectSpec("berserker",       99, label="Berserker!",       on_self=True),
+    "guaranteed_crit": EffectSpec("guaranteed_crit", 3,  label="Weak point found!", on_self=True),
+    "aimed_shot":      EffectSpec("guaranteed_crit", 3,  value=1, label="Eagle eye!", on_self=True),
+    "double_cast":     EffectSpec("double_cast",     3,  label="Spell echo!",      on_self=True),
+    "blood_pact":      EffectSpec("blood_pact",      3,  label="Blood pact!",      on_self=True,
+                                  after=_blood_pact_after),
+    "counter_trap":    EffectSpec("counter_trap",    4,  label="Trap set!",        on_self=True,
+                                  after=_counter_trap_after),
+}
+
+NEGATIVE_STATUSES = ("poison", "burn", "curse", "stun", "mark", "weaken", "slow")
+
+# Self-buffs that only make sense inside one fight; cleared when it ends.
+COMBAT_BUFFS = (
+    "rage", "empower", "evade", "regen", "immortal", "revive", "berserker",
+    "blood_pact", "guaranteed_crit", "double_cast", "counter_trap",
+)
+
+STATUS_HOOKS: dict[str, dict[str, Callable]] = {
+    "berserker":       {"on_attack": _berserker_attack},
+    "blood_pact":      {"on_attack": _blood_pact_attack},
+    "guaranteed_crit": {"on_attack": _guaranteed_crit_attack},
+    "double_cast":     {"on_attack": _double_cast_attack},
+    "counter_trap":    {"on_hit": _counter_trap_hit},
+    "regen":           {"on_turn_start": _regen_turn},
+    "immortal":        {"on_low_hp": _immortal_low_hp},
+    "revive":          {"on_low_hp": _revive_low_hp},
+}
+
+HOOK_MASK = 0
+for _name in STATUS_HOOKS:
+    HOOK_MASK |= status_bit(_name)
+
+_HOOKS_BY_ID: dict[int, dict[str, Callable]] = {
+    STATUS_IDS[name]: hooks for name, hooks in STATUS_HOOKS.items()
+}
+
+
+def refresh_hooks(c: Character):
+    """
+    Recompile a combatant's hook lists if its hooked statuses changed.
+    Costs one mask comparison when nothing changed.
+    """
+    mask = c.statuses.mask & HOOK_MASK
+    if mask == c.hook_mask:
+        return
+    c.hook_mask = mask
+    lists = {name: [] for name in HOOK_NAMES}
+    m = mask
+    while m:
+        low = m & -m
+        m ^= low
+        for hook_name, fn in _HOOKS_BY_ID[low.bit_length() - 1].items():
+            lists[hook_name].append(fn)
+    c.on_attack = lists["on_attack"]
+    c.on_hit = lists["on_hit"]
+    c.on_turn_start = lists["on_turn_start"]
+    c.on_low_hp = lists["on_low_hp"]
+
+
+def apply_effect(engine, side: str, effect: str):
+    """Resolve an ability effect's status and instant parts for the acting side."""
+    spec = EFFECTS.get(effect) if effect else None
+    if spec is None:
+        return
+
+    if spec.status:
+        source, target = engine.combatant(side), engine.opponent(side)
+        if spec.on_self:
+            receiver, receiver_side = source, side
+        else:
+            receiver, receiver_side = target, engine.other(side)
+        value = int(target.max_hp * spec.value_pct) if spec.value_pct else spec.value
+        receiver.add_status(spec.status, spec.duration, value)
+        engine.emit(side, "effect", target=receiver_side, name=spec.label, data=spec.status)
+
+    if spec.after:
+        spec.after(engine, side)
@@ -0,0 +1,267 @@
+import gc
+import time
+from dataclasses import dataclass
+
+from data.rules import Rules, active_rules
+from entities.character import STATUS_IDS, _DOT_FRACTION
+from entities.enemy import Enemy
+from entities.player import Player
+from systems.effects import EFFECTS
+from config import PLANNER_BUDGET_MS, PLANNER_MAX_DEPTH, PLANNER_NODE_BUDGET
+
+
+DOT_STATUSES = ("poison", "burn", "curse")
+_DOT_SLOT = {name: i for i, name in enumerate(DOT_STATUSES)}
+
+WIN = 10.0
+LOSS = -10.0
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def expected_hit(attack: int, stat: int, defense: int, damage_min: int, damage_max: int,
+                 crit_stat: int, target_defense: int, rules: Rules | None = None) -> tuple[int, int, float]:
+    """
+    Mean damage that lands for a calculate_damage roll followed by take_damage.
+    Uses the active rules unless a Rules set is given.
+    Returns (normal hit, critical hit, crit chance).
+    """
+    r = rules or active_rules().rules
+    base = (damage_min + max(damage_min + 1, damage_max)) / 2
+    reduced = max(1, int(attack + base + stat // r.stat_divisor) - defense // r.defense_divisor)
+    crit = int(reduced * r.crit_multiplier)
+    pc = max(r.crit_floor, r.crit_base + (crit_stat - r.crit_pivot) * r.crit_per_point)
+    return max(1, reduced - target_defense), max(1, crit - target_defense), pc
+
+
+@dataclass(frozen=True)
+class PlannerAbility:
+    """One enemy ability reduced to what the search needs."""
+    index: int
+    cost: int
+    damage: int
+    dot_slot: int = -1
+    dot_turns: int = 0
+    heal: int = 0
+    evade_turns: int = 0
+
+
+@dataclass(frozen=True)
+class PlannerModel:
+    """
+    Everything the search treats as constant for one decision.
+    The player is modelled as swinging their weapon every turn; buffs the
+    player applies to themselves are not simulated.
+    """
+    p_max: int
+    e_max: int
+    p_hit: tuple[int, int, float]
+    e_hit: tuple[int, int, float]
+    dot_damage: tuple[int, ...]
+    abilities: tuple[PlannerAbility, ...]
+    cooldown: int
+
+    @classmethod
+    def from_combat(cls, enemy: Enemy, player: Player) -> "PlannerModel":
+        weapon = player.equipped_weapon
+        p_hit = expected_hit(
+            player.effective_attack, player.stat_by_name(player.char_class.primary_stat),
+            enemy.effective_defense,
+            weapon.damage_min if weapon else 3, weapon.damage_max if weapon else 8,
+            player.dexterity, enemy.effective_defense,
+        )
+        e_hit = expected_hit(
+            enemy.effective_attack, enemy.strength, player.effective_defense,
+            max(1, enemy.base_attack // 3), max(2, enemy.base_attack // 2),
+            enemy.dexterity, player.effective_defense,
+        )
+        abilities = []
+        for i, (name, mult, effect, cost) in enumerate(enemy.abilities):
+            spec = EFFECTS.get(effect)
+            hits = spec.hits if spec else 1
+            damage = hits * max(1, int(enemy.effective_attack * mult) - player.effective_defense)
+            dot_slot, dot_turns, heal, evade_turns = -1, 0, 0, 0
+            if spec and spec.status in _DOT_SLOT and not spec.on_self:
+                dot_slot, dot_turns = _DOT_SLOT[spec.status], spec.duration
+            if effect == "drain":
+                heal = max(1, int(player.max_hp * 0.08))
+            if spec and spec.status == "evade":
+                evade_turns = spec.duration
+            abilities.append(PlannerAbility(i, cost, damage, dot_slot, dot_turns, heal, evade_turns))
+
+        dot_damage = tuple(max(1, int(player.max_hp * _DOT_FRACTION[STATUS_IDS[name]]))
+                           for name in DOT_STATUSES)
+        return cls(player.max_hp, enemy.max_hp, p_hit, e_hit, dot_damage,
+                   tuple(abilities), enemy.ability_cooldown)
+
+
+def root_state(enemy: Enemy, player: Player) -> tuple:
+    """
+    Compact combat state: (player hp, enemy hp, enemy mp, cooldowns per ability,
+    remaining turns per player DoT, enemy evade turns).
+    """
+    cooldowns = tuple(max(0, enemy.ability_cooldowns.get(ab[0], 0)) for ab in enemy.abilities)
+    dots = tuple(player.status_duration(name) for name in DOT_STATUSES)
+    return (player.current_hp, enemy.current_hp, enemy.current_mp, cooldowns,
+            dots, enemy.status_duration("evade"))
+
+
+class ExpectimaxPlanner:
+    """
+    Depth-limited expectimax over enemy turns for tier-3 enemies and bosses.
+
+    Max nodes are the enemy's choices (basic attack or an ability); chance
+    nodes are crit / no-crit on both sides. Iterative deepening keeps the
+    best move of the deepest finished search. The search stops after
+    node_budget nodes, which depends only on the fight, or after budget_ms
+    of wall-clock time when node_budget is None, which depends on the
+    machine. Values are cached per (state, depth) and the table survives
+    between turns while the model (stats, equipment, buffs) is unchanged.
+    """
+
+    def __init__(self, budget_ms: float = PLANNER_BUDGET_MS, max_depth: int = PLANNER_MAX_DEPTH,
+                 node_budget: int | None = PLANNER_NODE_BUDGET):
+        self.budget_ms = budget_ms
+        self.max_depth = max_depth
+        self.node_budget = node_budget
+        self.table: dict[tuple, float] = {}
+        self.model: PlannerModel | None = None
+        self.nodes = 0
+        self.lookups = 0
+        self.hits = 0
+        self.last_depth = 0
+        self._deadline = 0.0
+        self._node_limit = 0
+
+    def choose(self, enemy: Enemy, player: Player) -> int | None:
+        """Index into enemy.abilities of the best ability, or None for a basic attack."""
+        self._deadline = time.perf_counter() + self.budget_ms / 1000
+        self._node_limit = self.nodes + (self.node_budget or 0)
+        model = PlannerModel.from_combat(enemy, player)
+        if model != self.model:
+            self.model = model
+            self.table.clear()
+        state = root_state(enemy, player)
+
+        best = None
+        self.last_depth = 0
+        # The search only allocates short-lived tuples; a cyclic GC pass in
+        # the middle of it would blow the budget, so hold it off until we return.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for depth in range(1, self.max_depth + 1):
+                best = self._root(state, depth)
+                self.last_depth = depth
+        except _OutOfTime:
+            pass
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return best
+
+    def _out_of_budget(self) -> bool:
+        if self.node_budget is not None:
+            return self.nodes >= self._node_limit
+        return time.perf_counter() > self._deadline
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def _root(self, state: tuple, depth: int) -> int | None:
+        best_move, best_value = None, float("-inf")
+        for move in self._moves(state):
+            value = self._after_enemy(state, move, depth)
+            if value > best_value:
+                best_move, best_value = move, value
+        return best_move
+
+    def _moves(self, state: tuple) -> list:
+        _, _, mp, cooldowns, _, _ = state
+        moves = [None]
+        for ab in self.model.abilities:
+            if cooldowns[ab.index] <= 0 and mp >= ab.cost:
+                moves.append(ab.index)
+        return moves
+
+    def _max_node(self, state: tuple, depth: int) -> float:
+        key = (state, depth)
+        self.lookups += 1
+        cached = self.table.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        best = float("-inf")
+        for move in self._moves(state):
+            value = self._after_enemy(state, move, depth)
+            if value > best:
+                best = value
+        self.table[key] = best
+        return best
+
+    def _after_enemy(self, state: tuple, move, depth: int) -> float:
+        """Expected value of the enemy taking move, averaged over its outcomes."""
+        model = self.model
+        p_hp, e_hp, mp, cooldowns, dots, evade = state
+
+        if move is None:
+            normal, crit, pc = model.e_hit
+            outcomes = ((1 - pc, p_hp - normal), (pc, p_hp - crit))
+        else:
+            ab = model.abilities[move]
+            mp -= ab.cost
+            cooldowns = cooldowns[:move] + (model.cooldown,) + cooldowns[move + 1:]
+            if ab.dot_slot >= 0:
+                dots = (dots[:ab.dot_slot] + (max(dots[ab.dot_slot], ab.dot_turns),)
+                        + dots[ab.dot_slot + 1:])
+            e_hp = min(model.e_max, e_hp + ab.heal)
+            evade = max(evade, ab.evade_turns)
+            outcomes = ((1.0, p_hp - ab.damage),)
+
+        total = 0.0
+        for prob, hp in outcomes:
+            if hp <= 0:
+                total += prob * (WIN + depth)
+            else:
+                total += prob * self._next_turn((hp, e_hp, mp, cooldowns, dots, evade), depth)
+        return total
+
+    def _next_turn(self, state: tuple, depth: int) -> float:
+        """End of turn, next turn's status ticks, then the player's swing."""
+        self.nodes += 1
+        if not self.nodes & 63 and self._out_of_budget():
+            raise _OutOfTime
+
+        model = self.model
+        p_hp, e_hp, mp, cooldowns, dots, evade = state
+        cooldowns = tuple(cd - 1 if cd > 0 else 0 for cd in cooldowns)
+
+        if any(dots):
+            for slot, turns in enumerate(dots):
+                if turns:
+                    p_hp -= model.dot_damage[slot]
+            dots = tuple(turns - 1 if turns else 0 for turns in dots)
+            if p_hp <= 0:
+                return WIN + depth
+        if evade:
+            evade -= 1
+
+        if evade:
+            outcomes = ((1.0, e_hp, 0),)
+        else:
+            normal, crit, pc = model.p_hit
+            outcomes = ((1 - pc, e_hp - normal, evade), (pc, e_hp - crit, evade))
+
+        total = 0.0
+        for prob, hp, ev in outcomes:
+            if hp <= 0:
+                total += prob * (LOSS - depth)
+            elif depth <= 1:
+                total += prob * (hp / model.e_max - p_hp / model.p_max)
+            else:
+                total += prob * self._max_node((p_hp, hp, mp, cooldowns, dots, ev), depth - 1)
+        return total
@@ -0,0 +1,132 @@
+import heapq
+from itertools import count
+from typing import Hashable
+
+from config import INITIATIVE_BASE
+
+
+ROUND_TICKS = 1000
+
+HASTE_RATE = 1.5
+SLOW_RATE = 2 / 3
+
+
+def initiative(c) -> int:
+    """How quickly a combatant gets its turns: enemies use template speed, players dexterity."""
+    return INITIATIVE_BASE + c.speed
+
+
+class InitiativeScheduler:
+    """
+    Priority queue of who acts next, in integer time ticks.
+
+    Each actor waits ROUND_TICKS * reference / initiative ticks between
+    actions, so an actor whose initiative equals the reference (normally
+    the slowest in the fight) acts exactly once per round and faster ones
+    sometimes twice. Ties go to higher initiative, then higher dexterity,
+    then whoever joined first.
+
+    Entries are never searched for: remove() and set_rate() bump the
+    actor's version and any older heap entry is skipped when popped,
+    so every operation is O(log N).
+    """
+
+    def __init__(self, reference: int):
+        self.reference = reference
+        self.now = 0
+        self._heap: list[list] = []
+        self._seq = count()
+        self._interval: dict[Hashable, int] = {}
+        self._rate: dict[Hashable, float] = {}
+        self._order: dict[Hashable, tuple[int, int]] = {}
+        self._version: dict[Hashable, int] = {}
+        self._pending: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._version)
+
+    def __contains__(self, actor: Hashable) -> bool:
+        return actor in self._version
+
+    def add(self, actor: Hashable, initiative: int, dexterity: int = 0, at: int | None = None):
+        """Queue an actor. By default it acts at the current time (ordered by initiative)."""
+        self._interval[actor] = max(1, ROUND_TICKS * self.reference // max(1, initiative))
+        self._rate[actor] = 1.0
+        self._order[actor] = (-initiative, -dexterity)
+        self._version[actor] = self._version.get(actor, 0) + 1
+        self._push(actor, self.now if at is None else at)
+
+    def remove(self, actor: Hashable):
+        """Drop an actor (e.g. it died). Its queued entry is discarded lazily."""
+        self._version.pop(actor, None)
+        self._pending.pop(actor, None)
+        self._rate.pop(actor, None)
+
+    def peek_time(self) -> int | None:
+        """Time of the next action, or None if nobody is queued."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot for saving: the clock plus one row per queued actor
+        [actor, interval, rate, initiative order, dexterity order, next time],
+        listed in queue order so ties still break the same way after a reload.
+        """
+        live = sorted((e for e in self._heap if self._version.get(e[-1]) == e[4]),
+                      key=lambda e: e[3])
+        return {
+            "reference": self.reference,
+            "now": self.now,
+            "actors": [[e[-1], self._interval[e[-1]], self._rate[e[-1]], e[1], e[2], e[0]]
+                       for e in live],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "InitiativeScheduler":
+        scheduler = cls(data["reference"])
+        scheduler.now = data["now"]
+        for actor, interval, rate, primary, secondary, time in data["actors"]:
+            scheduler._interval[actor] = interval
+            scheduler._rate[actor] = rate
+            scheduler._order[actor] = (primary, secondary)
+            scheduler._version[actor] = 1
+            scheduler._push(actor, time)
+        return scheduler
+
+    def next_time(self, actor: Hashable) -> int | None:
+        """When the actor is next due to act, or None if it is not queued."""
+        return self._pending.get(actor)
+
+    def pop(self) -> Hashable:
+        """Take the next actor and queue its following action."""
+        self._drop_stale()
+        entry = heapq.heappop(self._heap)
+        time, actor = entry[0], entry[-1]
+        self.now = time
+        self._push(actor, time + int(self._interval[actor] / self._rate[actor]))
+        return actor
+
+    def set_rate(self, actor: Hashable, rate: float):
+        """
+        Change an actor's speed multiplier (haste > 1, slow < 1).
+        The wait until its next action is rescaled right away.
+        """
+        old = self._rate.get(actor)
+        if old is None or old == rate:
+            return
+        self._rate[actor] = rate
+        wait = self._pending[actor] - self.now
+        self._version[actor] += 1
+        self._push(actor, self.now + int(wait * old / rate))
+
+    def _push(self, actor: Hashable, time: int):
+        self._pending[actor] = time
+        primary, secondary = self._order[actor]
+        heapq.heappush(self._heap, [time, primary, secondary, next(self._seq),
+                                    self._version[actor], actor])
+
+    def _drop_stale(self):
+        heap, version = self._heap, self._version
+        while heap and version.get(heap[0][-1]) != heap[0][4]:
+            heapq.heappop(heap)
@@ -313,7 +313,7 @@ class QuestManager:
             return []
         messages = []
         if quest.reward_gold > 0:
-            player.earn_gold(quest.reward_gold)
+            player.earn_gold(quest.reward_gold, "quest")
         if quest.reward_xp > 0:
             msgs = player.gain_xp(quest.reward_xp)
             messages += msgs
@@ -7,7 +7,7 @@ from utils.display import (
 )
 
 
-def generate_shop_stock(floor: int) -> list[str]:
+def generate_shop_stock(floor: int, rng=random) -> list[str]:
     """
     Generate a list of item keys for the shop based on current floor.
     Stock improves with floor progress.
@@ -15,7 +15,7 @@ def generate_shop_stock(floor: int) -> list[str]:
     stock = []
 
     potions = list(POTIONS.keys())
-    stock += random.sample(potions, min(3, len(potions)))
+    stock += rng.sample(potions, min(3, len(potions)))
 
     if floor <= 3:
         rarity_pool = ["common"]
@@ -26,16 +26,16 @@ def generate_shop_stock(floor: int) -> list[str]:
 
     weapon_pool = [k for k, v in WEAPONS.items() if v.rarity in rarity_pool]
     if weapon_pool:
-        stock += random.sample(weapon_pool, min(2, len(weapon_pool)))
+        stock += rng.sample(weapon_pool, min(2, len(weapon_pool)))
 
     armor_pool = [k for k, v in ARMORS.items() if v.rarity in rarity_pool]
     if armor_pool:
-        stock += random.sample(armor_pool, min(2, len(armor_pool)))
+        stock += rng.sample(armor_pool, min(2, len(armor_pool)))
 
-    if floor >= 5 and random.random() < 0.4:
+    if floor >= 5 and rng.random() < 0.4:
         rare_pool = [k for k, v in ALL_ITEMS.items() if v.rarity in ("rare", "legendary")]
         if rare_pool:
-            stock.append(random.choice(rare_pool))
+            stock.append(rng.choice(rare_pool))
 
     return list(dict.fromkeys(stock))
 
@@ -49,14 +49,14 @@ def show_shop(player) -> None:
     """Display the permanent shop between floors."""
 
     if not player.shop_stock or refresh_needed(player):
-        player.shop_stock = generate_shop_stock(player.dungeon_floor)
+        player.shop_stock = generate_shop_stock(player.dungeon_floor, player.rng.shop)
         player.shop_last_refresh = player.dungeon_floor
         print_message(t("shop_refreshed"), "system")
 
     while True:
         _draw_shop(player)
-        options = ["Comprar", "Vender", "Salir de la tienda"]
-        choice = prompt_choice(options, "¿Qué hacés?")
+        options = [t("shop_buy"), t("shop_sell"), t("shop_exit")]
+        choice = prompt_choice(options, t("shop_prompt"))
 
         if choice == 0:
             _buy(player)
@@ -94,7 +94,7 @@ def _draw_shop(player) -> None:
             item = ALL_ITEMS.get(key)
             if not item:
                 continue
-            price = _buy_price(item)
+            price = buy_price(item)
             rarity_color = rarity_colors.get(item.rarity, Color.WHITE)
             name_str  = clr(f"{item.name}", rarity_color)
             price_str = clr(f"{price}gp", Color.YELLOW)
@@ -127,7 +127,7 @@ def _buy(player) -> None:
 
     print()
     for i, item in enumerate(stock_items, 1):
-        price = _buy_price(item)
+        price = buy_price(item)
         rarity_colors = {"common": Color.WHITE, "uncommon": Color.GREEN,
                          "rare": Color.CYAN, "legendary": Color.YELLOW}
         name_str  = clr(item.name, rarity_colors.get(item.rarity, Color.WHITE))
@@ -146,7 +146,7 @@ def _buy(player) -> None:
         print(f"     {clr(item_desc(item)[:55], Color.GREY)}{stat_str}")
     print()
 
-    options = [f"{item.name}  ({_buy_price(item)}gp)" for item in stock_items]
+    options = [f"{item.name}  ({buy_price(item)}gp)" for item in stock_items]
     options.append(t("shop_cancel"))
     choice = prompt_choice(options, t("shop_buy_prompt"))
 
@@ -154,9 +154,9 @@ def _buy(player) -> None:
         return
 
     item  = stock_items[choice]
-    price = _buy_price(item)
+    price = buy_price(item)
 
-    if not player.spend_gold(price):
+    if not player.spend_gold(price, "shop_buy"):
         print_message(t("shop_no_gold"), "warning")
         press_enter()
         return
@@ -167,7 +167,7 @@ def _buy(player) -> None:
             player.shop_stock.remove(item.key)
         print_message(t("shop_bought", item=clr(item.name, Color.CYAN)), "good")
     else:
-        player.earn_gold(price)
+        player.earn_gold(price, "shop_buy")
         print_message(t("shop_inventory_full"), "warning")
 
     press_enter()
@@ -180,7 +180,7 @@ def _sell(player) -> None:
         press_enter()
         return
 
-    options = [f"{item.name}  ({_sell_price(item)}gp)" for item in player.inventory]
+    options = [f"{item.name}  ({sell_price(item)}gp)" for item in player.inventory]
     options.append(t("shop_cancel"))
     choice = prompt_choice(options, t("shop_sell_prompt"))
 
@@ -188,18 +188,18 @@ def _sell(player) -> None:
         return
 
     item  = player.inventory[choice]
-    price = _sell_price(item)
+    price = sell_price(item)
     player.remove_from_inventory(item)
-    player.earn_gold(price)
+    player.earn_gold(price, "shop_sell")
     print_message(t("shop_sold", item=item.name, price=clr(str(price), Color.YELLOW)), "good")
     press_enter()
 
 
-def _buy_price(item: Item) -> int:
+def buy_price(item: Item) -> int:
     """Shop buy price = item value * 1.5, rounded."""
     return max(1, int(item.value * 1.5))
 
 
-def _sell_price(item: Item) -> int:
+def sell_price(item: Item) -> int:
     """Sell price = item value * 0.6."""
     return max(1, int(item.value * 0.6))
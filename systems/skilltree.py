@@ -24,6 +24,8 @@ class SkillNode:
     effect: str = ""
     cooldown: int = 0
     tier: int = 2
+    hits: int = 0
+    armor_ignored: float = 1.0
 
 
 ALL_SKILLS: dict[str, SkillNode] = {}
@@ -102,12 +104,12 @@ _s(SkillNode("arquero_lluvia", "arquero",
     "Lluvia de Flechas", "Lanza 5 flechas simultáneas con daño total masivo.",
     "narr_skill_arquero_rafaga",
     level_required=4, prerequisite=None, mp_cost=12,
-    damage_base=8, damage_scale=1.2, stat_used="dex", effect="multi", tier=2))
+    damage_base=8, damage_scale=1.2, stat_used="dex", effect="multi", hits=5, tier=2))
 
 _s(SkillNode("arquero_ojo", "arquero",
     "Ojo de Águila", "El próximo ataque es un crítico garantizado.",
     "narr_skill_arquero_precision",
-    level_required=7, prerequisite="arquero_lluvia", mp_cost=8, effect="guaranteed_crit", tier=2))
+    level_required=7, prerequisite="arquero_lluvia", mp_cost=8, effect="aimed_shot", tier=2))
 
 _s(SkillNode("arquero_flecha_muerte", "arquero",
     "Flecha de la Muerte", "Una flecha que ignora completamente la armadura del enemigo.",
@@ -140,13 +142,13 @@ _s(SkillNode("monje_chakra", "monje",
     "Golpe de Chakra", "Golpe de energía pura que ignora la mitad de la defensa enemiga.",
     "narr_skill_monje_vuelo",
     level_required=7, prerequisite="monje_meditacion", mp_cost=14,
-    damage_base=25, damage_scale=1.8, stat_used="wis", effect="armor_pierce", tier=2))
+    damage_base=25, damage_scale=1.8, stat_used="wis", effect="armor_pierce", armor_ignored=0.5, tier=2))
 
 _s(SkillNode("monje_tormenta", "monje",
     "Tormenta de Golpes", "Ataca 8 veces seguidas. Cada golpe hace poco daño pero juntos devastan.",
     "narr_skill_monje_eco",
     level_required=13, prerequisite="monje_chakra", mp_cost=22,
-    damage_base=6, damage_scale=1.0, stat_used="dex", effect="multi", cooldown=2, tier=3))
+    damage_base=6, damage_scale=1.0, stat_used="dex", effect="multi", hits=8, cooldown=2, tier=3))
 
 _s(SkillNode("explorador_sigilo", "explorador",
     "Ataque desde las Sombras", "Desaparece y ataca desde la oscuridad con daño doble.",
@@ -234,6 +236,8 @@ def skill_to_ability(skill: SkillNode):
         heal_amount=skill.heal_amount,
         effect=skill.effect,
         cooldown=skill.cooldown,
+        hits=skill.hits,
+        armor_ignored=skill.armor_ignored,
     )
 
 
@@ -0,0 +1,138 @@
+import struct
+from typing import BinaryIO, Iterator, NamedTuple
+
+from entities.character import STATUS_IDS, STATUS_NAMES
+
+
+ACTION_KINDS = (
+    "tick", "attack", "ability", "ability_failed", "effect",
+    "drain", "potion", "flee", "stunned", "hit",
+)
+_ACTION_IDS = {kind: i for i, kind in enumerate(ACTION_KINDS)}
+# player = 0, then one id per pack slot ("enemy" = 1, "enemy1" = 2, ...)
+_ACTOR_IDS = {"player": 0, "enemy": 1, **{f"enemy{i}": i + 1 for i in range(1, 16)}}
+_ACTOR_NAMES = {i: side for side, i in _ACTOR_IDS.items()}
+
+# fight, turn, actor, action, damage, critical, applied mask, expired mask
+_RECORD = struct.Struct("<IHBBiBII")
+_HEADER = struct.Struct("<4sHHI")
+_MAGIC = b"AETR"
+_VERSION = 1
+
+
+class TranscriptRecord(NamedTuple):
+    fight: int
+    turn: int
+    actor: int
+    action: int
+    damage: int
+    critical: int
+    applied: int
+    expired: int
+
+    @property
+    def actor_name(self) -> str:
+        return _ACTOR_NAMES.get(self.actor, "?")
+
+    @property
+    def action_name(self) -> str:
+        return ACTION_KINDS[self.action]
+
+    @property
+    def applied_names(self) -> list[str]:
+        return _mask_names(self.applied)
+
+    @property
+    def expired_names(self) -> list[str]:
+        return _mask_names(self.expired)
+
+
+class Transcript:
+    """
+    Fixed-size ring buffer of compact combat records, packed into one bytearray.
+    Once full, the oldest records are overwritten.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * _RECORD.size)
+        self.head = 0
+        self.count = 0
+        self.fight = 0
+
+    def begin_fight(self):
+        """Start numbering records for a new fight."""
+        self.fight += 1
+
+    def record(self, turn: int, actor: int, action: int, damage: int = 0,
+               critical: bool = False, applied: int = 0, expired: int = 0):
+        _RECORD.pack_into(self.buffer, self.head * _RECORD.size,
+                          self.fight, turn, actor, action, damage, critical, applied, expired)
+        self.head += 1
+        if self.head == self.capacity:
+            self.head = 0
+        if self.count < self.capacity:
+            self.count += 1
+
+    def record_event(self, ev):
+        """Pack a CombatEvent into a record."""
+        kind = ev.kind
+        damage = ev.amount
+        applied = expired = 0
+        if kind == "tick":
+            damage = 0
+            for name, dmg, done in ev.data:
+                damage += dmg
+                if done:
+                    expired |= 1 << STATUS_IDS[name]
+        elif kind == "effect" and ev.data:
+            applied = 1 << STATUS_IDS[ev.data]
+        elif kind == "drain":
+            damage = ev.healed
+        self.record(ev.turn, _ACTOR_IDS.get(ev.actor, 255), _ACTION_IDS[kind],
+                    damage, ev.critical, applied, expired)
+
+    def to_bytes(self) -> bytes:
+        """Header plus records, oldest first."""
+        size = _RECORD.size
+        if self.count < self.capacity:
+            body = self.buffer[:self.count * size]
+        else:
+            split = self.head * size
+            body = self.buffer[split:] + self.buffer[:split]
+        return _HEADER.pack(_MAGIC, _VERSION, size, self.count) + bytes(body)
+
+    def dump(self, f: BinaryIO):
+        f.write(self.to_bytes())
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            self.dump(f)
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+
+def decode_transcript(data: bytes) -> Iterator[TranscriptRecord]:
+    """Yield the records stored in a dumped transcript."""
+    magic, version, size, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION or size != _RECORD.size:
+        raise ValueError("Not a transcript file, or written by an incompatible version.")
+    body = memoryview(data)[_HEADER.size:_HEADER.size + count * size]
+    for fields in _RECORD.iter_unpack(body):
+        yield TranscriptRecord._make(fields)
+
+
+def load_transcript(path: str) -> list[TranscriptRecord]:
+    with open(path, "rb") as f:
+        return list(decode_transcript(f.read()))
+
+
+def _mask_names(mask: int) -> list[str]:
+    names = []
+    while mask:
+        low = mask & -mask
+        mask ^= low
+        names.append(STATUS_NAMES[low.bit_length() - 1])
+    return names
@@ -20,6 +20,24 @@ try:
 except (UnicodeEncodeError, TypeError):
     DRAW = BOX_THIN
 
+_autopilot = None
+
+
+def use_autopilot(pilot):
+    """
+    Hand the keyboard to a scripted player, or give it back with None.
+    While a pilot is set, prompt_choice returns pilot.choose(prompt, options),
+    fights ask pilot.policy(player, enemy) for each action, nothing waits
+    for ENTER or sleeps, and save_game does not touch the save file.
+    """
+    global _autopilot
+    _autopilot = pilot
+
+
+def active_autopilot():
+    return _autopilot
+
+
 TITLE_ART = r"""
   ____  _   _ _   _  ____ _____ ___  _   _ ____
  |  _ \| | | | \ | |/ ___| ____/ _ \| \ | / ___|
@@ -146,11 +164,13 @@ def print_message(text: str, style: str = "normal", delay: float = 0.0):
     }
     prefix = prefixes.get(style, "")
     print(f"{prefix}{text}")
-    if delay:
-        time.sleep(delay)
+    pause(delay)
 
 def typewriter(text: str, speed: float = 0.018):
     """Print text character by character for dramatic effect."""
+    if _autopilot is not None:
+        print(text)
+        return
     for char in text:
         sys.stdout.write(char)
         sys.stdout.flush()
@@ -164,7 +184,13 @@ def clear_screen():
 def press_enter(prompt: str = "  [ Presioná ENTER para continuar ]"):
     print()
     print(clr(prompt, Color.GREY))
-    input()
+    if _autopilot is None:
+        input()
+
+def pause(seconds: float):
+    """Dramatic pause; skipped while an autopilot is playing."""
+    if seconds and _autopilot is None:
+        time.sleep(seconds)
 
 def prompt_input(question: str) -> str:
     """Styled input prompt."""
@@ -180,6 +206,8 @@ def prompt_choice(options: list, prompt: str = "Tu eleccion") -> int:
     for i, option in enumerate(options, 1):
         print(f"  {clr(str(i), Color.YELLOW)}.  {option}")
     print()
+    if _autopilot is not None:
+        return _autopilot.choose(prompt, options)
     while True:
         raw = input(clr(f"  > {prompt} [1-{len(options)}]: ", Color.CYAN)).strip()
         if raw.isdigit():
@@ -130,6 +130,10 @@ _ES = {
     "combat_evade_ability":     "¡Evasión exitosa! La habilidad pasó sin tocarte. De nada.",
     "combat_stunned":           "El {enemy} está aturdido y pierde el turno. ¡Aprovechá!",
     "combat_slain_by":          "  Te liquidó: {enemy}",
+    "combat_pack":              "¡Son {n}! Vienen en manada. Ojo con la espalda.",
+    "combat_choose_target":     "¿A quién le pegás?",
+    "combat_fallen":            "caído",
+    "combat_win_chance":        "Chances estimadas de ganar: {pct}",
     "combat_level_reached":     "  Nivel que llegaste: {level}",
     "combat_kills":             "  Enemigos eliminados: {kills}",
     "combat_gold_grave":        "  Oro que llevabas: {gold} gp. Ahora es de la mazmorra.",
@@ -391,10 +395,17 @@ _ES = {
     "room_desc_boss": "Al final de un pasillo largo, unas puertas enormes están entreabiertas. Algo respira del otro lado.",
 
     "combat_start":         "  [ El combate comienza... ]",
+    "combat_resumed":       "  Retomas el combate contra {enemy}.",
     "combat_turn":          "Turno",
     "combat_your_action":   "Tu turno",
     "combat_enter_combat":  "Entrar en combate",
     "combat_check_inv":     "Ver inventario primero",
+    "combat_auto":          "Resolver automáticamente",
+    "combat_auto_title":    "COMBATE RESUELTO",
+    "combat_auto_turns":    "Turnos: {turns}",
+    "combat_auto_damage":   "Daño recibido: {damage}  |  Pociones usadas: {potions}",
+    "combat_auto_rewards":  "XP: +{xp}  |  Oro: +{gold}",
+    "combat_auto_no_loot":  "Sin botín. Otra vez será.",
     "combat_ability_prompt":"Habilidad",
     "combat_use_potion":    "Usar pocion",
     "combat_cancel":        "-- Cancelar --",
@@ -674,6 +685,10 @@ _EN = {
     "combat_evade_ability":     "Your evasion saves you from the ability!",
     "combat_stunned":           "{enemy} is stunned and loses their turn!",
     "combat_slain_by":          "  Slain by: {enemy}",
+    "combat_pack":              "There are {n} of them! A whole pack. Watch your back.",
+    "combat_choose_target":     "Choose your target",
+    "combat_fallen":            "fallen",
+    "combat_win_chance":        "Estimated chance to win: {pct}",
     "combat_level_reached":     "  Level reached: {level}",
     "combat_kills":             "  Enemies slain: {kills}",
     "combat_gold_grave":        "  Gold carried to the grave: {gold} gp",
@@ -935,10 +950,17 @@ _EN = {
     "room_desc_boss": "At the end of a long corridor, enormous doors stand ajar. Something breathes on the other side.",
 
     "combat_start":         "  [ Combat begins... ]",
+    "combat_resumed":       "  You pick the fight back up against {enemy}.",
     "combat_turn":          "Turn",
     "combat_your_action":   "Your turn",
     "combat_enter_combat":  "Enter combat",
     "combat_check_inv":     "Check inventory first",
+    "combat_auto":          "Auto-resolve",
+    "combat_auto_title":    "COMBAT RESOLVED",
+    "combat_auto_turns":    "Turns: {turns}",
+    "combat_auto_damage":   "Damage taken: {damage}  |  Potions used: {potions}",
+    "combat_auto_rewards":  "XP: +{xp}  |  Gold: +{gold}",
+    "combat_auto_no_loot":  "No loot this time.",
     "combat_ability_prompt":"Ability",
     "combat_use_potion":    "Use potion",
     "combat_cancel":        "-- Cancel --",
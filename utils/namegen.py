@@ -37,40 +37,40 @@ _SUST_SALA = {
 }
 
 
-def generate_dungeon_name() -> str:
+def generate_dungeon_name(rng=random) -> str:
     """
     Genera un nombre unico para toda la mazmorra.
     Ejemplo: "The Sunken Vaults of Kharoria"
     """
-    prefix = random.choice(_PREFIJOS)
-    root   = random.choice(_RAICES)
-    suffix = random.choice(_SUFIJOS_DUNGEON)
-    adj    = random.choice(_ADJ_SALA)
+    prefix = rng.choice(_PREFIJOS)
+    root   = rng.choice(_RAICES)
+    suffix = rng.choice(_SUFIJOS_DUNGEON)
+    adj    = rng.choice(_ADJ_SALA)
     return f"The {adj} {suffix} of {prefix}{root}"
 
 
-def generate_floor_name(floor: int) -> str:
+def generate_floor_name(floor: int, rng=random) -> str:
     """
     Genera un nombre para un piso especifico.
     Ejemplo: "The Ashen Halls — Floor 3"
     """
-    adj    = random.choice(_ADJ_SALA)
-    suffix = random.choice(_SUFIJOS_DUNGEON)
+    adj    = rng.choice(_ADJ_SALA)
+    suffix = rng.choice(_SUFIJOS_DUNGEON)
     return f"The {adj} {suffix}"
 
 
-def generate_room_name(room_type: str) -> str:
+def generate_room_name(room_type: str, rng=random) -> str:
     """
     Genera un nombre para una sala segun su tipo.
     Ejemplo: "The Rotting Chamber", "The Cursed Vault"
     """
-    adj   = random.choice(_ADJ_SALA)
+    adj   = rng.choice(_ADJ_SALA)
     nouns = _SUST_SALA.get(room_type, ["Chamber"])
-    noun  = random.choice(nouns)
+    noun  = rng.choice(nouns)
     return f"The {adj} {noun}"
 
 
-def generate_enemy_title(enemy_name: str) -> str:
+def generate_enemy_title(enemy_name: str, rng=random) -> str:
     """
     Agrega un titulo aleatorio a un enemigo para variedad.
     Ejemplo: "Goblin Scout, the Wretched"
@@ -80,4 +80,4 @@ def generate_enemy_title(enemy_name: str) -> str:
         "the Hollow", "the Relentless", "the Damned", "the Forsaken",
         "the Wretched", "the Twisted", "the Undying", "the Hateful",
     ]
-    return f"{enemy_name}, {random.choice(titles)}"
+    return f"{enemy_name}, {rng.choice(titles)}"
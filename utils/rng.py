@@ -0,0 +1,69 @@
+import base64
+import hashlib
+import random
+import secrets
+from array import array
+
+
+STREAMS = ("combat", "floor", "loot", "shop", "names", "events")
+
+
+def new_run_seed() -> int:
+    """Pick a fresh 63-bit seed for a new run."""
+    return secrets.randbits(63)
+
+
+def derive_seed(run_seed: int, stream: str, floor: int = 0) -> int:
+    """
+    Stable per-stream seed. Uses blake2b rather than hash() so the same
+    run seed gives the same streams in every process.
+    """
+    key = f"{run_seed}:{stream}:{floor}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class RunRNG:
+    """
+    One independent random.Random per subsystem, all derived from a single run seed.
+
+    Streams are plain random.Random attributes (rng.combat.randint(...)), so a
+    draw costs exactly what the global random module costs. begin_floor()
+    reseeds every stream from (run_seed, floor): a floor plays out the same
+    whether it was reached in one sitting or from a save, and one subsystem
+    drawing more numbers never shifts another.
+    """
+
+    def __init__(self, run_seed: int | None = None):
+        self.run_seed = new_run_seed() if run_seed is None else run_seed
+        self.floor_number = 0
+        self.combat = random.Random()
+        self.floor = random.Random()
+        self.loot = random.Random()
+        self.shop = random.Random()
+        self.names = random.Random()
+        self.events = random.Random()
+        self.begin_floor(0)
+
+    def begin_floor(self, floor: int):
+        """Reseed every stream for the given dungeon floor."""
+        self.floor_number = floor
+        for name in STREAMS:
+            getattr(self, name).seed(derive_seed(self.run_seed, name, floor))
+
+    def stream(self, name: str) -> random.Random:
+        return getattr(self, name)
+
+
+def dump_state(r: random.Random) -> str:
+    """
+    Compact text form of a stream's position: base64 of the 625
+    Mersenne Twister words. gauss() is never used, so its cache is dropped.
+    """
+    return base64.b64encode(array("I", r.getstate()[1]).tobytes()).decode("ascii")
+
+
+def load_state(r: random.Random, data: str):
+    """Put a stream back where dump_state found it."""
+    words = array("I")
+    words.frombytes(base64.b64decode(data))
+    r.setstate((3, tuple(words), None))
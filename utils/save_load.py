@@ -1,6 +1,7 @@
 import json
 import os
 from config import SAVE_FILE, SAVE_DIR
+from utils.display import active_autopilot
 
 
 def ensure_save_dir():
@@ -12,7 +13,10 @@ def save_game(player_data: dict) -> bool:
     """
     Save the current game state to JSON.
     Returns True on success, False on failure.
+    A scripted run (utils.display.use_autopilot) never overwrites the real save.
     """
+    if active_autopilot() is not None:
+        return True
     ensure_save_dir()
     try:
         with open(SAVE_FILE, "w", encoding="utf-8") as f: